@@ -0,0 +1,27 @@
+"""
+Shared helpers for the benchmark scripts.
+
+    from _common import REPO_ROOT, load_populate_module
+
+Nothing here touches sys.path on import. Scripts that import repository
+modules directly insert REPO_ROOT themselves before those imports.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_populate_module():
+    """Import populate-skills.py (its file name is not a valid module name)."""
+    # populate-skills.py imports its sibling modules (skill_registry, ...)
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    spec = importlib.util.spec_from_file_location(
+        "populate_skills", REPO_ROOT / "populate-skills.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
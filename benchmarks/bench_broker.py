@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Benchmark sdlc_broker: message throughput and latency.
+
+Producers send protocol messages (as dicts, so every message is validated)
+to consumer agents while consumers drain their mailboxes; latency is
+measured from send to receive. A request/response run measures round
+trips correlated on task_id. The socket transport runs the same workloads
+through a BrokerServer on a temporary Unix socket (server and clients
+share one event loop, so it measures the framing and socket overhead).
+Notification latencies are measured at saturation, so they mostly reflect
+time spent queued in full mailboxes.
+
+Usage:
+    python3 benchmarks/bench_broker.py --messages 100000 --transport both
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from _common import REPO_ROOT
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from sdlc_broker import PRIORITIES, Broker, BrokerClient, BrokerServer, Message  # noqa: E402
+
+PRODUCERS = ('orchestrator', 'requirements', 'architecture', 'design', 'test-manager')
+CONSUMERS = ('developer', 'security', 'devops', 'documentation', 'operations')
+PRIORITY_NAMES = list(PRIORITIES)
+
+
+def make_message(n: int) -> dict:
+    return {
+        'from': PRODUCERS[n % len(PRODUCERS)],
+        'to': CONSUMERS[n % len(CONSUMERS)],
+        'type': 'notification',
+        'priority': PRIORITY_NAMES[n % len(PRIORITY_NAMES)],
+        'payload': {'seq': n, 'sent': time.perf_counter()},
+        'context': {'task_id': f"T-{n}", 'phase': 'implementation'},
+    }
+
+
+def summarize(name: str, count: int, elapsed: float, latencies) -> dict:
+    latencies = sorted(latencies)
+    return {
+        'name': name,
+        'messages': count,
+        'per_sec': count / elapsed,
+        'p50_ms': latencies[len(latencies) // 2] * 1e3,
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1e3,
+        'mean_ms': statistics.fmean(latencies) * 1e3,
+    }
+
+
+async def bench_inproc(messages: int, mailbox_size: int) -> dict:
+    broker = Broker(mailbox_size=mailbox_size)
+    per_consumer = messages // len(CONSUMERS)
+    messages = per_consumer * len(CONSUMERS)
+    latencies = []
+
+    async def consume(agent_id):
+        mailbox = broker.register(agent_id)
+        for _ in range(per_consumer):
+            message = await mailbox.receive()
+            latencies.append(time.perf_counter() - message.payload['sent'])
+
+    async def produce(offset):
+        for n in range(offset, messages, len(PRODUCERS)):
+            await broker.send(make_message(n))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(consume(agent) for agent in CONSUMERS),
+                         *(produce(i) for i in range(len(PRODUCERS))))
+    return summarize('in-process notify', messages, time.perf_counter() - start, latencies)
+
+
+async def bench_inproc_requests(requests: int, concurrency: int) -> dict:
+    broker = Broker()
+    mailbox = broker.register('developer')
+    latencies = []
+
+    async def serve():
+        async for message in mailbox:
+            await broker.reply(message, {'ok': True})
+
+    async def requester(worker):
+        for n in range(worker, requests, concurrency):
+            start = time.perf_counter()
+            await broker.request(Message('orchestrator', 'developer', 'request', 'high',
+                                         {'n': n}, {'task_id': f"T-{n}"}))
+            latencies.append(time.perf_counter() - start)
+
+    server = asyncio.ensure_future(serve())
+    start = time.perf_counter()
+    await asyncio.gather(*(requester(w) for w in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    server.cancel()
+    return summarize('in-process request', requests, elapsed, latencies)
+
+
+async def bench_socket(messages: int, mailbox_size: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix='bench-broker-') as tmp:
+        server = BrokerServer(Broker(mailbox_size=mailbox_size), os.path.join(tmp, 'broker.sock'))
+        await server.start()
+        per_consumer = messages // len(CONSUMERS)
+        messages = per_consumer * len(CONSUMERS)
+        consumers = [await BrokerClient.connect(server.path, agent) for agent in CONSUMERS]
+        producers = [await BrokerClient.connect(server.path) for _ in PRODUCERS]
+        latencies = []
+
+        async def consume(client):
+            for _ in range(per_consumer):
+                message = await client.receive()
+                latencies.append(time.perf_counter() - message.payload['sent'])
+
+        async def produce(client, offset):
+            for n in range(offset, messages, len(PRODUCERS)):
+                # Drain every 64 frames to bound the client's write buffer
+                await client.send(make_message(n), drain=n % 64 < len(PRODUCERS))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(consume(c) for c in consumers),
+                             *(produce(p, i) for i, p in enumerate(producers)))
+        elapsed = time.perf_counter() - start
+        for client in consumers + producers:
+            await client.close()
+        await server.close()
+    return summarize('unix socket notify', messages, elapsed, latencies)
+
+
+async def bench_socket_requests(requests: int, concurrency: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix='bench-broker-') as tmp:
+        server = BrokerServer(Broker(), os.path.join(tmp, 'broker.sock'))
+        await server.start()
+        developer = await BrokerClient.connect(server.path, 'developer')
+        orchestrator = await BrokerClient.connect(server.path, 'orchestrator')
+        latencies = []
+
+        async def serve():
+            while True:
+                await developer.reply(await developer.receive(), {'ok': True})
+
+        async def requester(worker):
+            for n in range(worker, requests, concurrency):
+                start = time.perf_counter()
+                await orchestrator.request(Message('orchestrator', 'developer', 'request', 'high',
+                                                   {'n': n}, {'task_id': f"T-{n}"}))
+                latencies.append(time.perf_counter() - start)
+
+        responder = asyncio.ensure_future(serve())
+        start = time.perf_counter()
+        await asyncio.gather(*(requester(w) for w in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        responder.cancel()
+        for client in (developer, orchestrator):
+            await client.close()
+        await server.close()
+    return summarize('unix socket request', requests, elapsed, latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the agent message broker')
+    parser.add_argument('--messages', type=int, default=100000, help='Notifications to send')
+    parser.add_argument('--requests', type=int, default=20000, help='Request/response round trips')
+    parser.add_argument('--concurrency', type=int, default=32, help='Concurrent requesters')
+    parser.add_argument('--mailbox-size', type=int, default=1000, help='Mailbox bound per agent')
+    parser.add_argument('--transport', choices=('inproc', 'socket', 'both'), default='both')
+    args = parser.parse_args()
+
+    results = []
+    if args.transport in ('inproc', 'both'):
+        results.append(asyncio.run(bench_inproc(args.messages, args.mailbox_size)))
+        results.append(asyncio.run(bench_inproc_requests(args.requests, args.concurrency)))
+    if args.transport in ('socket', 'both'):
+        results.append(asyncio.run(bench_socket(args.messages, args.mailbox_size)))
+        results.append(asyncio.run(bench_socket_requests(args.requests, args.concurrency)))
+
+    print(f"{'workload':<20} {'messages':>9} {'msgs/s':>10} {'p50 (ms)':>9} {'p99 (ms)':>9} {'mean (ms)':>10}")
+    for r in results:
+        print(f"{r['name']:<20} {r['messages']:>9,} {r['per_sec']:>10,.0f} {r['p50_ms']:>9.3f} "
+              f"{r['p99_ms']:>9.3f} {r['mean_ms']:>10.3f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
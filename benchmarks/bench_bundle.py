@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark agent skill loading: directory walk vs. skill bundle.
+
+The directory walk mirrors what agents do today: find skills/**/SKILL.md,
+read every file and parse its frontmatter. The bundle variants open
+.skills.bundle once and read the pre-parsed frontmatter index, optionally
+slicing out a single skill's text.
+
+Usage:
+    python3 benchmarks/bench_bundle.py --content-dir . --repeat 50
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from _common import REPO_ROOT, load_populate_module
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from skill_bundle import BUNDLE_FILENAME, SkillBundle, parse_frontmatter  # noqa: E402
+
+
+def load_by_walk(skills_dir: str) -> int:
+    """Walk the tree, read every SKILL.md and parse its frontmatter."""
+    count = 0
+    for root, _, files in os.walk(skills_dir):
+        if 'SKILL.md' in files:
+            with open(os.path.join(root, 'SKILL.md'), 'r', encoding='utf-8') as f:
+                parse_frontmatter(f.read())
+            count += 1
+    return count
+
+
+def load_by_bundle(bundle_path: str) -> int:
+    """Open the bundle and touch every skill's pre-parsed frontmatter."""
+    with SkillBundle(bundle_path) as bundle:
+        for skill_id in bundle.skill_ids():
+            bundle.frontmatter(skill_id)
+        return len(bundle)
+
+
+def load_one_from_bundle(bundle_path: str) -> int:
+    """Open the bundle and read a single skill's full text."""
+    with SkillBundle(bundle_path) as bundle:
+        bundle.text(bundle.skill_ids()[0])
+        return 1
+
+
+def best_of(repeat: int, func, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark bundle vs. directory-walk skill loading')
+    parser.add_argument('--content-dir', default=str(REPO_ROOT),
+                        help='Directory containing the content library')
+    parser.add_argument('--repeat', type=int, default=50,
+                        help='Runs per strategy (best time is reported)')
+    args = parser.parse_args()
+
+    populate = load_populate_module()
+
+    with tempfile.TemporaryDirectory(prefix="bench-bundle-") as skills_dir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            skills_content, registry = populate.load_content_library(args.content_dir)
+            populate.populate_batch(
+                skills_content, registry,
+                [populate.PopulateTarget(populate.DEFAULT_PROJECT, skills_dir, {})],
+                durable=False, bundle=True,
+            )
+        bundle_path = os.path.join(skills_dir, BUNDLE_FILENAME)
+
+        walk = best_of(args.repeat, load_by_walk, skills_dir)
+        bundled = best_of(args.repeat, load_by_bundle, bundle_path)
+        single = best_of(args.repeat, load_one_from_bundle, bundle_path)
+
+    print(f"{'strategy':<28} {'best (ms)':>10} {'vs walk':>9}")
+    for label, seconds in (("directory walk", walk),
+                           ("bundle (all frontmatter)", bundled),
+                           ("bundle (one skill)", single)):
+        print(f"{label:<28} {seconds * 1000:>10.3f} {walk / seconds:>8.1f}x")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
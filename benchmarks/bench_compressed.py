@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark compressed content libraries against the plain-text path.
+
+Writes one synthetic library (see bench_pipeline.py) as plain text, gzip,
+xz and, when a zstd module is available, zstd, then times parsing and an
+end-to-end populate_skill_files() run for each. Decompression happens
+while streaming, so the difference is decompression CPU traded against
+bytes read from disk (or shipped to build agents).
+
+Usage:
+    python3 benchmarks/bench_compressed.py --skills 10000 --repeat 3
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import lzma
+import os
+import sys
+import tempfile
+import time
+
+from _common import REPO_ROOT, load_populate_module
+from bench_pipeline import SYNTHETIC_LIBRARY, write_synthetic_library
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    try:
+        from compression import zstd
+        return zstd.compress(data)
+    except ImportError:
+        import zstandard
+        return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+CODECS = {
+    'plain': ('', lambda data: data),
+    'gzip': ('.gz', lambda data: gzip.compress(data, compresslevel=6)),
+    'xz': ('.xz', lambda data: lzma.compress(data, preset=6)),
+    'zstd': ('.zst', _zstd_compress),
+}
+
+
+def best_of(repeat: int, run) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark compressed content library input')
+    parser.add_argument('--content-dir', default=str(REPO_ROOT),
+                        help='Content library used as templates for synthetic skills')
+    parser.add_argument('--skills', type=int, default=10000, help='Skills in the synthetic library')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is reported)')
+    parser.add_argument('--no-fsync', action='store_true', help='Populate without syncing files to disk')
+    args = parser.parse_args()
+
+    populate = load_populate_module()
+    with tempfile.TemporaryDirectory(prefix='bench-compressed-') as tmp:
+        source = os.path.join(tmp, 'source')
+        os.mkdir(source)
+        library, _ = write_synthetic_library(populate, args.content_dir, source, args.skills)
+        data = library.read_bytes()
+
+        rows = []
+        runs = 0
+        for codec, (suffix, compress) in CODECS.items():
+            try:
+                packed = compress(data)
+            except ImportError:
+                print(f"Skipping {codec}: no zstd module (Python 3.14+ or pip install zstandard)",
+                      file=sys.stderr)
+                continue
+            content_dir = os.path.join(tmp, codec)
+            os.mkdir(content_dir)
+            with open(os.path.join(content_dir, SYNTHETIC_LIBRARY + suffix), 'wb') as f:
+                f.write(packed)
+
+            def populate_fresh_tree():
+                nonlocal runs
+                runs += 1
+                populate.populate_skill_files(content_dir, os.path.join(tmp, f"tree-{runs}"),
+                                              durable=not args.no_fsync)
+
+            parse = best_of(args.repeat, lambda: populate.parse_content_files(content_dir))
+            end_to_end = best_of(args.repeat, populate_fresh_tree)
+            rows.append((codec, len(packed), parse, end_to_end))
+
+    plain_parse, plain_total = rows[0][2], rows[0][3]
+    print(f"{args.skills} skills, {len(data) / 1e6:.1f} MB uncompressed\n")
+    print(f"{'codec':<6} {'size (MB)':>10} {'ratio':>6} {'parse (s)':>10} {'vs plain':>9} "
+          f"{'populate (s)':>13} {'vs plain':>9}")
+    for codec, size, parse, total in rows:
+        print(f"{codec:<6} {size / 1e6:>10.2f} {len(data) / size:>6.1f} {parse:>10.3f} "
+              f"{parse / plain_parse:>8.2f}x {total:>13.3f} {total / plain_total:>8.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
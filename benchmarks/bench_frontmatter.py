@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark frontmatter parsing: legacy if/elif chain vs. skill_frontmatter.
+
+Both variants parse every block of the content library the way
+render_skill_parts() does (metadata plus the body starting at the first
+heading). Throughput is reported in block lines per second.
+
+Usage:
+    python3 benchmarks/bench_frontmatter.py --content-dir . --repeat 20 --scale 10
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+from _common import REPO_ROOT, load_populate_module
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from skill_frontmatter import tokenize_frontmatter  # noqa: E402
+
+
+def legacy_parse(content: str):
+    """The per-line startswith chain render_skill_parts() used before the tokenizer."""
+    lines = content.split('\n')
+    metadata = {}
+    content_start = 0
+    in_collaboration_rules = False
+    collaboration_rules_lines = []
+
+    for i, line in enumerate(lines):
+        if in_collaboration_rules:
+            if line.strip().startswith('-') or line.strip().startswith(' '):
+                collaboration_rules_lines.append(line)
+                continue
+            else:
+                in_collaboration_rules = False
+                metadata['collaboration_rules'] = '\n'.join(collaboration_rules_lines)
+
+        if line.strip().startswith('name:'):
+            metadata['name'] = line.split(':', 1)[1].strip()
+        elif line.strip().startswith('description:'):
+            metadata['description'] = line.split(':', 1)[1].strip()
+        elif line.strip().startswith('skill_id:'):
+            metadata['skill_id'] = line.split(':', 1)[1].strip()
+        elif line.strip().startswith('owner:'):
+            metadata['owner'] = line.split(':', 1)[1].strip()
+        elif line.strip().startswith('agent:'):
+            metadata['owner'] = line.split(':', 1)[1].strip()
+        elif line.strip().startswith('collaborators:'):
+            metadata['collaborators'] = line.split(':', 1)[1].strip()
+        elif line.strip().startswith('collaboration_rules:'):
+            in_collaboration_rules = True
+            first_part = line.split(':', 1)[1].strip()
+            if first_part:
+                collaboration_rules_lines.append(first_part)
+        elif line.strip().startswith('when_to_use:'):
+            metadata['when_to_use'] = line.split(':', 1)[1].strip()
+        elif line.strip().startswith('dependencies:'):
+            metadata['dependencies'] = line.split(':', 1)[1].strip()
+        elif line.strip().startswith('#') or line.strip().startswith('## '):
+            content_start = i
+            break
+
+    return metadata, '\n'.join(lines[content_start:]).strip()
+
+
+def tokenizer_parse(content: str):
+    metadata, body_start = tokenize_frontmatter(content)
+    return metadata, content[body_start or 0:].strip()
+
+
+def best_of(repeat: int, func, contents) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in contents:
+            func(content)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark frontmatter parsing throughput')
+    parser.add_argument('--content-dir', default=str(REPO_ROOT),
+                        help='Directory containing the content library')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Runs per parser (best time is reported)')
+    parser.add_argument('--scale', type=int, default=1,
+                        help='Parse each block this many times per run')
+    args = parser.parse_args()
+
+    populate = load_populate_module()
+    with contextlib.redirect_stdout(io.StringIO()):
+        skills_content, _ = populate.load_content_library(args.content_dir)
+    contents = list(skills_content.values()) * args.scale
+    lines = sum(content.count('\n') + 1 for content in contents)
+
+    for content in skills_content.values():
+        legacy, tokenized = legacy_parse(content), tokenizer_parse(content)
+        if legacy[1] != tokenized[1] or any(legacy[0].get(key) != tokenized[0].get(key)
+                                            for key in ('name', 'description', 'owner', 'collaborators',
+                                                        'when_to_use', 'dependencies')):
+            print("Error: parsers disagree; benchmark results are not comparable")
+            return 1
+
+    print(f"{len(contents)} blocks, {lines} lines per run")
+    print(f"{'parser':<12} {'best (ms)':>10} {'lines/sec':>12} {'speed-up':>9}")
+    baseline = best_of(args.repeat, legacy_parse, contents)
+    for label, seconds in (("legacy", baseline),
+                           ("tokenizer", best_of(args.repeat, tokenizer_parse, contents))):
+        print(f"{label:<12} {seconds * 1000:>10.2f} {lines / seconds:>12,.0f} {baseline / seconds:>8.2f}x")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark populate_skill_files() scaling across --jobs worker counts.
+
+Renders the content library into several fresh skills trees (simulating a
+multi-project fan-out) for each worker count and reports wall time and
+speed-up relative to a single worker.
+
+Workers overlap file I/O, not rendering (which holds the GIL), so on a
+fast local disk the speed-up is small. --latency adds a sleep to every
+file data sync to model a network-backed home directory.
+
+Usage:
+    python3 benchmarks/bench_jobs.py --content-dir . --targets 8 --jobs 1 2 4 8
+    python3 benchmarks/bench_jobs.py --latency 2 --jobs 1 4 8
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from _common import REPO_ROOT, load_populate_module
+
+
+def run_once(populate, content_dir: str, targets: int, jobs: int) -> float:
+    """Populate `targets` fresh skills trees and return elapsed seconds."""
+    with tempfile.TemporaryDirectory(prefix="bench-jobs-") as tmp:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(targets):
+                skills_dir = os.path.join(tmp, f"project-{i}", "skills")
+                _, _, errors = populate.populate_skill_files(content_dir, skills_dir, jobs=jobs)
+                if errors:
+                    raise RuntimeError(f"populate failed: {errors[:3]}")
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark populate --jobs scaling')
+    parser.add_argument('--content-dir', default=str(REPO_ROOT),
+                        help='Directory containing the content library')
+    parser.add_argument('--targets', type=int, default=8,
+                        help='Number of project skills trees to render per run')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Worker counts to compare')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per worker count (best time is reported)')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='Simulated latency in ms added to each file data sync (default: 0)')
+    args = parser.parse_args()
+
+    populate = load_populate_module()
+    if args.latency > 0:
+        sync_file_data = populate._sync_file_data
+
+        def slow_sync(fd: int) -> None:
+            time.sleep(args.latency / 1000)
+            sync_file_data(fd)
+
+        populate._sync_file_data = slow_sync
+
+    print(f"{'jobs':>6} {'best (s)':>10} {'speed-up':>10}")
+    baseline = None
+    for jobs in args.jobs:
+        best = min(run_once(populate, args.content_dir, args.targets, jobs)
+                   for _ in range(args.repeat))
+        if baseline is None:
+            baseline = best
+        print(f"{jobs:>6} {best:>10.3f} {baseline / best:>9.2f}x")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Benchmark the populate-skills pipeline at library scale.
+
+Generates synthetic content libraries in the '---\\nSKILL_ID:' format,
+using the real library's blocks as templates so body sizes follow the real
+distribution, and times each pipeline stage separately:
+
+    parse         parse_content_files()
+    generate      generate_skill_file_content() for every skill
+    populate      populate_skill_files() into a fresh tree
+    placeholders  create_placeholder_for_missing() into a fresh tree
+
+For every library size and stage it records the best wall time, throughput
+(skills/s and MB/s of input) and peak RSS. Results are written as JSON so
+a later run can be checked against a saved baseline:
+
+    python3 benchmarks/bench_pipeline.py run --sizes 116 10000 100000 --output baseline.json
+    python3 benchmarks/bench_pipeline.py run --output current.json
+    python3 benchmarks/bench_pipeline.py compare baseline.json current.json --threshold 0.15
+
+compare exits with status 1 when any stage is slower than the baseline by
+more than the threshold. `generate` writes a synthetic library on its own,
+e.g. for profiling populate-skills.py directly.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from _common import REPO_ROOT, load_populate_module
+
+RESULTS_FORMAT = 1
+
+DEFAULT_SIZES = [116, 10000, 100000]
+
+STAGES = ("parse", "generate", "populate", "placeholders")
+
+SYNTHETIC_LIBRARY = "skills-content-synthetic.md"
+
+
+def write_synthetic_library(populate, template_dir: str, output_dir: str, count: int,
+                            seed: int = 0) -> Tuple[Path, int]:
+    """
+    Write a content library of `count` skills to output_dir.
+
+    Each skill copies a randomly chosen real block with its skill ID
+    rewritten and a unique SKILL_PATH.
+
+    Returns: (library path, size in bytes)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        skills_content, registry = populate.load_content_library(template_dir)
+    templates = [(skill_id, registry.get(skill_id).path, content)
+                 for skill_id, content in skills_content.items()
+                 if registry.get(skill_id) and registry.get(skill_id).path]
+    if not templates:
+        raise ValueError(f"no skill blocks found in {template_dir}")
+
+    rng = random.Random(seed)
+    library = Path(output_dir) / SYNTHETIC_LIBRARY
+    with open(library, 'w', encoding='utf-8') as f:
+        for n in range(count):
+            template_id, template_path, content = rng.choice(templates)
+            skill_id = f"{template_id.split('-')[0]}-{n:06d}"
+            category, name = template_path.split('/')[1:3]
+            f.write(f"---\nSKILL_ID: {skill_id}\n"
+                    f"SKILL_PATH: skills/{category}/{name}-{n:06d}/SKILL.md\n---\n"
+                    f"{content.replace(template_id, skill_id)}\n\n")
+    return library, library.stat().st_size
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's peak-RSS counter (Linux only)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_kb() -> int:
+    """Peak resident set size since the last reset, in KiB."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # ru_maxrss is KiB on Linux and bytes on macOS, and never resets
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def measure(repeat: int, setup: Callable[[], object], stage: Callable[[object], None]) -> Dict:
+    """Best wall time over `repeat` runs, plus peak RSS across them."""
+    best = None
+    peak = 0
+    for _ in range(repeat):
+        state = setup()
+        _reset_peak_rss()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            stage(state)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        peak = max(peak, _peak_rss_kb())
+    return {'seconds': round(best, 6), 'peak_rss_kb': peak}
+
+
+def bench_size(populate, template_dir: str, size: int, repeat: int, durable: bool) -> Dict[str, Dict]:
+    """Time every stage against a synthetic library of `size` skills."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix=f"bench-pipeline-{size}-") as tmp:
+        content_dir = os.path.join(tmp, "content")
+        os.mkdir(content_dir)
+        _, library_bytes = write_synthetic_library(populate, template_dir, content_dir, size)
+        with contextlib.redirect_stdout(io.StringIO()):
+            skills_content, registry = populate.load_content_library(content_dir)
+        runs = iter(range(repeat * len(STAGES)))
+
+        def fresh_tree() -> str:
+            return os.path.join(tmp, f"tree-{next(runs)}")
+
+        results['parse'] = measure(
+            repeat, lambda: None,
+            lambda _: populate.parse_content_files(content_dir))
+        results['generate'] = measure(
+            repeat, lambda: None,
+            lambda _: [populate.generate_skill_file_content(skill_id, content, registry=registry)
+                       for skill_id, content in skills_content.items()])
+        results['populate'] = measure(
+            repeat, fresh_tree,
+            lambda skills_dir: populate.populate_skill_files(content_dir, skills_dir, durable=durable))
+        results['placeholders'] = measure(
+            repeat, fresh_tree,
+            lambda skills_dir: populate.create_placeholder_for_missing(
+                skills_dir, durable=durable, registry=registry))
+
+    # Placeholders are written for every registry skill, built-in defaults included
+    counts = {'placeholders': sum(1 for record in registry if record.path)}
+    for name, stage in results.items():
+        stage['skills_per_sec'] = round(counts.get(name, size) / stage['seconds'], 1)
+        stage['mb_per_sec'] = round(library_bytes / 1e6 / stage['seconds'], 3)
+    return results
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """Stages slower than baseline by more than `threshold` (a fraction)."""
+    regressions = []
+    for size, stages in current['results'].items():
+        for stage, result in stages.items():
+            before = baseline['results'].get(size, {}).get(stage)
+            if before is None:
+                continue
+            ratio = result['seconds'] / before['seconds']
+            if ratio > 1 + threshold:
+                regressions.append(f"{stage} @ {size} skills: {before['seconds']:.3f}s → "
+                                   f"{result['seconds']:.3f}s (+{(ratio - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_table(results: Dict[str, Dict[str, Dict]]) -> None:
+    print(f"{'skills':>8} {'stage':<13} {'best (s)':>10} {'skills/s':>12} {'MB/s':>9} {'peak RSS (MB)':>14}")
+    for size, stages in results.items():
+        for stage, result in stages.items():
+            print(f"{size:>8} {stage:<13} {result['seconds']:>10.3f} {result['skills_per_sec']:>12,.0f} "
+                  f"{result['mb_per_sec']:>9.2f} {result['peak_rss_kb'] / 1024:>14.1f}")
+
+
+def _load_results(path: str) -> Dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('format') != RESULTS_FORMAT:
+        raise ValueError(f"unsupported results format: {data.get('format')!r}")
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark populate-skills.py stages at scale')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Run the benchmark and write results as JSON')
+    run.add_argument('--content-dir', default=str(REPO_ROOT),
+                     help='Content library used as templates for synthetic skills')
+    run.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                     help='Library sizes in skills (default: 116 10000 100000)')
+    run.add_argument('--repeat', type=int, default=3,
+                     help='Runs per stage (best time is reported)')
+    run.add_argument('--no-fsync', action='store_true',
+                     help='Populate without syncing files to disk')
+    run.add_argument('--output', help='Write results to this JSON file')
+    run.add_argument('--baseline', help='Also compare against this results file')
+    run.add_argument('--threshold', type=float, default=0.10,
+                     help='Allowed slowdown before a stage counts as regressed (default: 0.10)')
+
+    compare = commands.add_parser('compare', help='Compare two results files')
+    compare.add_argument('baseline', help='Baseline results JSON')
+    compare.add_argument('current', help='Current results JSON')
+    compare.add_argument('--threshold', type=float, default=0.10,
+                         help='Allowed slowdown before a stage counts as regressed (default: 0.10)')
+
+    generate = commands.add_parser('generate', help='Write a synthetic content library')
+    generate.add_argument('--content-dir', default=str(REPO_ROOT),
+                          help='Content library used as templates')
+    generate.add_argument('--skills', type=int, required=True, help='Number of skills')
+    generate.add_argument('--output-dir', required=True, help='Directory to write the library to')
+    generate.add_argument('--seed', type=int, default=0, help='Random seed')
+
+    args = parser.parse_args()
+
+    if args.command == 'generate':
+        os.makedirs(args.output_dir, exist_ok=True)
+        library, size = write_synthetic_library(load_populate_module(), args.content_dir,
+                                                args.output_dir, args.skills, args.seed)
+        print(f"Wrote {args.skills} skills ({size / 1e6:.1f} MB) to {library}")
+        return 0
+
+    if args.command == 'compare':
+        try:
+            baseline, current = _load_results(args.baseline), _load_results(args.current)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot load results: {e}")
+            return 2
+    else:
+        populate = load_populate_module()
+        results = {}
+        for size in args.sizes:
+            print(f"Benchmarking {size} skills...", file=sys.stderr)
+            results[str(size)] = bench_size(populate, args.content_dir, size, args.repeat,
+                                            durable=not args.no_fsync)
+        current = {
+            'format': RESULTS_FORMAT,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'results': results,
+        }
+        print_table(results)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(current, f, indent=2)
+                f.write('\n')
+            print(f"\nResults written to {args.output}")
+        if not args.baseline:
+            return 0
+        try:
+            baseline = _load_results(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot load baseline {args.baseline}: {e}")
+            return 2
+
+    regressions = compare_results(baseline, current, args.threshold)
+    if regressions:
+        print(f"\nRegressions beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  ❌ {regression}")
+        return 1
+    print(f"\nNo stage regressed beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark selective population from a sharded content library.
+
+Writes one synthetic library (see bench_pipeline.py), splits it with
+write_content_shards() and compares a full load_content_library() pass
+with load_content_selection() for a single ID prefix, which reads only the
+selected blocks through the shard index. Reports wall time and the bytes
+of block content each path reads.
+
+Usage:
+    python3 benchmarks/bench_shards.py --skills 10000 --only SEC --repeat 3
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from _common import REPO_ROOT, load_populate_module
+from bench_pipeline import write_synthetic_library
+
+
+def best_of(repeat: int, run) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark sharded content library selection')
+    parser.add_argument('--content-dir', default=str(REPO_ROOT),
+                        help='Content library used as templates for synthetic skills')
+    parser.add_argument('--skills', type=int, default=10000, help='Skills in the synthetic library')
+    parser.add_argument('--only', default='SEC', help='Comma-separated prefixes to select')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is reported)')
+    args = parser.parse_args()
+    prefixes = [prefix.strip().upper() for prefix in args.only.split(',') if prefix.strip()]
+
+    populate = load_populate_module()
+    with tempfile.TemporaryDirectory(prefix='bench-shards-') as tmp:
+        source = os.path.join(tmp, 'source')
+        shards = os.path.join(tmp, 'shards')
+        os.mkdir(source)
+        library, size = write_synthetic_library(populate, args.content_dir, source, args.skills)
+        with contextlib.redirect_stdout(io.StringIO()):
+            populate.write_content_shards(source, shards)
+
+        full = best_of(args.repeat, lambda: populate.load_content_library(shards))
+        # The first selection run has already brought the index up to date
+        selection = best_of(args.repeat, lambda: populate.load_content_selection(shards, prefixes))
+        with contextlib.redirect_stdout(io.StringIO()):
+            selected_content, _, selected = populate.load_content_selection(shards, prefixes)
+        index_size = os.path.getsize(os.path.join(shards, populate.SHARD_INDEX_FILENAME))
+
+    selected_bytes = sum(len(content.encode('utf-8')) for content in selected_content.values())
+    print(f"{args.skills} skills, {size / 1e6:.1f} MB library, {index_size / 1e3:.0f} KB shard index\n")
+    print(f"{'load':<22} {'skills':>7} {'read (MB)':>13} {'time (ms)':>10} {'speedup':>8}")
+    print(f"{'full library':<22} {args.skills:>7} {size / 1e6:>13.2f} {full * 1e3:>10.1f} {1:>7.1f}x")
+    print(f"{'--only ' + ','.join(prefixes):<22} {len(selected):>7} {selected_bytes / 1e6:>13.2f} "
+          f"{selection * 1e3:>10.1f} {full / selection:>7.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
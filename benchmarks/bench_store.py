@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory use of many loaded projects: plain dicts vs SkillStore.
+
+Each simulated project is the content library with a share of its blocks
+(--unique, default 5%) given project-specific text, and every block is a
+separate string object, as if each project had been parsed on its own.
+`dict` keeps one parse_content_files()-style dict per project; `store`
+adds each project to a SkillStore, which shares identical block text.
+Every (mode, project count) runs in a fresh child process and reports the
+RSS growth over the process after loading the template library, plus the
+time to load and to render one project's skills.
+
+Usage:
+    python3 benchmarks/bench_store.py --projects 1 100 1000
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from _common import REPO_ROOT, load_populate_module
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from skill_store import SkillStore  # noqa: E402
+
+MODES = ('dict', 'store')
+
+
+def rss_bytes() -> int:
+    """Current resident set size (peak on platforms without /proc)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def project_content(template, project: int, unique: float):
+    """A fresh copy of the template blocks; every 1/unique-th one is project-specific."""
+    every = max(1, round(1 / unique)) if unique > 0 else 0
+    content = {}
+    for n, (skill_id, text) in enumerate(template.items()):
+        if every and n % every == project % every:
+            content[skill_id] = f"{text}\n\n<!-- project {project} notes -->\n"
+        else:
+            content[skill_id] = ''.join([text[:1], text[1:]])  # equal text, new object
+    return content
+
+
+def child(mode: str, projects: int, content_dir: str, unique: float) -> dict:
+    populate = load_populate_module()
+    with contextlib.redirect_stdout(io.StringIO()):
+        template, registry = populate.load_content_library(content_dir)
+    gc.collect()
+    before = rss_bytes()
+
+    start = time.perf_counter()
+    if mode == 'dict':
+        loaded = {f"project-{n}": project_content(template, n, unique) for n in range(projects)}
+    else:
+        loaded = SkillStore(populate.render_skill_parts, populate.format_skill_file)
+        for n in range(projects):
+            loaded.add_project(f"project-{n}", project_content(template, n, unique), registry)
+    load_seconds = time.perf_counter() - start
+    gc.collect()
+    growth = rss_bytes() - before
+
+    start = time.perf_counter()
+    if mode == 'dict':
+        for skill_id, text in loaded['project-0'].items():
+            populate.generate_skill_file_content(skill_id, text, 'project-0', None, registry)
+    else:
+        for skill in loaded.skills('project-0'):
+            loaded.render('project-0', skill.skill_id)
+    render_seconds = time.perf_counter() - start
+
+    return {'mode': mode, 'projects': projects, 'rss_growth': growth,
+            'load_seconds': load_seconds, 'render_seconds': render_seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark memory of many loaded skill libraries')
+    parser.add_argument('--content-dir', default=str(REPO_ROOT), help='Content library used per project')
+    parser.add_argument('--projects', type=int, nargs='+', default=[1, 100, 1000],
+                        help='Project counts to load')
+    parser.add_argument('--unique', type=float, default=0.05,
+                        help='Share of blocks that differ between projects (default: 0.05)')
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'PROJECTS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(child(args.child[0], int(args.child[1]), args.content_dir, args.unique)))
+        return 0
+
+    rows = []
+    for projects in args.projects:
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, '--child', mode, str(projects),
+                 '--content-dir', args.content_dir, '--unique', str(args.unique)],
+                check=True, capture_output=True, text=True).stdout
+            rows.append(json.loads(output.splitlines()[-1]))
+
+    print(f"{'projects':>8} {'mode':<6} {'RSS growth (MB)':>16} {'per project (KB)':>17} "
+          f"{'load (s)':>9} {'render (ms)':>12}")
+    for row in rows:
+        print(f"{row['projects']:>8} {row['mode']:<6} {row['rss_growth'] / 1e6:>16.1f} "
+              f"{row['rss_growth'] / row['projects'] / 1e3:>17.1f} {row['load_seconds']:>9.2f} "
+              f"{row['render_seconds'] * 1e3:>12.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
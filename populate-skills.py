@@ -5,6 +5,12 @@ Populates all 116 skill template files with detailed content from the master con
 
 Usage:
     python3 populate-skills.py --content-dir /path/to/content --skills-dir /path/to/skills
+    python3 populate-skills.py --content-dir /path/to/content --skills-dir /path/to/skills --incremental
+    python3 populate-skills.py --content-dir /path/to/content --targets targets.json
+    python3 populate-skills.py --content-dir /path/to/content --skills-dir /path/to/skills --profile trace.json
+    python3 populate-skills.py --content-dir /path/to/content --skills-dir /path/to/skills --incremental --watch
+    python3 populate-skills.py --content-dir /path/to/content --write-shards /path/to/shards
+    python3 populate-skills.py --content-dir /path/to/shards --skills-dir /path/to/skills --only SEC,DEV
 
 The script reads content files and matches SKILL_ID markers to populate the correct files.
 
@@ -15,11 +21,57 @@ Ownership Pattern:
 """
 
 import os
-import re
 import sys
+import json
+import time
+import fnmatch
+import shutil
+import hashlib
 import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from skill_bundle import BUNDLE_FILENAME, pack_bundle
+from skill_compress import (COMPRESSED_SUFFIXES, DECOMPRESSION_ERRORS, detect_codec, open_content_file,
+                            read_content_bytes)
+from skill_frontmatter import tokenize_frontmatter
+from skill_graph import GRAPH_FILENAME, SkillGraph, build_graph, describe_problems, graph_to_json
+from skill_packs import PACK_FORMAT, PACK_INDEX_FILENAME, PACKS_DIRNAME, build_pack, pack_to_json
+from skill_profile import (DEFAULT_TRACE_FILENAME, PROFILE_ENV, active_profiler, start_profiling,
+                           trace_path_from_env)
+from skill_search import SEARCH_INDEX_FILENAME, SearchIndex, index_to_json, load_index
+from skill_sections import SECTIONS_FILENAME, compute_toc, toc_to_json
+from skill_registry import REGISTRY_FILENAME, SkillRegistry, build_registry, registry_to_json, skill_prefix
+from skill_shards import (SHARD_INDEX_FILENAME, IndexEntry, file_stamp, index_entries, load_shard_index,
+                          read_ranges, save_shard_index, shard_file_name)
+from skill_watch import DEFAULT_DEBOUNCE, DirectoryWatcher
+
+# Bump whenever generate_skill_file_content() output changes so that
+# incremental runs regenerate every skill.
+GENERATOR_VERSION = "1.0.0"
+
+# Incremental-mode manifest, stored at the root of the skills directory
+MANIFEST_FILENAME = ".populate-manifest.json"
+
+# Per-project frontmatter defaults (override with --project or a --targets file)
+DEFAULT_PROJECT = "studyabroad-v1"
+# Display name used in placeholder headings for DEFAULT_PROJECT; other
+# projects are named as given
+DEFAULT_PROJECT_TITLE = "StudyAbroad"
+SKILL_VERSION = "1.0.0"
+
+# SKILL.md frontmatter keys, in output order
+FRONTMATTER_KEYS = (
+    'name', 'description', 'skill_id', 'owner', 'collaborators',
+    'project', 'version', 'when_to_use', 'dependencies',
+)
+
+# Built-in skill configuration. The content library's own SKILL_PATH, owner,
+# collaborators and collaboration_rules fields take precedence; these maps
+# fill in whatever a block does not declare (see skill_registry.py).
 
 # Skill ID to path mapping
 SKILL_PATHS = {
@@ -217,186 +269,991 @@ CROSS_CUTTING_SKILLS = {
 }
 
 
-def get_skill_owner(skill_id: str) -> str:
-    """Get the owner agent for a skill based on its ID prefix."""
-    prefix = skill_id.split('-')[0]
-    return SKILL_OWNERS.get(prefix, "unknown")
+# Registry of the built-in configuration alone, used when no content
+# library has been loaded
+DEFAULT_REGISTRY = build_registry([], SKILL_PATHS, SKILL_OWNERS, CROSS_CUTTING_SKILLS)
 
 
-def get_skill_collaborators(skill_id: str) -> Tuple[List[str], str]:
+def get_skill_owner(skill_id: str, registry: Optional[SkillRegistry] = None) -> str:
+    """Get the owner agent for a skill (declared owner, else by ID prefix)."""
+    return (registry or DEFAULT_REGISTRY).owner_of(skill_id)
+
+
+def get_skill_collaborators(skill_id: str, registry: Optional[SkillRegistry] = None) -> Tuple[List[str], str]:
     """Get collaborators and collaboration rules for a skill."""
-    if skill_id in CROSS_CUTTING_SKILLS:
-        info = CROSS_CUTTING_SKILLS[skill_id]
-        return info["collaborators"], info["collaboration_rules"]
+    record = (registry or DEFAULT_REGISTRY).get(skill_id)
+    if record is not None and record.collaborators:
+        return list(record.collaborators), record.collaboration_rules
     return [], ""
 
 
-def parse_content_files(content_dir: str) -> Dict[str, str]:
+class SkillBlock(NamedTuple):
+    """A single SKILL_ID block read from a content library."""
+    skill_id: str
+    path: str
+    frontmatter: str
+    body: str
+
+    @property
+    def content(self) -> str:
+        """The block text as consumed by generate_skill_file_content()."""
+        if self.frontmatter:
+            return f"{self.frontmatter}\n---\n\n{self.body}"
+        return self.body
+
+
+# Content library file names, in override order (later files win). Each may
+# also be gzip, xz or zstd compressed (see skill_compress.py).
+CONTENT_FILE_PATTERNS = tuple(
+    base + suffix
+    for base in ("skills-content-*.md", "all-skills-content.md")
+    for suffix in ('',) + COMPRESSED_SUFFIXES
+)
+
+
+def find_content_files(content_dir: str) -> List[Path]:
+    """Find all content library files (both naming patterns) in content_dir."""
+    content_path = Path(content_dir)
+    content_files = []
+    for pattern in CONTENT_FILE_PATTERNS:
+        content_files += list(content_path.glob(pattern))
+    return content_files
+
+
+def is_content_file(name: str) -> bool:
+    """Whether a file name matches one of CONTENT_FILE_PATTERNS."""
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in CONTENT_FILE_PATTERNS)
+
+
+def _finish_skill_block(lines: List[str]) -> Optional[SkillBlock]:
+    """Turn the buffered lines of one SKILL_ID block into a SkillBlock.
+
+    lines[0] holds the skill ID, followed by the SKILL_PATH header and the
+    '---' that closes it. Blocks without a closing header rule are dropped.
     """
-    Parse all content files and extract skill content keyed by SKILL_ID.
+    skill_id = lines[0].strip()
+
+    header_end = None
+    for i in range(2, len(lines)):
+        if lines[i].strip() == '---':
+            header_end = i
+            break
+    if header_end is None:
+        return None
+
+    path = ''
+    for line in lines[1:header_end]:
+        if line.startswith('SKILL_PATH:'):
+            path = line.split(':', 1)[1].strip()
+
+    # Split the block's own frontmatter from the markdown body
+    content_lines = lines[header_end + 1:]
+    for i, line in enumerate(content_lines):
+        if line.startswith('#'):
+            break
+        if line.strip() == '---':
+            frontmatter = '\n'.join(content_lines[:i]).strip()
+            body = '\n'.join(content_lines[i + 1:]).strip()
+            return SkillBlock(skill_id, path, frontmatter, body)
+
+    return SkillBlock(skill_id, path, '', '\n'.join(content_lines).strip())
+
+
+def iter_skill_blocks(content_file: Path) -> Iterator[SkillBlock]:
+    """
+    Stream SkillBlock records out of a single content library file.
+
+    The file is read line by line and only the block currently being
+    assembled is held in memory. A block starts at a '---' line directly
+    followed by a 'SKILL_ID:' line; anything before the first marker is
+    ignored. Compressed files are decompressed as they are read.
+    """
+    with open_content_file(content_file) as f:
+        lines = None          # None until the first SKILL_ID marker
+        pending_rule = False  # saw '---', waiting to see if SKILL_ID follows
+        seen_line = False
+
+        for raw in f:
+            line = raw.rstrip('\n')
+
+            if pending_rule:
+                pending_rule = False
+                if line.startswith('SKILL_ID:'):
+                    if lines is not None:
+                        block = _finish_skill_block(lines)
+                        if block is not None:
+                            yield block
+                    lines = [line[len('SKILL_ID:'):].lstrip()]
+                    continue
+                if lines is not None:
+                    lines.append('---')
+
+            if line == '---' and seen_line:
+                pending_rule = True
+            elif lines is not None:
+                lines.append(line)
+            seen_line = True
+
+        if lines is not None:
+            if pending_rule:
+                lines.append('---')
+            block = _finish_skill_block(lines)
+            if block is not None:
+                yield block
+
+
+def load_content_library(content_dir: str) -> Tuple[Dict[str, str], SkillRegistry]:
+    """
+    Parse all content files in one streaming pass.
+
+    Returns: (skill content keyed by SKILL_ID, registry built from the block
+    headers and frontmatter merged over the built-in configuration). Later
+    files override earlier ones.
     """
     skills_content = {}
-    content_path = Path(content_dir)
-    
-    # Find all content files (both patterns)
-    content_files = list(content_path.glob("skills-content-*.md"))
-    content_files += list(content_path.glob("all-skills-content.md"))
+    headers = {}
+    content_files = find_content_files(content_dir)
     
     if not content_files:
         print(f"Warning: No content files found in {content_dir}")
-        print(f"  Looking for: skills-content-*.md or all-skills-content.md")
-        return skills_content
+        print(f"  Looking for: skills-content-*.md or all-skills-content.md (optionally .gz, .xz or .zst)")
+        return skills_content, DEFAULT_REGISTRY
     
     print(f"Found {len(content_files)} content file(s)")
     
+    profiler = active_profiler()
+    with profiler.stage('parse'):
+        for content_file in content_files:
+            print(f"  Processing: {content_file.name}")
+            if profiler.enabled:
+                profiler.count('bytes_read', content_file.stat().st_size)
+                profiler.count('files_read')
+            for block in iter_skill_blocks(content_file):
+                skills_content[block.skill_id] = block.content
+                headers[block.skill_id] = block._replace(body='')
+
+    with profiler.stage('registry'):
+        registry = build_registry(headers.values(), SKILL_PATHS, SKILL_OWNERS, CROSS_CUTTING_SKILLS)
+    return skills_content, registry
+
+
+_BLOCK_MARKER = b'\n---\nSKILL_ID:'
+
+
+def _skill_block_ranges(data: bytes) -> List[Tuple[int, int]]:
+    """
+    Byte ranges of the SKILL_ID blocks in a content file.
+
+    Each range starts at a block's 'SKILL_ID:' line and ends before the
+    '---' rule opening the next block; these are the blocks
+    iter_skill_blocks() reads. data must use '\n' line endings.
+    """
+    ranges = []
+    start = data.find(_BLOCK_MARKER)
+    while start != -1:
+        start += len(b'\n---\n')
+        end = data.find(_BLOCK_MARKER, start)
+        ranges.append((start, end if end != -1 else len(data)))
+        start = end
+    return ranges
+
+
+def _parse_block_range(data: bytes, start: int, end: int) -> Optional[SkillBlock]:
+    """Parse one range returned by _skill_block_ranges()."""
+    chunk = data[start:end]
+    if end == len(data) and chunk.endswith(b'\n'):
+        chunk = chunk[:-1]
+    return _parse_block_bytes(chunk)
+
+
+def _parse_block_bytes(chunk: bytes) -> Optional[SkillBlock]:
+    """Parse one block's bytes, starting at its 'SKILL_ID:' line."""
+    lines = chunk.decode('utf-8').split('\n')
+    lines[0] = lines[0][len('SKILL_ID:'):].lstrip()
+    return _finish_skill_block(lines)
+
+
+def _scan_blocks(data: bytes) -> Iterator[Tuple[SkillBlock, int, int]]:
+    """
+    Yield (block, start, end) for the parseable blocks of a content file.
+
+    start:end covers exactly the bytes _parse_block_bytes() needs, so a
+    block can later be re-read on its own with a seek.
+    """
+    for start, end in _skill_block_ranges(data):
+        if end == len(data) and data.endswith(b'\n'):
+            end -= 1
+        block = _parse_block_bytes(data[start:end])
+        if block is not None:
+            yield block, start, end
+
+
+class ContentLibrary:
+    """
+    A parsed content library kept in memory for --watch runs.
+
+    Each file's blocks are remembered by a digest of their raw bytes, so
+    refresh() re-parses only blocks whose bytes changed. skills_content
+    and registry match what load_content_library() returns.
+    """
+
+    def __init__(self, content_dir: str):
+        self.content_dir = content_dir
+        # file name -> {block digest: (SkillBlock or None, rendered block content)}
+        self._parsed: Dict[str, Dict[bytes, Tuple[Optional[SkillBlock], str]]] = {}
+        # file name -> {skill_id: (SkillBlock, content)}, later blocks winning
+        self._files: Dict[str, Dict[str, Tuple[SkillBlock, str]]] = {}
+        self.skills_content: Dict[str, str] = {}
+        self.registry = DEFAULT_REGISTRY
+        self.refresh()
+
+    def _load_file(self, content_file: Path) -> Tuple[int, bool]:
+        """
+        Re-read one content file, parsing only blocks not seen before.
+
+        Returns: (blocks re-parsed, whether any block header changed)
+        """
+        data = read_content_bytes(content_file)
+        if b'\r' in data:
+            # Match the universal-newline reading of iter_skill_blocks()
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+        previous = self._parsed.get(content_file.name, {})
+        parsed = {}
+        blocks = {}
+        reparsed = 0
+        for start, end in _skill_block_ranges(data):
+            digest = hashlib.blake2b(data[start:end], digest_size=16).digest()
+            entry = parsed.get(digest) or previous.get(digest)
+            if entry is None:
+                block = _parse_block_range(data, start, end)
+                entry = (block, block.content if block else '')
+                reparsed += 1
+            parsed[digest] = entry
+            if entry[0] is not None:
+                blocks[entry[0].skill_id] = entry
+
+        old_headers = {(block.skill_id, block.path, block.frontmatter)
+                       for block, _ in self._files.get(content_file.name, {}).values()}
+        new_headers = {(block.skill_id, block.path, block.frontmatter) for block, _ in blocks.values()}
+        self._parsed[content_file.name] = parsed
+        self._files[content_file.name] = blocks
+        return reparsed, old_headers != new_headers
+
+    def refresh(self, names: Optional[Iterable[str]] = None) -> Tuple[Set[str], int, bool]:
+        """
+        Re-read the content files named in `names` (default: all), plus any
+        content file that appeared or disappeared.
+
+        Returns: (IDs of skills whose content or registry record changed,
+        blocks re-parsed, whether the registry changed)
+        """
+        names = set(names) if names is not None else None
+        content_files = find_content_files(self.content_dir)
+        current = [content_file.name for content_file in content_files]
+
+        reparsed = 0
+        headers_changed = False
+        for content_file in content_files:
+            if names is None or content_file.name in names or content_file.name not in self._files:
+                count, changed = self._load_file(content_file)
+                reparsed += count
+                headers_changed |= changed
+        for name in set(self._files) - set(current):
+            del self._files[name]
+            del self._parsed[name]
+            headers_changed = True
+
+        merged: Dict[str, Tuple[SkillBlock, str]] = {}
+        for name in current:
+            merged.update(self._files[name])
+        skills_content = {skill_id: content for skill_id, (_, content) in merged.items()}
+
+        registry = self.registry
+        if headers_changed:
+            if content_files:
+                registry = build_registry((block._replace(body='') for block, _ in merged.values()),
+                                          SKILL_PATHS, SKILL_OWNERS, CROSS_CUTTING_SKILLS)
+            else:
+                registry = DEFAULT_REGISTRY
+
+        changed = {skill_id for skill_id in skills_content.keys() | self.skills_content.keys()
+                   if skills_content.get(skill_id) != self.skills_content.get(skill_id)}
+        registry_changed = registry is not self.registry and (
+            registry.skills != self.registry.skills or registry.owners != self.registry.owners)
+        if registry_changed:
+            changed |= {skill_id for skill_id in registry.skills.keys() | self.registry.skills.keys()
+                        if registry.get(skill_id) != self.registry.get(skill_id)}
+
+        self.skills_content = skills_content
+        self.registry = registry
+        return changed, reparsed, registry_changed
+
+
+def parse_content_files(content_dir: str) -> Dict[str, str]:
+    """
+    Parse all content files and extract skill content keyed by SKILL_ID.
+
+    Thin wrapper over iter_skill_blocks(); later files override earlier ones.
+    """
+    return load_content_library(content_dir)[0]
+
+
+def index_content_library(content_dir: str, content_files: List[Path]) -> Optional[Dict[str, IndexEntry]]:
+    """
+    Bring the shard index of content_dir (SHARD_INDEX_FILENAME) up to date.
+
+    Only files whose size or mtime changed since they were indexed are read.
+    Returns None when the library cannot be indexed: compressed files and
+    files with '\r' line endings have no seekable block offsets.
+
+    Returns: IndexEntry keyed by skill ID, later files winning
+    """
+    indexed = load_shard_index(content_dir)
+    files = {}
     for content_file in content_files:
-        print(f"  Processing: {content_file.name}")
-        with open(content_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Split content by SKILL_ID markers
-        # Pattern matches: ---\nSKILL_ID: XXX-NNN\n
-        skill_blocks = re.split(r'\n---\nSKILL_ID:\s*', content)
-        
-        for block in skill_blocks[1:]:  # Skip first block (before any SKILL_ID)
-            lines = block.split('\n')
-            if lines:
-                skill_id = lines[0].strip()
-                
-                # Find the start of actual content (after the SKILL_PATH line and ---)
-                content_start = 0
-                for i, line in enumerate(lines):
-                    if line.strip() == '---' and i > 1:
-                        content_start = i + 1
-                        break
-                
-                if content_start > 0:
-                    skill_content = '\n'.join(lines[content_start:]).strip()
-                    
-                    # Clean up: remove any trailing skill markers
-                    if '\n---\nSKILL_ID:' in skill_content:
-                        skill_content = skill_content.split('\n---\nSKILL_ID:')[0].strip()
-                    
-                    skills_content[skill_id] = skill_content
-                    
-    return skills_content
+        size, mtime_ns = file_stamp(content_file)
+        entry = indexed.get(content_file.name)
+        if entry and entry.get('size') == size and entry.get('mtime_ns') == mtime_ns:
+            files[content_file.name] = entry
+            continue
+        if detect_codec(content_file) is not None:
+            return None
+        data = content_file.read_bytes()
+        if b'\r' in data:
+            return None
+        skills = {}
+        for block, start, end in _scan_blocks(data):
+            skills[block.skill_id] = [start, end - start, block.path, block.frontmatter]
+        files[content_file.name] = {'size': size, 'mtime_ns': mtime_ns, 'skills': skills}
+
+    if files != indexed:
+        try:
+            save_shard_index(content_dir, files)
+        except OSError as e:
+            print(f"Warning: Cannot write shard index {SHARD_INDEX_FILENAME}: {e}")
+    return index_entries(files, [content_file.name for content_file in content_files])
+
+
+def select_skills(registry: SkillRegistry, prefixes: Iterable[str] = (),
+                  owners: Iterable[str] = ()) -> List[str]:
+    """Skill IDs (in registry order) with one of the given ID prefixes or owners."""
+    prefixes, owners = set(prefixes), set(owners)
+    return [skill_id for skill_id in registry.skills
+            if skill_prefix(skill_id) in prefixes or registry.owner_of(skill_id) in owners]
+
+
+def load_content_selection(content_dir: str, prefixes: Iterable[str] = (),
+                           owners: Iterable[str] = ()) -> Tuple[Dict[str, str], SkillRegistry, List[str]]:
+    """
+    Load only the skills selected by ID prefix or owner (see select_skills()).
+
+    The registry is built from the block headers kept in the shard index, so
+    it covers the whole library, but only the selected blocks are read, each
+    with a seek to its byte range. Libraries that cannot be indexed fall back
+    to a full load_content_library() pass.
+
+    Returns: (content of the selected skills, registry, selected skill IDs)
+    """
+    content_files = find_content_files(content_dir)
+    if not content_files:
+        skills_content, registry = load_content_library(content_dir)
+        return skills_content, registry, select_skills(registry, prefixes, owners)
+
+    print(f"Found {len(content_files)} content file(s)")
+
+    profiler = active_profiler()
+    with profiler.stage('index'):
+        entries = index_content_library(content_dir, content_files)
+    if entries is None:
+        print("  Compressed or CRLF content cannot be indexed; reading the whole library")
+        skills_content, registry = load_content_library(content_dir)
+        selected = select_skills(registry, prefixes, owners)
+        return {skill_id: skills_content[skill_id] for skill_id in selected
+                if skill_id in skills_content}, registry, selected
+
+    with profiler.stage('registry'):
+        registry = build_registry(entries.values(), SKILL_PATHS, SKILL_OWNERS, CROSS_CUTTING_SKILLS)
+    selected = select_skills(registry, prefixes, owners)
+
+    by_file: Dict[str, List[IndexEntry]] = {}
+    for skill_id in selected:
+        if skill_id in entries:
+            by_file.setdefault(entries[skill_id].file, []).append(entries[skill_id])
+
+    skills_content = {}
+    bytes_read = 0
+    with profiler.stage('parse'):
+        for name, file_entries in by_file.items():
+            chunks = read_ranges(os.path.join(content_dir, name),
+                                 [(entry.offset, entry.length) for entry in file_entries])
+            for entry, chunk in zip(file_entries, chunks):
+                block = _parse_block_bytes(chunk)
+                if block is None or block.skill_id != entry.skill_id:
+                    raise ValueError(f"shard index out of date for {name}; "
+                                     f"delete {SHARD_INDEX_FILENAME} and re-run")
+                skills_content[block.skill_id] = block.content
+                bytes_read += len(chunk)
+        if profiler.enabled:
+            profiler.count('bytes_read', bytes_read)
+            profiler.count('files_read', len(by_file))
+
+    print(f"  Read {len(skills_content)} skill block(s) ({bytes_read:,} bytes) "
+          f"from {len(by_file)} file(s) via {SHARD_INDEX_FILENAME}")
+    return skills_content, registry, selected
+
+
+def write_content_shards(content_dir: str, shard_dir: str) -> Dict[str, int]:
+    """
+    Split the content library into one file per skill ID prefix
+    (shard_file_name()) and index the result (see skill_shards.py).
+
+    Blocks are copied byte for byte; a skill defined in several files keeps
+    the block a full run would use. Shards from an earlier split whose
+    prefix no longer has skills are removed.
+
+    Returns: number of blocks written per shard file
+    """
+    if os.path.realpath(shard_dir) == os.path.realpath(content_dir):
+        raise ValueError("the shard directory must differ from the content directory")
+
+    blocks: Dict[str, bytes] = {}
+    for content_file in find_content_files(content_dir):
+        data = read_content_bytes(content_file)
+        if b'\r' in data:
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        for block, start, end in _scan_blocks(data):
+            blocks[block.skill_id] = data[start:end]
+
+    shards: Dict[str, List[bytes]] = {}
+    for skill_id, chunk in blocks.items():
+        shards.setdefault(skill_prefix(skill_id), []).append(chunk)
+
+    os.makedirs(shard_dir, exist_ok=True)
+    previous = load_shard_index(shard_dir)
+    written = {}
+    for prefix, chunks in shards.items():
+        name = shard_file_name(prefix)
+        path = os.path.join(shard_dir, name)
+        with open(f"{path}.tmp", 'wb') as f:
+            f.write(f"# Skill content shard: {prefix}-*".encode('utf-8'))
+            for chunk in chunks:
+                f.write(b'\n---\n')
+                f.write(chunk)
+            f.write(b'\n')
+        os.replace(f"{path}.tmp", path)
+        written[name] = len(chunks)
+
+    for name in set(previous) - set(written):
+        _remove_quietly(os.path.join(shard_dir, name))
+    for content_file in find_content_files(shard_dir):
+        if content_file.name not in written:
+            print(f"Warning: {content_file.name} in {shard_dir} is not one of the new shards "
+                  f"and will be read with them")
+
+    index_content_library(shard_dir, find_content_files(shard_dir))
+    return written
 
 
 def extract_metadata_from_block(block: str) -> Dict[str, str]:
     """Extract metadata (name, description, etc.) from the block header."""
-    metadata = {}
-    lines = block.split('\n')
-
-    for line in lines:
-        if ':' in line and not line.startswith('#'):
-            key, _, value = line.partition(':')
-            key = key.strip()
-            value = value.strip()
-            if key in ['name', 'description', 'skill_id', 'owner', 'agent', 'collaborators',
-                       'collaboration_rules', 'project', 'version', 'when_to_use']:
-                # Map 'agent' to 'owner' for backward compatibility
-                if key == 'agent':
-                    metadata['owner'] = value
-                else:
-                    metadata[key] = value
-
+    metadata, _ = tokenize_frontmatter(block)
     return metadata
 
 
-def generate_skill_file_content(skill_id: str, content: str) -> str:
+def render_skill_parts(skill_id: str, content: str,
+                       registry: Optional[SkillRegistry] = None) -> Tuple[Dict[str, str], str]:
     """
-    Generate the complete SKILL.md file content with proper YAML frontmatter.
+    Render the project-independent parts of a SKILL.md file.
     Includes ownership pattern with owner and collaborators fields.
 
-    Uses CROSS_CUTTING_SKILLS config to populate collaborators for known cross-cutting skills.
-    """
-    # Extract metadata from the content block
-    lines = content.split('\n')
-
-    # Try to extract metadata from the beginning of content
-    metadata = {}
-    content_start = 0
-    in_collaboration_rules = False
-    collaboration_rules_lines = []
+    Uses the registry to populate collaborators for known cross-cutting skills.
 
-    for i, line in enumerate(lines):
-        # Handle multi-line collaboration_rules
-        if in_collaboration_rules:
-            if line.strip().startswith('-') or line.strip().startswith(' '):
-                collaboration_rules_lines.append(line)
-                continue
-            else:
-                in_collaboration_rules = False
-                metadata['collaboration_rules'] = '\n'.join(collaboration_rules_lines)
-
-        if line.strip().startswith('name:'):
-            metadata['name'] = line.split(':', 1)[1].strip()
-        elif line.strip().startswith('description:'):
-            metadata['description'] = line.split(':', 1)[1].strip()
-        elif line.strip().startswith('skill_id:'):
-            metadata['skill_id'] = line.split(':', 1)[1].strip()
-        elif line.strip().startswith('owner:'):
-            metadata['owner'] = line.split(':', 1)[1].strip()
-        elif line.strip().startswith('agent:'):
-            # Legacy support: map 'agent' to 'owner'
-            metadata['owner'] = line.split(':', 1)[1].strip()
-        elif line.strip().startswith('collaborators:'):
-            metadata['collaborators'] = line.split(':', 1)[1].strip()
-        elif line.strip().startswith('collaboration_rules:'):
-            in_collaboration_rules = True
-            first_part = line.split(':', 1)[1].strip()
-            if first_part:
-                collaboration_rules_lines.append(first_part)
-        elif line.strip().startswith('when_to_use:'):
-            metadata['when_to_use'] = line.split(':', 1)[1].strip()
-        elif line.strip().startswith('dependencies:'):
-            metadata['dependencies'] = line.split(':', 1)[1].strip()
-        elif line.strip().startswith('#') or line.strip().startswith('## '):
-            content_start = i
-            break
+    Returns: (frontmatter_fields, body). The 'project' field is left out and
+    filled in per target by format_skill_file().
+    """
+    # Extract metadata from the beginning of the content block
+    metadata, content_start = tokenize_frontmatter(content)
 
     # Build the actual content (everything from the first header onwards)
-    actual_content = '\n'.join(lines[content_start:]).strip()
+    actual_content = content[content_start or 0:].strip()
 
     # If no actual content found, use the whole thing
     if not actual_content:
         actual_content = content
 
     # Get owner - use metadata if present, otherwise derive from skill_id
-    owner = metadata.get('owner') or get_skill_owner(skill_id)
+    owner = metadata.get('owner') or get_skill_owner(skill_id, registry)
 
-    # Get collaborators - check metadata first, then CROSS_CUTTING_SKILLS config
+    # Get collaborators - check metadata first, then the registry
     collaborators_str = metadata.get('collaborators', '[]')
-    if collaborators_str == '[]' and skill_id in CROSS_CUTTING_SKILLS:
-        collaborators, _ = get_skill_collaborators(skill_id)
-        collaborators_str = str(collaborators)
+    if collaborators_str == '[]':
+        collaborators, _ = get_skill_collaborators(skill_id, registry)
+        if collaborators:
+            collaborators_str = str(collaborators)
+
+    fields = {
+        'name': metadata.get('name', skill_id.lower()),
+        'description': metadata.get('description', 'Skill description'),
+        'skill_id': skill_id,
+        'owner': owner,
+        'collaborators': collaborators_str,
+        'version': SKILL_VERSION,
+        'when_to_use': metadata.get('when_to_use', 'As needed'),
+        'dependencies': metadata.get('dependencies', '[]'),
+    }
+
+    return fields, actual_content
+
+
+def format_skill_file(fields: Dict[str, str], body: str, project: str = DEFAULT_PROJECT,
+                      overrides: Optional[Dict[str, str]] = None) -> str:
+    """Assemble a SKILL.md file from rendered parts plus per-project fields."""
+    values = dict(fields, project=project)
+    if overrides:
+        values.update(overrides)
 
     # Generate YAML frontmatter with ownership pattern
-    frontmatter = f"""---
-name: {metadata.get('name', skill_id.lower())}
-description: {metadata.get('description', 'Skill description')}
-skill_id: {skill_id}
-owner: {owner}
-collaborators: {collaborators_str}
-project: studyabroad-v1
-version: 1.0.0
-when_to_use: {metadata.get('when_to_use', 'As needed')}
-dependencies: {metadata.get('dependencies', '[]')}
----
+    frontmatter = ''.join(f"{key}: {values[key]}\n" for key in FRONTMATTER_KEYS)
+    return f"---\n{frontmatter}---\n\n{body}"
 
-"""
 
-    return frontmatter + actual_content
+def generate_skill_file_content(skill_id: str, content: str, project: str = DEFAULT_PROJECT,
+                                overrides: Optional[Dict[str, str]] = None,
+                                registry: Optional[SkillRegistry] = None) -> str:
+    """
+    Generate the complete SKILL.md file content with proper YAML frontmatter.
+    """
+    fields, body = render_skill_parts(skill_id, content, registry)
+    return format_skill_file(fields, body, project, overrides)
+
+
+def _hash_text(text: str) -> str:
+    """SHA-256 hex digest of a UTF-8 string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def skill_source_hash(skill_id: str, rel_path: str, content: str, project: str = DEFAULT_PROJECT,
+                      overrides: Optional[Dict[str, str]] = None,
+                      registry: Optional[SkillRegistry] = None) -> str:
+    """Hash every input that generate_skill_file_content() depends on."""
+    collaborators, collaboration_rules = get_skill_collaborators(skill_id, registry)
+    return _hash_text('\0'.join([
+        skill_id,
+        rel_path,
+        get_skill_owner(skill_id, registry),
+        ','.join(collaborators),
+        collaboration_rules,
+        project,
+        json.dumps(overrides or {}, sort_keys=True),
+        content,
+    ]))
+
+
+def _remove_quietly(path: str) -> None:
+    """Remove a file, ignoring errors (used to clean up temp files)."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _fsync_directory(directory: str) -> None:
+    """fsync a directory so renames inside it are durable (POSIX only)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _sync_file_data(fd: int) -> None:
+    """Flush a file's data to disk (fdatasync where available, skipping metadata)."""
+    if hasattr(os, 'fdatasync'):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+
+def _default_file_mode() -> int:
+    """File mode a plain open(path, 'w') would create under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+class AtomicTreeWriter:
+    """
+    Stage file writes and publish them with atomic renames.
+
+    write_text() stages content in a temp file next to its destination,
+    fsyncing the file's data while it is still open. commit() renames each
+    temp file over its target and then fsyncs every touched directory once,
+    instead of once per rename. publish_text() writes and renames straight
+    away, so worker threads can publish their own files; their directories
+    are fsynced on commit() with the rest. Readers see either the old or the
+    new file, never a truncated one. Safe to call from worker threads.
+    """
+
+    def __init__(self, durable: bool = True):
+        self.durable = durable
+        self._mode = _default_file_mode()
+        self._staged: List[Tuple[str, str]] = []
+        self._directories: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def write_text(self, path, text: str) -> None:
+        """Stage text for path; it becomes visible on commit()."""
+        self.write_bytes(path, text.encode('utf-8'))
+
+    def write_bytes(self, path, data: bytes) -> None:
+        """Stage data for path; it becomes visible on commit()."""
+        path = os.fspath(path)
+        tmp_path = self._write_temp(path, data)
+        with self._lock:
+            self._staged.append((tmp_path, path))
+
+    def publish_text(self, path, text: str) -> None:
+        """Write text to path right away; its directory is fsynced on commit()."""
+        self.publish_bytes(path, text.encode('utf-8'))
+
+    def publish_bytes(self, path, data: bytes) -> None:
+        """Write data to path right away; its directory is fsynced on commit()."""
+        path = os.fspath(path)
+        tmp_path = self._write_temp(path, data)
+        try:
+            os.replace(tmp_path, path)
+        except BaseException:
+            _remove_quietly(tmp_path)
+            raise
+        with self._lock:
+            self._directories[os.path.dirname(path) or '.'] = True
+
+    def _write_temp(self, path: str, data: bytes) -> str:
+        """Write data to a temp file next to path and return the temp file's path."""
+        directory = os.path.dirname(path) or '.'
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                if self.durable:
+                    f.flush()
+                    _sync_file_data(f.fileno())
+            os.chmod(tmp_path, self._mode)
+        except BaseException:
+            _remove_quietly(tmp_path)
+            raise
+        profiler = active_profiler()
+        profiler.count('bytes_written', len(data))
+        profiler.count('files_written')
+        return tmp_path
+
+    def commit(self) -> List[str]:
+        """
+        Publish all staged writes and fsync the directories of every file
+        staged or published since the last commit.
+
+        Returns: list of error messages for files that could not be renamed
+        """
+        with self._lock:
+            staged, self._staged = self._staged, []
+            directories, self._directories = self._directories, {}
+
+        errors = []
+        for tmp_path, path in staged:
+            try:
+                os.replace(tmp_path, path)
+                directories[os.path.dirname(path) or '.'] = True
+            except OSError as e:
+                errors.append(f"Error writing {path}: {e}")
+                _remove_quietly(tmp_path)
+
+        if self.durable:
+            for directory in directories:
+                _fsync_directory(directory)
+        return errors
+
+    def discard(self) -> None:
+        """Drop all staged writes without touching their destinations (published files stay)."""
+        with self._lock:
+            staged, self._staged = self._staged, []
+            self._directories = {}
+        for tmp_path, _ in staged:
+            _remove_quietly(tmp_path)
+
+
+def stage_tree(skills_dir: str) -> str:
+    """
+    Create a sibling staging copy of skills_dir for --swap-tree runs.
+
+    Existing files are copied across so that incremental runs and skills
+    without content keep their current output.
 
+    Returns: path of the staging directory
+    """
+    real_dir = os.path.realpath(skills_dir)
+    parent = os.path.dirname(real_dir)
+    os.makedirs(parent, exist_ok=True)
+    staged_dir = tempfile.mkdtemp(dir=parent, prefix=f".{os.path.basename(real_dir)}.staging-")
+    if os.path.isdir(real_dir):
+        # copytree() also carries the directory mode over from real_dir
+        shutil.copytree(real_dir, staged_dir, symlinks=True, dirs_exist_ok=True)
+    else:
+        os.chmod(staged_dir, _default_file_mode() | 0o111)
+    return staged_dir
 
-def populate_skill_files(content_dir: str, skills_dir: str, dry_run: bool = False) -> Tuple[int, int, List[str]]:
+
+def swap_tree(staged_dir: str, skills_dir: str) -> None:
+    """
+    Switch a fully written staging directory in as skills_dir.
+
+    When skills_dir is a symlink it is repointed with a single atomic rename.
+    Otherwise the old tree is renamed aside and the staged tree renamed into
+    place: readers may briefly find no directory, but never a partial tree.
+    """
+    _fsync_directory(staged_dir)
+
+    if os.path.islink(skills_dir):
+        old_target = os.path.realpath(skills_dir)
+        tmp_link = f"{staged_dir}.link"
+        os.symlink(staged_dir, tmp_link)
+        os.replace(tmp_link, skills_dir)
+        _fsync_directory(os.path.dirname(os.path.abspath(skills_dir)))
+        shutil.rmtree(old_target, ignore_errors=True)
+        return
+
+    old_dir = None
+    if os.path.isdir(skills_dir):
+        old_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(skills_dir)),
+                                   prefix=f".{os.path.basename(skills_dir)}.old-")
+        os.replace(skills_dir, old_dir)
+    os.replace(staged_dir, skills_dir)
+    _fsync_directory(os.path.dirname(os.path.abspath(skills_dir)))
+    if old_dir:
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def load_manifest(skills_dir: str) -> Dict[str, Dict[str, str]]:
+    """
+    Load the incremental manifest from skills_dir.
+
+    Returns an empty mapping when the manifest is missing, unreadable or was
+    written by a different GENERATOR_VERSION, forcing a full regeneration.
+    """
+    manifest_path = Path(skills_dir) / MANIFEST_FILENAME
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if manifest.get('generator_version') != GENERATOR_VERSION:
+        return {}
+    return manifest.get('skills', {})
+
+
+def save_manifest(skills_dir: str, entries: Dict[str, Dict[str, str]],
+                  writer: AtomicTreeWriter) -> None:
+    """Stage the incremental manifest for skills_dir on writer."""
+    manifest_path = Path(skills_dir) / MANIFEST_FILENAME
+    manifest = {
+        'generator_version': GENERATOR_VERSION,
+        'skills': entries,
+    }
+    _write_if_changed(writer, manifest_path, json.dumps(manifest, indent=2, sort_keys=True) + '\n')
+
+
+def _output_matches(full_path: Path, output_hash: str) -> bool:
+    """Check that a previously written SKILL.md is still on disk, unmodified."""
+    try:
+        with open(full_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        return False
+    profiler = active_profiler()
+    if profiler.enabled:
+        profiler.count('bytes_read', len(text.encode('utf-8')))
+        profiler.count('files_read')
+    return _hash_text(text) == output_hash
+
+
+def _write_if_changed(writer: AtomicTreeWriter, path: Path, text: str) -> None:
+    """Stage text for path unless the file already holds exactly that text."""
+    if not _output_matches(path, _hash_text(text)):
+        writer.write_text(path, text)
+
+
+class PopulateTarget(NamedTuple):
+    """One project skills tree to render in batch mode."""
+    project: str
+    skills_dir: str
+    overrides: Dict[str, str]
+
+
+def load_targets(targets_file: str) -> List[PopulateTarget]:
+    """
+    Load batch targets from a JSON file of the form:
+
+        [
+          {"project": "studyabroad-v1", "skills_dir": "~/projects/studyabroad-v1/skills"},
+          {"project": "other", "skills_dir": "~/projects/other/skills",
+           "overrides": {"version": "2.0.0"}}
+        ]
+
+    Overrides replace SKILL.md frontmatter fields for that target only.
+    Raises ValueError on malformed entries.
+    """
+    with open(os.path.expanduser(targets_file), 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    if not isinstance(entries, list):
+        raise ValueError("targets file must contain a JSON list")
+
+    targets = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or 'skills_dir' not in entry:
+            raise ValueError(f"target #{i + 1}: expected an object with 'skills_dir'")
+        overrides = entry.get('overrides') or {}
+        unknown = set(overrides) - set(FRONTMATTER_KEYS)
+        if unknown:
+            raise ValueError(f"target #{i + 1}: unknown override field(s): {', '.join(sorted(unknown))}")
+        targets.append(PopulateTarget(
+            project=entry.get('project', DEFAULT_PROJECT),
+            skills_dir=os.path.expanduser(entry['skills_dir']),
+            overrides={key: str(value) for key, value in overrides.items()},
+        ))
+    return targets
+
+
+def _populate_one(skill_id: str, content: str, skills_path: Path, dry_run: bool,
+                  incremental: bool, previous: Dict[str, Dict[str, str]],
+                  project: str, overrides: Optional[Dict[str, str]],
+                  render_cache: Dict[str, Tuple[Dict[str, str], str]],
+                  writer: AtomicTreeWriter, registry: SkillRegistry
+                  ) -> Tuple[str, str, Optional[Dict[str, str]]]:
+    """
+    Render a single skill and publish it through writer. Safe to run from worker threads.
+
+    render_skill_parts() results are memoised in render_cache so that batch
+    runs render each skill once, however many targets they write.
+
+    Returns: (status, message, manifest_entry) where status is one of
+    'written', 'unchanged' or 'error'.
+    """
+    record = registry.get(skill_id)
+    if record is None or not record.path:
+        return 'error', f"Unknown skill ID: {skill_id}", None
+
+    rel_path = record.path
+    full_path = skills_path / rel_path.replace('skills/', '')
+
+    source_hash = None
+    if incremental:
+        source_hash = skill_source_hash(skill_id, rel_path, content, project, overrides, registry)
+        entry = previous.get(skill_id)
+        if (entry and entry.get('source_hash') == source_hash
+                and _output_matches(full_path, entry.get('output_hash', ''))):
+            return 'unchanged', '', entry
+
+    # Generate the file content
+    parts = render_cache.get(skill_id)
+    if parts is None:
+        parts = render_cache[skill_id] = render_skill_parts(skill_id, content, registry)
+    file_content = format_skill_file(parts[0], parts[1], project, overrides)
+    entry = None
+    if incremental:
+        entry = {
+            'path': rel_path,
+            'source_hash': source_hash,
+            'output_hash': _hash_text(file_content),
+        }
+
+    if dry_run:
+        return 'written', f"Would write: {full_path} ({len(file_content)} bytes)", None
+
+    try:
+        # Ensure directory exists
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        writer.publish_text(full_path, file_content)
+    except Exception as e:
+        return 'error', f"Error writing {skill_id}: {e}", None
+    return 'written', f"✓ {skill_id}: {rel_path}", entry
+
+
+def populate_skill_files(content_dir: str, skills_dir: str, dry_run: bool = False,
+                         incremental: bool = False, jobs: int = 1,
+                         project: str = DEFAULT_PROJECT,
+                         overrides: Optional[Dict[str, str]] = None,
+                         durable: bool = True) -> Tuple[int, int, List[str]]:
     """
     Populate skill files with content from the master documents.
-    
+
     Returns: (success_count, skip_count, errors)
     """
-    skills_content = parse_content_files(content_dir)
+    skills_content, registry = load_content_library(content_dir)
+    return populate_skill_tree(skills_content, skills_dir, dry_run=dry_run,
+                               incremental=incremental, jobs=jobs,
+                               project=project, overrides=overrides, durable=durable,
+                               registry=registry)
+
+
+def build_dependency_graph(registry: SkillRegistry) -> SkillGraph:
+    """Build the skill dependency graph from the registry's dependencies fields."""
+    return build_graph((record.skill_id, record.dependencies) for record in registry)
+
+
+def library_artifacts(registry: SkillRegistry, graph: Optional[SkillGraph] = None) -> Dict[str, str]:
+    """
+    Serialize the per-library artifacts written next to every skills tree.
+
+    Returns: mapping of file name (relative to the skills dir) to content
+    """
+    if graph is None:
+        graph = build_dependency_graph(registry)
+    return {
+        REGISTRY_FILENAME: registry_to_json(registry),
+        GRAPH_FILENAME: graph_to_json(graph),
+    }
+
+
+def populate_skill_tree(skills_content: Dict[str, str], skills_dir: str, dry_run: bool = False,
+                        incremental: bool = False, jobs: int = 1,
+                        project: str = DEFAULT_PROJECT,
+                        overrides: Optional[Dict[str, str]] = None,
+                        render_cache: Optional[Dict[str, Tuple[Dict[str, str], str]]] = None,
+                        durable: bool = True,
+                        registry: Optional[SkillRegistry] = None,
+                        artifacts: Optional[Dict[str, str]] = None,
+                        only: Optional[Set[str]] = None
+                        ) -> Tuple[int, int, List[str]]:
+    """
+    Write one skills tree from already-parsed skill content.
+
+    Files are staged and published through an AtomicTreeWriter, so readers
+    never observe a partially written SKILL.md. The library artifacts
+    (registry cache and dependency graph, see library_artifacts()) are
+    written at the root of the tree.
+
+    In incremental mode, skills whose inputs hash the same as in the manifest
+    (and whose output file is untouched) are neither regenerated nor rewritten.
+
+    With jobs > 1, rendering and writing run on a pool of worker threads.
+    Results are collected in content-library order, so log lines and the
+    error list are identical to a serial run.
+
+    With `only`, skills_content holds just the selected skills (see
+    load_content_selection()); files and manifest entries of every other
+    skill are left as they are.
     
+    Returns: (success_count, skip_count, errors)
+    """
     print(f"\nFound content for {len(skills_content)} skills")
     
     success_count = 0
@@ -404,36 +1261,67 @@ def populate_skill_files(content_dir: str, skills_dir: str, dry_run: bool = Fals
     errors = []
     
     skills_path = Path(skills_dir)
-    
-    for skill_id, content in skills_content.items():
-        if skill_id not in SKILL_PATHS:
-            errors.append(f"Unknown skill ID: {skill_id}")
-            continue
-        
-        rel_path = SKILL_PATHS[skill_id]
-        full_path = skills_path / rel_path.replace('skills/', '')
-        
-        # Ensure directory exists
-        if not dry_run:
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Generate the file content
-        file_content = generate_skill_file_content(skill_id, content)
-        
-        if dry_run:
-            print(f"Would write: {full_path} ({len(file_content)} bytes)")
-            success_count += 1
+
+    if render_cache is None:
+        render_cache = {}
+    if registry is None:
+        registry = DEFAULT_REGISTRY
+    previous = load_manifest(skills_dir) if incremental else {}
+    writer = AtomicTreeWriter(durable=durable)
+    manifest = {}
+    if only is not None:
+        manifest = {skill_id: entry for skill_id, entry in previous.items() if skill_id not in only}
+    changed_count = 0
+    unchanged_count = 0
+
+    profiler = active_profiler()
+
+    def work(item: Tuple[str, str]) -> Tuple[str, str, Optional[Dict[str, str]]]:
+        with profiler.span(item[0]):
+            return _populate_one(item[0], item[1], skills_path, dry_run, incremental, previous,
+                                 project, overrides, render_cache, writer, registry)
+
+    with profiler.stage('render', project=project, jobs=jobs):
+        if jobs > 1:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(work, skills_content.items()))
         else:
-            try:
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(file_content)
-                print(f"✓ {skill_id}: {rel_path}")
-                success_count += 1
-            except Exception as e:
-                errors.append(f"Error writing {skill_id}: {e}")
+            results = map(work, skills_content.items())
+
+        for skill_id, (status, message, entry) in zip(skills_content, results):
+            if status == 'error':
+                errors.append(message)
+                continue
+
+            success_count += 1
+            if status == 'unchanged':
+                unchanged_count += 1
+            else:
+                changed_count += 1
+                print(message)
+            if entry is not None:
+                manifest[skill_id] = entry
+
+    if incremental:
+        stale = sorted(skill_id for skill_id in previous
+                       if skill_id not in skills_content and (only is None or skill_id in only))
+        print(f"\nIncremental: {changed_count} changed, {unchanged_count} unchanged, "
+              f"{len(stale)} stale")
+        for skill_id in stale:
+            print(f"  - stale: {skill_id} (no longer in content library)")
+
+    with profiler.stage('commit', project=project):
+        if not dry_run:
+            if incremental:
+                save_manifest(skills_dir, manifest, writer)
+            if artifacts is None:
+                artifacts = library_artifacts(registry)
+            for filename, text in artifacts.items():
+                _write_if_changed(writer, skills_path / filename, text)
+        errors.extend(writer.commit())
     
     # Report skills without content
-    missing = set(SKILL_PATHS.keys()) - set(skills_content.keys())
+    missing = (set(registry.skills) if only is None else only) - set(skills_content.keys())
     if missing:
         print(f"\nSkills without detailed content ({len(missing)}):")
         for skill_id in sorted(missing):
@@ -443,16 +1331,458 @@ def populate_skill_files(content_dir: str, skills_dir: str, dry_run: bool = Fals
     return success_count, skip_count, errors
 
 
-def create_placeholder_for_missing(skills_dir: str) -> int:
-    """Create placeholder files for any skills without content.
+def populate_batch(skills_content: Dict[str, str], registry: SkillRegistry,
+                   targets: List[PopulateTarget], dry_run: bool = False,
+                   incremental: bool = False, jobs: int = 1,
+                   create_placeholders: bool = False, durable: bool = True,
+                   swap: bool = False, bundle: bool = False,
+                   search_index: bool = False, section_toc: bool = False,
+                   context_packs: bool = False,
+                   only: Optional[Set[str]] = None) -> Tuple[int, int, int, List[str]]:
+    """
+    Populate several project skills trees from one parse of the content library
+    (as returned by load_content_library()).
+
+    Rendered skill bodies are shared between targets; only per-project
+    frontmatter fields are substituted when each tree is written.
+
+    With swap=True each tree is built in a sibling staging directory and
+    switched in with swap_tree() once complete. A tree whose population
+    reported errors is discarded and the existing tree left in place.
+
+    With bundle=True each finished tree is also packed into BUNDLE_FILENAME,
+    with search_index=True its SEARCH_INDEX_FILENAME is brought up to date,
+    with section_toc=True a section table (SECTIONS_FILENAME) is written, and
+    with context_packs=True per-agent packs are written under PACKS_DIRNAME.
+
+    With `only`, just the selected skills are populated (and given
+    placeholders); the whole-tree outputs still cover every skill.
+
+    Returns: (success_count, skip_count, placeholder_count, errors) summed
+    over all targets, with errors prefixed by the target's project name.
+    """
+    render_cache = {}
+    profiler = active_profiler()
+
+    # Library artifacts are identical for every target; serialize them once
+    with profiler.stage('graph'):
+        graph = build_dependency_graph(registry)
+        artifacts = library_artifacts(registry, graph)
+    problems = describe_problems(graph)
+    if problems:
+        print(f"\nDependency graph warnings ({len(problems)}):")
+        for problem in problems:
+            print(f"  ⚠️  {problem}")
+
+    success_total = skip_total = placeholder_total = 0
+    errors = []
+    for target in targets:
+        if len(targets) > 1:
+            print(f"\n--- {target.project}: {target.skills_dir}")
+
+        work_dir = target.skills_dir
+        staged_dir = None
+        if swap and not dry_run:
+            with profiler.stage('stage_tree', project=target.project):
+                staged_dir = work_dir = stage_tree(target.skills_dir)
+
+        success, skipped, target_errors = populate_skill_tree(
+            skills_content,
+            work_dir,
+            dry_run=dry_run,
+            incremental=incremental,
+            jobs=jobs,
+            project=target.project,
+            overrides=target.overrides,
+            render_cache=render_cache,
+            durable=durable,
+            registry=registry,
+            artifacts=artifacts,
+            only=only,
+        )
+        success_total += success
+        skip_total += skipped
+
+        if create_placeholders and not dry_run:
+            print("\nCreating placeholder files...")
+            try:
+                with profiler.stage('placeholders', project=target.project):
+                    placeholder_total += create_placeholder_for_missing(
+                        work_dir, target.project, target.overrides, durable=durable,
+                        registry=registry, only=only)
+            except OSError as e:
+                target_errors.append(f"Error creating placeholders: {e}")
+
+        if not dry_run:
+            target_errors += write_tree_indexes(work_dir, registry, target.project, durable=durable,
+                                                bundle=bundle, search_index=search_index,
+                                                section_toc=section_toc, context_packs=context_packs)
+
+        if staged_dir:
+            if target_errors:
+                shutil.rmtree(staged_dir, ignore_errors=True)
+                target_errors.append(f"Tree not swapped in; {target.skills_dir} left unchanged")
+            else:
+                with profiler.stage('swap_tree', project=target.project):
+                    swap_tree(staged_dir, target.skills_dir)
+                print(f"\nSwapped in new tree: {target.skills_dir}")
+
+        if len(targets) > 1:
+            errors.extend(f"[{target.project}] {error}" for error in target_errors)
+        else:
+            errors.extend(target_errors)
+
+    return success_total, skip_total, placeholder_total, errors
+
+
+def write_tree_indexes(skills_dir: str, registry: SkillRegistry, project: str,
+                       durable: bool = True, bundle: bool = False,
+                       search_index: bool = False, section_toc: bool = False,
+                       context_packs: bool = False) -> List[str]:
+    """
+    Bring the optional whole-tree outputs of a finished skills tree up to date:
+    the skill bundle, the search index, the section table and the agent
+    context packs.
+
+    Returns: list of error messages
+    """
+    profiler = active_profiler()
+    errors = []
+
+    if bundle:
+        try:
+            with profiler.stage('bundle', project=project):
+                bundled = write_skill_bundle(skills_dir, registry, durable=durable)
+            print(f"\nBundled {bundled} skills into {BUNDLE_FILENAME}")
+        except OSError as e:
+            errors.append(f"Error writing skill bundle: {e}")
+
+    if search_index:
+        try:
+            with profiler.stage('search_index', project=project):
+                changed, unchanged, removed = write_search_index(skills_dir, registry, durable=durable)
+            print(f"\nSearch index: {changed} re-indexed, {unchanged} unchanged, {removed} removed")
+        except OSError as e:
+            errors.append(f"Error writing search index: {e}")
+
+    if section_toc:
+        try:
+            with profiler.stage('section_toc', project=project):
+                indexed = write_section_toc(skills_dir, registry, durable=durable)
+            print(f"\nSection table: {indexed} skills in {SECTIONS_FILENAME}")
+        except OSError as e:
+            errors.append(f"Error writing section table: {e}")
+
+    if context_packs:
+        try:
+            with profiler.stage('context_packs', project=project):
+                built, unchanged = write_context_packs(skills_dir, registry, durable=durable)
+            print(f"\nContext packs: {built} rebuilt, {unchanged} unchanged in {PACKS_DIRNAME}/")
+        except OSError as e:
+            errors.append(f"Error writing context packs: {e}")
+
+    return errors
+
+
+def repopulate_skills(library: ContentLibrary, skill_ids: Iterable[str],
+                      targets: List[PopulateTarget], registry_changed: bool = False,
+                      incremental: bool = False, durable: bool = True,
+                      bundle: bool = False, search_index: bool = False,
+                      section_toc: bool = False, context_packs: bool = False) -> Tuple[int, List[str]]:
+    """
+    Rewrite only the given skills in every target tree.
+
+    Used by --watch after ContentLibrary.refresh(). Skills no longer in the
+    library keep their file (as in a full run) but leave the manifest. The
+    library artifacts are rewritten only when the registry changed.
+
+    Returns: (files written, errors)
+    """
+    registry = library.registry
+    skill_ids = sorted(skill_ids)
+    artifacts = library_artifacts(registry) if registry_changed else {}
+    render_cache = {}
+    written = 0
+    errors = []
+
+    for target in targets:
+        skills_path = Path(target.skills_dir)
+        writer = AtomicTreeWriter(durable=durable)
+        manifest = load_manifest(target.skills_dir) if incremental else {}
+        target_errors = []
+
+        for skill_id in skill_ids:
+            content = library.skills_content.get(skill_id)
+            if content is None:
+                manifest.pop(skill_id, None)
+                continue
+            status, message, entry = _populate_one(
+                skill_id, content, skills_path, False, incremental, {},
+                target.project, target.overrides, render_cache, writer, registry)
+            if status == 'error':
+                target_errors.append(message)
+                continue
+            written += 1
+            print(f"  {message}")
+            if entry is not None:
+                manifest[skill_id] = entry
+
+        if incremental:
+            save_manifest(target.skills_dir, manifest, writer)
+        for filename, text in artifacts.items():
+            _write_if_changed(writer, skills_path / filename, text)
+        target_errors += writer.commit()
+        target_errors += write_tree_indexes(target.skills_dir, registry, target.project,
+                                            durable=durable, bundle=bundle,
+                                            search_index=search_index, section_toc=section_toc,
+                                            context_packs=context_packs)
+
+        if len(targets) > 1:
+            errors.extend(f"[{target.project}] {error}" for error in target_errors)
+        else:
+            errors.extend(target_errors)
+
+    return written, errors
+
+
+def watch_library(library: ContentLibrary, targets: List[PopulateTarget],
+                  incremental: bool = False, durable: bool = True,
+                  bundle: bool = False, search_index: bool = False,
+                  section_toc: bool = False, context_packs: bool = False,
+                  debounce: float = DEFAULT_DEBOUNCE) -> None:
+    """
+    Re-populate changed skills whenever a content file is saved. Runs until interrupted.
+    """
+    with DirectoryWatcher(library.content_dir, is_content_file) as watcher:
+        print(f"\nWatching {library.content_dir} for changes ({watcher.backend}); press Ctrl-C to stop")
+        for names in watcher.changes(debounce):
+            start = time.perf_counter()
+            try:
+                changed, reparsed, registry_changed = library.refresh(names)
+            except DECOMPRESSION_ERRORS as e:
+                print(f"\nWarning: Cannot read content library ({e}); waiting for the next save")
+                continue
+
+            print(f"\n[{time.strftime('%H:%M:%S')}] {', '.join(sorted(names))}: "
+                  f"{reparsed} block(s) re-parsed, {len(changed)} skill(s) changed")
+            if not changed and not registry_changed:
+                continue
+            written, errors = repopulate_skills(
+                library, changed, targets, registry_changed=registry_changed,
+                incremental=incremental, durable=durable, bundle=bundle,
+                search_index=search_index, section_toc=section_toc, context_packs=context_packs)
+            print(f"Updated {written} file(s) in {(time.perf_counter() - start) * 1000:.0f} ms")
+            for error in errors:
+                print(f"  - {error}")
+
+
+def read_skill_files(skills_dir: str, registry: SkillRegistry) -> Iterator[Tuple[str, str, str]]:
+    """
+    Read the finished SKILL.md files of a tree.
+
+    Yields (skill_id, rel_path, text) in registry order, skipping skills
+    that have no file on disk.
+    """
+    skills_path = Path(skills_dir)
+    profiler = active_profiler()
+    for record in registry:
+        if not record.path:
+            continue
+        full_path = skills_path / record.path.replace('skills/', '')
+        try:
+            with open(full_path, 'r', encoding='utf-8') as f:
+                if profiler.enabled:
+                    profiler.count('bytes_read', os.fstat(f.fileno()).st_size)
+                    profiler.count('files_read')
+                text = f.read()
+        except FileNotFoundError:
+            continue
+        yield record.skill_id, record.path, text
+
+
+def _publish_if_changed(path: Path, data: bytes, durable: bool) -> None:
+    """Atomically replace path with data unless it already holds exactly that."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return
+    except OSError:
+        pass
+
+    writer = AtomicTreeWriter(durable=durable)
+    writer.write_bytes(path, data)
+    errors = writer.commit()
+    if errors:
+        raise OSError('; '.join(errors))
+
+
+def write_skill_bundle(skills_dir: str, registry: SkillRegistry, durable: bool = True) -> int:
+    """
+    Pack every SKILL.md in skills_dir into a single bundle file (BUNDLE_FILENAME).
+
+    Reads the finished tree, so it covers skills skipped by incremental runs
+    and placeholders alike. The bundle is left untouched when unchanged.
+
+    Returns: number of skills in the bundle
+    """
+    entries = list(read_skill_files(skills_dir, registry))
+    _publish_if_changed(Path(skills_dir) / BUNDLE_FILENAME, pack_bundle(entries), durable)
+    return len(entries)
+
+
+def write_search_index(skills_dir: str, registry: SkillRegistry,
+                       durable: bool = True) -> Tuple[int, int, int]:
+    """
+    Update the full-text search index (SEARCH_INDEX_FILENAME) of a skills tree.
+
+    An existing index is updated in place: only skills whose SKILL.md text
+    changed are re-tokenized.
+
+    Returns: (changed, unchanged, removed) skill counts
+    """
+    index_path = Path(skills_dir) / SEARCH_INDEX_FILENAME
+    try:
+        index = load_index(str(index_path))
+    except (OSError, ValueError):
+        index = SearchIndex()
+
+    counts = index.update((skill_id, text) for skill_id, _, text in read_skill_files(skills_dir, registry))
+    if counts[0] or counts[2] or not index_path.exists():
+        _publish_if_changed(index_path, index_to_json(index).encode('utf-8'), durable)
+    return counts
+
+
+def write_section_toc(skills_dir: str, registry: SkillRegistry, durable: bool = True) -> int:
+    """
+    Write the section table of contents (SECTIONS_FILENAME) of a skills tree.
+
+    Records the byte range of each SKILL.md's frontmatter and headings so
+    skill_sections.SectionReader can read single sections without loading
+    whole files, plus each file's size and mtime so the reader can tell
+    when the table is stale. Left untouched when unchanged.
+
+    Returns: number of skills in the table
+    """
+    skills_path = Path(skills_dir)
+    profiler = active_profiler()
+    tocs = {}
+    for record in registry:
+        if not record.path:
+            continue
+        try:
+            with open(skills_path / record.path.replace('skills/', ''), 'rb') as f:
+                # Stat before reading: an edit racing the read leaves the entry stale, not wrong
+                stat = os.fstat(f.fileno())
+                data = f.read()
+        except FileNotFoundError:
+            continue
+        if profiler.enabled:
+            profiler.count('bytes_read', len(data))
+            profiler.count('files_read')
+        toc = compute_toc(data)
+        toc['mtime_ns'] = stat.st_mtime_ns
+        toc['path'] = record.path.replace('skills/', '')
+        tocs[record.skill_id] = toc
+    _publish_if_changed(Path(skills_dir) / SECTIONS_FILENAME, toc_to_json(tocs).encode('utf-8'), durable)
+    return len(tocs)
+
+
+def write_context_packs(skills_dir: str, registry: SkillRegistry,
+                        durable: bool = True) -> Tuple[int, int]:
+    """
+    Write one context pack per agent (see skill_packs.py) under PACKS_DIRNAME.
+
+    A pack holds the agent's definition (agents/<agent>/agent.yaml next to
+    the skills tree, when present) and its owned and collaborating skills.
+    Packs are keyed by the path (relative to the skills tree's parent) and
+    content hash of every member file, kept in PACK_INDEX_FILENAME, so a
+    pack is only rebuilt when one of its member skills or its definition
+    changed, not when a run merely rewrote them.
+
+    Returns: (packs rebuilt, packs unchanged)
+    """
+    skills_path = Path(skills_dir)
+    packs_path = skills_path / PACKS_DIRNAME
+    agents_path = skills_path.resolve().parent / 'agents'
+    index_path = packs_path / PACK_INDEX_FILENAME
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+    if previous.get('format') != PACK_FORMAT:
+        previous = {}
+
+    # skill_id -> (path relative to the tree's parent, text); read once per run
+    files = {}
+    for record in registry:
+        if not record.path:
+            continue
+        try:
+            text = (skills_path / record.path.replace('skills/', '')).read_text(encoding='utf-8')
+        except OSError:
+            continue
+        files[record.skill_id] = (record.path, text)
+    hashes = {skill_id: _hash_text(text) for skill_id, (_, text) in files.items()}
+
+    agents = list(registry.by_owner) + [agent for agent in registry.by_collaborator
+                                        if agent not in registry.by_owner]
+    packs = {}
+    built = unchanged = 0
+    for agent in agents:
+        owned = [skill_id for skill_id in registry.owned_by(agent) if skill_id in files]
+        shared = [skill_id for skill_id in registry.collaborating(agent)
+                  if skill_id in files and skill_id not in owned]
+        try:
+            definition = (agents_path / agent / 'agent.yaml').read_text(encoding='utf-8')
+        except OSError:
+            definition = None
+        members = [[files[skill_id][0], hashes[skill_id]] for skill_id in owned + shared]
+        if definition is not None:
+            members.append([f"agents/{agent}/agent.yaml", _hash_text(definition)])
+        key = _hash_text(json.dumps([owned, shared, members]))
+        packs[agent] = key
+        if previous.get('packs', {}).get(agent) == key and (packs_path / f"{agent}.json").exists():
+            unchanged += 1
+            continue
+
+        pack = build_pack(agent, definition,
+                          [(skill_id, files[skill_id][1]) for skill_id in owned],
+                          [(skill_id, files[skill_id][1]) for skill_id in shared])
+        packs_path.mkdir(parents=True, exist_ok=True)
+        _publish_if_changed(packs_path / f"{agent}.json", pack_to_json(pack).encode('utf-8'), durable)
+        built += 1
+
+    for stale in set(previous.get('packs', {})) - set(packs):
+        _remove_quietly(str(packs_path / f"{stale}.json"))
+    if packs and previous.get('packs') != packs:
+        packs_path.mkdir(parents=True, exist_ok=True)
+        index = json.dumps({'format': PACK_FORMAT, 'packs': packs}, indent=2, sort_keys=True) + '\n'
+        _publish_if_changed(index_path, index.encode('utf-8'), durable)
+    return built, unchanged
+
+
+def create_placeholder_for_missing(skills_dir: str, project: str = DEFAULT_PROJECT,
+                                   overrides: Optional[Dict[str, str]] = None,
+                                   durable: bool = True,
+                                   registry: Optional[SkillRegistry] = None,
+                                   only: Optional[Set[str]] = None) -> int:
+    """Create placeholder files for any skills without content (of `only`, if given).
 
     Uses the ownership pattern with owner, collaborators, and collaboration_rules.
+    Files are published atomically; raises OSError if any could not be written.
     """
     count = 0
     skills_path = Path(skills_dir)
+    writer = AtomicTreeWriter(durable=durable)
 
-    for skill_id, rel_path in SKILL_PATHS.items():
-        full_path = skills_path / rel_path.replace('skills/', '')
+    registry = registry or DEFAULT_REGISTRY
+
+    for record in registry:
+        if not record.path or (only is not None and record.skill_id not in only):
+            continue
+        skill_id = record.skill_id
+        full_path = skills_path / record.path.replace('skills/', '')
 
         if not full_path.exists():
             full_path.parent.mkdir(parents=True, exist_ok=True)
@@ -461,8 +1791,8 @@ def create_placeholder_for_missing(skills_dir: str) -> int:
             name = full_path.parent.name.replace('-', ' ').title()
 
             # Get ownership information
-            owner = get_skill_owner(skill_id)
-            collaborators, collaboration_rules = get_skill_collaborators(skill_id)
+            owner = get_skill_owner(skill_id, registry)
+            collaborators, collaboration_rules = get_skill_collaborators(skill_id, registry)
             collaborators_str = str(collaborators) if collaborators else "[]"
 
             # Build ownership section content
@@ -478,19 +1808,19 @@ def create_placeholder_for_missing(skills_dir: str) -> int:
 - **Collaborators:** None
 - **Delegation Rules:** This skill is not typically invoked by other agents."""
 
-            placeholder = f"""---
-name: {name}
-description: {name} skill for {owner} agent
-skill_id: {skill_id}
-owner: {owner}
-collaborators: {collaborators_str}
-project: studyabroad-v1
-version: 1.0.0
-when_to_use: TBD
-dependencies: []
----
+            fields = {
+                'name': name,
+                'description': f"{name} skill for {owner} agent",
+                'skill_id': skill_id,
+                'owner': owner,
+                'collaborators': collaborators_str,
+                'version': SKILL_VERSION,
+                'when_to_use': 'TBD',
+                'dependencies': '[]',
+            }
 
-# {name}
+            title = DEFAULT_PROJECT_TITLE if project == DEFAULT_PROJECT else project
+            body = f"""# {name}
 
 ## Purpose
 [To be documented]
@@ -522,7 +1852,7 @@ dependencies: []
 |--------|------|-------------|
 | TBD | TBD | TBD |
 
-## StudyAbroad-Specific Considerations
+## {title}-Specific Considerations
 - [To be documented]
 
 ## Integration Points
@@ -534,22 +1864,26 @@ dependencies: []
 ## Validation
 - [Validation criteria to be defined]
 """
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(placeholder)
+            placeholder = format_skill_file(fields, body, project, overrides)
+            writer.write_text(full_path, placeholder)
             print(f"Created placeholder: {skill_id}")
             count += 1
 
+    errors = writer.commit()
+    if errors:
+        raise OSError('; '.join(errors))
     return count
 
 
-def verify_ownership_config() -> None:
+def verify_ownership_config(registry: Optional[SkillRegistry] = None) -> None:
     """Verify the ownership configuration is complete and consistent."""
+    registry = registry or DEFAULT_REGISTRY
     print("\nOwnership Configuration Verification:")
     print("-" * 40)
 
     # Check all skill prefixes are mapped
-    all_prefixes = set(skill_id.split('-')[0] for skill_id in SKILL_PATHS.keys())
-    mapped_prefixes = set(SKILL_OWNERS.keys())
+    all_prefixes = set(registry.by_prefix)
+    mapped_prefixes = set(registry.owners)
 
     missing_prefixes = all_prefixes - mapped_prefixes
     if missing_prefixes:
@@ -558,11 +1892,11 @@ def verify_ownership_config() -> None:
         print(f"  ✓ All {len(mapped_prefixes)} skill prefixes have owner mappings")
 
     # Report cross-cutting skills
-    print(f"  ✓ {len(CROSS_CUTTING_SKILLS)} cross-cutting skills configured:")
-    for skill_id, info in CROSS_CUTTING_SKILLS.items():
-        owner = get_skill_owner(skill_id)
-        collabs = ', '.join(info['collaborators'])
-        print(f"      {skill_id}: {owner} → [{collabs}]")
+    cross_cutting = registry.cross_cutting()
+    print(f"  ✓ {len(cross_cutting)} cross-cutting skills configured:")
+    for record in cross_cutting:
+        collabs = ', '.join(record.collaborators)
+        print(f"      {record.skill_id}: {record.owner} → [{collabs}]")
 
 
 def main():
@@ -576,14 +1910,94 @@ def main():
     )
     parser.add_argument(
         '--skills-dir',
-        required=True,
         help='Target directory for skill files (e.g., ~/projects/studyabroad-v1/skills)'
     )
+    parser.add_argument(
+        '--project',
+        default=DEFAULT_PROJECT,
+        help=f'Project name written into skill frontmatter (default: {DEFAULT_PROJECT})'
+    )
+    parser.add_argument(
+        '--targets',
+        metavar='FILE',
+        help='JSON list of {project, skills_dir, overrides} targets to populate from one parse'
+    )
     parser.add_argument(
         '--dry-run',
         action='store_true',
         help='Show what would be done without making changes'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help=f'Skip skills whose content is unchanged since the last run (tracked in {MANIFEST_FILENAME})'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Render and write skill files on N worker threads (default: 1)'
+    )
+    parser.add_argument(
+        '--swap-tree',
+        action='store_true',
+        help='Build each skills tree in a sibling directory and switch it in once complete'
+    )
+    parser.add_argument(
+        '--bundle',
+        action='store_true',
+        help=f'Also pack each skills tree into a single {BUNDLE_FILENAME} file for fast agent startup'
+    )
+    parser.add_argument(
+        '--search-index',
+        action='store_true',
+        help=f'Also maintain a full-text search index ({SEARCH_INDEX_FILENAME}) over each skills tree'
+    )
+    parser.add_argument(
+        '--section-toc',
+        action='store_true',
+        help=f'Also write a section table of contents ({SECTIONS_FILENAME}) for section-level loading'
+    )
+    parser.add_argument(
+        '--context-packs',
+        action='store_true',
+        help=f'Also write a prebuilt context pack per agent ({PACKS_DIRNAME}/) with token-budgeted variants'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='After populating, keep running and re-populate skills whose content blocks change'
+    )
+    parser.add_argument(
+        '--only',
+        metavar='PREFIXES',
+        help='Populate only skills with these comma-separated ID prefixes (e.g. SEC,DEV)'
+    )
+    parser.add_argument(
+        '--owner',
+        metavar='OWNERS',
+        help='Populate only skills owned by these comma-separated agents (e.g. security)'
+    )
+    parser.add_argument(
+        '--write-shards',
+        metavar='DIR',
+        help=f'Split the content library into one file per skill ID prefix plus {SHARD_INDEX_FILENAME} '
+             f'in DIR, then exit'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const=DEFAULT_TRACE_FILENAME,
+        metavar='TRACE',
+        help=f'Record per-stage and per-skill timings; print a summary and write a Chrome trace '
+             f'to TRACE (default: {DEFAULT_TRACE_FILENAME}; also enabled by {PROFILE_ENV})'
+    )
+    parser.add_argument(
+        '--no-fsync',
+        action='store_true',
+        help='Skip syncing written files to disk (faster, not crash-safe)'
+    )
     parser.add_argument(
         '--create-placeholders',
         action='store_true',
@@ -596,50 +2010,134 @@ def main():
     )
     
     args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.write_shards and (args.skills_dir or args.targets):
+        parser.error('--write-shards cannot be combined with --skills-dir or --targets')
+    if not args.skills_dir and not args.targets and not args.write_shards:
+        parser.error('one of --skills-dir, --targets or --write-shards is required')
+    if args.skills_dir and args.targets:
+        parser.error('--skills-dir and --targets are mutually exclusive')
+    if args.watch and args.dry_run:
+        parser.error('--watch cannot be combined with --dry-run')
+    if args.watch and (args.only or args.owner):
+        parser.error('--watch cannot be combined with --only or --owner')
+
+    prefixes = [prefix.strip().upper() for prefix in (args.only or '').split(',') if prefix.strip()]
+    owners = [owner.strip().lower() for owner in (args.owner or '').split(',') if owner.strip()]
+    owners = [owner[:-len('-agent')] if owner.endswith('-agent') else owner for owner in owners]
+    if (args.only is not None or args.owner is not None) and not (prefixes or owners):
+        parser.error('--only/--owner need at least one prefix or owner')
     
     # Expand paths
     content_dir = os.path.expanduser(args.content_dir)
-    skills_dir = os.path.expanduser(args.skills_dir)
+    if args.targets:
+        try:
+            targets = load_targets(args.targets)
+        except (OSError, ValueError) as e:
+            print(f"Error: Invalid targets file {args.targets}: {e}")
+            sys.exit(1)
+    elif args.skills_dir:
+        targets = [PopulateTarget(args.project, os.path.expanduser(args.skills_dir), {})]
+    else:
+        targets = []
     
     # Validate directories
     if not os.path.isdir(content_dir):
         print(f"Error: Content directory not found: {content_dir}")
         sys.exit(1)
+
+    if args.write_shards:
+        shard_dir = os.path.expanduser(args.write_shards)
+        try:
+            written = write_content_shards(content_dir, shard_dir)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot write shards: {e}")
+            sys.exit(1)
+        for name, count in sorted(written.items()):
+            print(f"  {name}: {count} skills")
+        print(f"Wrote {len(written)} shard(s) and {SHARD_INDEX_FILENAME} to {shard_dir}")
+        return 0
     
-    if not os.path.isdir(skills_dir):
-        if args.dry_run:
-            print(f"Warning: Skills directory not found (dry-run): {skills_dir}")
-        else:
-            print(f"Creating skills directory: {skills_dir}")
-            os.makedirs(skills_dir, exist_ok=True)
+    for target in targets:
+        if not os.path.isdir(target.skills_dir):
+            if args.dry_run:
+                print(f"Warning: Skills directory not found (dry-run): {target.skills_dir}")
+            else:
+                print(f"Creating skills directory: {target.skills_dir}")
+                os.makedirs(target.skills_dir, exist_ok=True)
     
+    trace_path = args.profile or trace_path_from_env()
+    profiler = start_profiling() if trace_path else None
+
+    # Parse the content library once; it also supplies the skill registry.
+    # Watch mode keeps it in memory so that later saves only re-parse the
+    # blocks that changed.
+    library = None
+    only = None
+    try:
+        if args.watch:
+            library = ContentLibrary(content_dir)
+            skills_content, registry = library.skills_content, library.registry
+        elif prefixes or owners:
+            skills_content, registry, selected = load_content_selection(content_dir, prefixes, owners)
+            only = set(selected)
+        else:
+            skills_content, registry = load_content_library(content_dir)
+    except DECOMPRESSION_ERRORS as e:
+        print(f"Error: Cannot read content library: {e}")
+        sys.exit(1)
+
+    unknown = [f"prefix {prefix}" for prefix in prefixes if not registry.with_prefix(prefix)]
+    unknown += [f"owner {owner}" for owner in owners if not registry.owned_by(owner)]
+    if unknown:
+        print(f"Error: No skills match {', '.join(unknown)} "
+              f"(prefixes: {', '.join(registry.by_prefix)}; owners: {', '.join(registry.by_owner)})")
+        sys.exit(1)
+
     print("=" * 60)
     print("Skill Content Population Script")
     print("=" * 60)
     print(f"Content directory: {content_dir}")
-    print(f"Skills directory:  {skills_dir}")
-    print(f"Total skills:      {len(SKILL_PATHS)}")
-    print(f"Cross-cutting:     {len(CROSS_CUTTING_SKILLS)}")
+    if args.targets:
+        print(f"Targets:           {len(targets)} (from {args.targets})")
+    else:
+        print(f"Skills directory:  {targets[0].skills_dir}")
+        print(f"Project:           {targets[0].project}")
+    print(f"Total skills:      {len(registry)}")
+    print(f"Cross-cutting:     {len(registry.cross_cutting())}")
     print(f"Dry run:           {args.dry_run}")
+    print(f"Incremental:       {args.incremental}")
+    print(f"Jobs:              {args.jobs}")
+    print(f"Swap tree:         {args.swap_tree}")
+    if only is not None:
+        print(f"Selected skills:   {len(only)} ({', '.join(prefixes + owners)})")
     print("=" * 60)
 
     # Verify ownership configuration if requested
     if args.verify_ownership:
-        verify_ownership_config()
-
-    # Populate skills
-    success, skipped, errors = populate_skill_files(
-        content_dir, 
-        skills_dir, 
-        dry_run=args.dry_run
+        verify_ownership_config(registry)
+
+    # Populate skills (and placeholders if requested); batch mode parses once
+    # and writes one tree per target
+    success, skipped, placeholders, errors = populate_batch(
+        skills_content,
+        registry,
+        targets,
+        dry_run=args.dry_run,
+        incremental=args.incremental,
+        jobs=args.jobs,
+        create_placeholders=args.create_placeholders,
+        durable=not args.no_fsync,
+        swap=args.swap_tree,
+        bundle=args.bundle,
+        search_index=args.search_index,
+        section_toc=args.section_toc,
+        context_packs=args.context_packs,
+        only=only
     )
     
-    # Create placeholders if requested
-    placeholders = 0
-    if args.create_placeholders and not args.dry_run:
-        print("\nCreating placeholder files...")
-        placeholders = create_placeholder_for_missing(skills_dir)
-    
     # Summary
     print("\n" + "=" * 60)
     print("SUMMARY")
@@ -647,15 +2145,12 @@ def main():
     print(f"Successfully populated: {success}")
     print(f"Skipped (no content):   {skipped}")
     print(f"Placeholders created:   {placeholders}")
-    print(f"Cross-cutting skills:   {len(CROSS_CUTTING_SKILLS)}")
+    print(f"Cross-cutting skills:   {len(registry.cross_cutting())}")
     print(f"Errors:                 {len(errors)}")
 
     # Ownership summary
     print("\nOwnership Distribution:")
-    owner_counts = {}
-    for skill_id in SKILL_PATHS.keys():
-        owner = get_skill_owner(skill_id)
-        owner_counts[owner] = owner_counts.get(owner, 0) + 1
+    owner_counts = {owner: len(skill_ids) for owner, skill_ids in registry.by_owner.items()}
     for owner, count in sorted(owner_counts.items(), key=lambda x: -x[1]):
         print(f"  {owner}: {count} skills")
 
@@ -666,6 +2161,24 @@ def main():
 
     print("=" * 60)
 
+    if profiler:
+        print("\nPROFILE")
+        print(profiler.summary())
+        try:
+            profiler.write_trace(trace_path)
+            print(f"\nTrace written to {trace_path}")
+        except OSError as e:
+            print(f"\nWarning: Cannot write trace {trace_path}: {e}")
+
+    if library is not None:
+        try:
+            watch_library(library, targets, incremental=args.incremental,
+                          durable=not args.no_fsync, bundle=args.bundle,
+                          search_index=args.search_index, section_toc=args.section_toc,
+                          context_packs=args.context_packs)
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+
     return 0 if not errors else 1
 
 
@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Verify SDLC Framework Setup
+
+Checks one or more project trees: framework directories and key files,
+the BMAD installation, agent definitions and the skills and BMAD personas
+wired into them, and every skills/**/SKILL.md. Each skill's frontmatter
+is schema-checked and cross-checked against the skill registry (ID, path,
+owner and collaborators); registered skills without a file and files
+without a registered skill are reported too.
+
+Usage:
+    python3 scripts/verify-setup.py                      # current directory
+    python3 scripts/verify-setup.py projects/*           # many project trees
+    python3 scripts/verify-setup.py --quiet --jobs 16 projects/*
+
+Each project is walked once with os.scandir. SKILL.md checks run on a
+thread pool, and their results are cached in skills/.skill-verify-cache.json
+keyed by (size, mtime, sha256): unchanged files are not even read on the
+next run, and touched-but-identical files are only hashed.
+
+The registry is read from the project's skills/.skill-registry.json (written
+by populate-skills.py); without one, it is built from the content library
+next to this script, or from --registry.
+
+Exit status: 0 when all checks pass, 1 when any project has errors,
+2 when verification itself could not run.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Make the repository's modules (skill_registry, ...) importable
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from skill_frontmatter import parse_list_value, tokenize_frontmatter  # noqa: E402
+from skill_registry import REGISTRY_FILENAME, SkillRegistry  # noqa: E402
+
+CACHE_FILENAME = ".skill-verify-cache.json"
+CACHE_FORMAT = 1
+
+REQUIRED_DIRS = (".specify", ".bmad", ".bmad-core", ".ralph", ".sdlc", "agents", "skills", "docs", "config")
+REQUIRED_FILES = ("CLAUDE.md", ".specify/constitution.md", "config/spec-kit/workflow.yaml",
+                  "config/bmad/agent-mapping.yaml", ".ralph/config.yaml",
+                  "config/12-factors/factors.yaml")
+AGENTS = ("orchestrator", "requirements", "architecture", "design", "test-manager",
+          "developer", "security", "devops", "documentation", "operations")
+MIN_BMAD_PERSONAS = 8
+MIN_SKILL_FILES = 100
+
+# Frontmatter written by populate-skills.py (FRONTMATTER_KEYS there)
+REQUIRED_FIELDS = ('name', 'description', 'skill_id', 'owner', 'collaborators',
+                   'project', 'version', 'when_to_use', 'dependencies')
+LIST_FIELDS = ('collaborators', 'dependencies')
+SKILL_ID_RE = re.compile(r"^[A-Z]+-\d+$")
+VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
+# Directories never descended into by the project walk
+SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv'})
+
+
+class ProjectTree(NamedTuple):
+    """Result of the single scandir walk over a project."""
+    root: str
+    dirs: Set[str]
+    files: Set[str]
+    # relative SKILL.md path -> (size, mtime_ns)
+    skill_files: Dict[str, Tuple[int, int]]
+
+
+class FileResult(NamedTuple):
+    size: int
+    mtime_ns: int
+    sha256: str
+    skill_id: str
+    errors: List[str]
+    warnings: List[str]
+
+
+def walk_project(root: str) -> ProjectTree:
+    """Collect every directory, file and SKILL.md (with its stat) in one pass."""
+    dirs, files, skill_files = set(), set(), {}
+    pending = ['']
+    while pending:
+        rel_dir = pending.pop()
+        try:
+            entries = os.scandir(os.path.join(root, rel_dir))
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                # Symlinked directories are not walked, so a link back up the
+                # tree cannot loop; the exception is a top-level skills link,
+                # which populate-skills.py --swap-tree repoints.
+                if entry.is_dir(follow_symlinks=False) or (rel_path == 'skills' and entry.is_dir()):
+                    if entry.name not in SKIP_DIRS:
+                        dirs.add(rel_path)
+                        pending.append(rel_path)
+                elif entry.is_dir():
+                    dirs.add(rel_path)
+                elif entry.is_file():
+                    files.add(rel_path)
+                    if entry.name == 'SKILL.md' and rel_path.startswith('skills/'):
+                        stat = entry.stat()
+                        skill_files[rel_path] = (stat.st_size, stat.st_mtime_ns)
+    return ProjectTree(root, dirs, files, skill_files)
+
+
+def check_skill_text(rel_path: str, text: str, registry: SkillRegistry) -> Tuple[str, List[str], List[str]]:
+    """
+    Schema-check one SKILL.md and cross-check it against the registry.
+
+    Returns: (skill_id or '', errors, warnings)
+    """
+    if not text.startswith('---\n'):
+        return '', ["missing frontmatter"], []
+    end = text.find('\n---\n', 4)
+    if end == -1:
+        return '', ["unterminated frontmatter"], []
+
+    fields, _ = tokenize_frontmatter(text[4:end], table=None)
+    errors = [f"missing field: {field}" for field in REQUIRED_FIELDS if field not in fields]
+    warnings = []
+
+    for field in LIST_FIELDS:
+        value = fields.get(field)
+        if value is not None and not (value.startswith('[') and value.endswith(']')):
+            errors.append(f"{field} is not a list: {value!r}")
+    if 'version' in fields and not VERSION_RE.match(fields['version']):
+        errors.append(f"invalid version: {fields['version']!r}")
+
+    skill_id = fields.get('skill_id', '')
+    if not skill_id:
+        return '', errors, warnings
+    if not SKILL_ID_RE.match(skill_id):
+        errors.append(f"invalid skill_id: {skill_id!r}")
+
+    record = registry.get(skill_id)
+    if record is None:
+        errors.append(f"{skill_id} is not in the skill registry")
+        return skill_id, errors, warnings
+
+    if record.path and record.path != rel_path:
+        errors.append(f"{skill_id} belongs at {record.path}")
+    if 'owner' in fields and fields['owner'] != record.owner:
+        errors.append(f"owner is {fields['owner']!r}, registry says {record.owner!r}")
+    if 'collaborators' in fields:
+        collaborators = parse_list_value(fields['collaborators'])
+        if set(collaborators) != set(record.collaborators):
+            errors.append(f"collaborators are {collaborators}, registry says {list(record.collaborators)}")
+    for dependency in parse_list_value(fields.get('dependencies', '')):
+        if dependency not in registry:
+            warnings.append(f"depends on unknown skill {dependency}")
+    return skill_id, errors, warnings
+
+
+def _registry_digest(registry: SkillRegistry) -> str:
+    return hashlib.sha256(json.dumps(registry.to_dict(), sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def load_cache(tree: ProjectTree, registry_digest: str) -> Dict[str, FileResult]:
+    """Cached per-file results, or {} when missing or computed against another registry."""
+    try:
+        with open(os.path.join(tree.root, 'skills', CACHE_FILENAME), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('format') != CACHE_FORMAT or data.get('registry') != registry_digest:
+        return {}
+    return {rel_path: FileResult(*entry) for rel_path, entry in data.get('files', {}).items()}
+
+
+def save_cache(tree: ProjectTree, registry_digest: str, results: Dict[str, FileResult]) -> None:
+    """Write the cache next to the skills tree (best effort)."""
+    cache_path = os.path.join(tree.root, 'skills', CACHE_FILENAME)
+    data = json.dumps({
+        'format': CACHE_FORMAT,
+        'registry': registry_digest,
+        'files': {rel_path: list(result) for rel_path, result in sorted(results.items())},
+    }, separators=(',', ':')) + '\n'
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+
+
+def verify_skill_file(root: str, rel_path: str, stat: Tuple[int, int], registry: SkillRegistry,
+                      cached: Optional[FileResult]) -> FileResult:
+    """Check one SKILL.md, reusing the cached result when the file is unchanged."""
+    size, mtime_ns = stat
+    if cached is not None and cached.size == size and cached.mtime_ns == mtime_ns:
+        return cached
+    try:
+        with open(os.path.join(root, rel_path), 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        return FileResult(size, mtime_ns, '', '', [f"cannot read: {e}"], [])
+
+    digest = hashlib.sha256(data).hexdigest()
+    if cached is not None and cached.sha256 == digest:
+        return cached._replace(size=size, mtime_ns=mtime_ns)
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return FileResult(size, mtime_ns, digest, '', ["not valid UTF-8"], [])
+    skill_id, errors, warnings = check_skill_text(rel_path, text, registry)
+    return FileResult(size, mtime_ns, digest, skill_id, errors, warnings)
+
+
+# A check is (status, message): True passed, False failed (an error),
+# None a warning that does not fail verification
+Check = Tuple[Optional[bool], str]
+
+
+class ProjectReport(NamedTuple):
+    root: str
+    sections: List[Tuple[str, List[Check]]]
+    errors: List[str]
+    warnings: List[str]
+
+
+def _exists(path: str, found: Set[str]) -> Check:
+    return path in found, f"{path} {'exists' if path in found else 'missing'}"
+
+
+def _read_lines(root: str, rel_path: str) -> List[str]:
+    try:
+        with open(os.path.join(root, rel_path), encoding='utf-8', errors='replace') as f:
+            return f.read().splitlines()
+    except OSError:
+        return []
+
+
+def _count_after(lines: List[str], marker: str, context: int, needle: str) -> int:
+    """Lines containing needle in the context lines after each marker (grep -A | grep -c)."""
+    window: Set[int] = set()
+    for index, line in enumerate(lines):
+        if marker in line:
+            window.update(range(index, min(index + context + 1, len(lines))))
+    return sum(1 for index in window if needle in lines[index])
+
+
+def bmad_checks(tree: ProjectTree) -> List[Check]:
+    """The BMAD installation under .bmad-core."""
+    if '.bmad-core/agents' not in tree.dirs:
+        checks: List[Check] = [(False, ".bmad-core/agents not found - BMAD not installed")]
+    else:
+        personas = sum(1 for f in tree.files
+                       if f.startswith('.bmad-core/agents/') and f.endswith('.md') and f.count('/') == 2)
+        checks = [(True, f"Found {personas} BMAD agent personas"),
+                  (True, "BMAD agents installed") if personas >= MIN_BMAD_PERSONAS else
+                  (None, f"Expected {MIN_BMAD_PERSONAS}+ BMAD agents, found {personas}")]
+    manifest = '.bmad-core/install-manifest.yaml' in tree.files
+    checks.append((True, "BMAD install manifest found") if manifest else
+                  (None, "BMAD install manifest missing"))
+    return checks
+
+
+def wiring_checks(tree: ProjectTree) -> List[Tuple[str, List[Check]]]:
+    """Skills (superpowers) and BMAD personas wired into each agents/*/agent.yaml."""
+    skills: List[Check] = []
+    personas: List[Check] = []
+    bmad_wired = 0
+    for agent in AGENTS:
+        rel_path = f"agents/{agent}/agent.yaml"
+        if rel_path not in tree.files:
+            continue
+        lines = _read_lines(tree.root, rel_path)
+        wired = _count_after(lines, 'superpowers:', 20, '      - ')
+        skills.append((True, f"agents/{agent} has {wired} skills wired") if wired else
+                      (False, f"agents/{agent} has no skills wired"))
+        if not any('personas:' in line for line in lines):
+            personas.append((None, f"agents/{agent} uses old bmad.agents format (not personas)"))
+            continue
+        linked = _count_after(lines, 'bmad:', 10, 'file:')
+        if linked:
+            personas.append((True, f"agents/{agent} has {linked} BMAD persona(s) linked"))
+            bmad_wired += 1
+        else:
+            personas.append((None, f"agents/{agent} has personas key but no files linked"))
+
+    wired_agents = sum(1 for ok, _ in skills if ok)
+    skills.append((True, "All agents have skills wired") if wired_agents == len(AGENTS) else
+                  (None, f"Only {wired_agents}/{len(AGENTS)} agents have skills wired"))
+    personas.append((True, f"{bmad_wired}/{len(AGENTS)} agents have BMAD personas wired"))
+    return [("Checking skill wiring in agents", skills),
+            ("Checking BMAD persona wiring in agents", personas)]
+
+
+def structure_checks(tree: ProjectTree) -> List[Tuple[str, List[Check]]]:
+    """The directory, BMAD, key file and agent checks of the original shell script."""
+    return [
+        ("Checking directories", [_exists(d, tree.dirs) for d in REQUIRED_DIRS]),
+        ("Checking BMAD installation", bmad_checks(tree)),
+        ("Checking key files", [_exists(f, tree.files) for f in REQUIRED_FILES]),
+        ("Checking agent definitions", [_exists(f"agents/{a}", tree.dirs) for a in AGENTS]),
+    ]
+
+
+def skill_checks(tree: ProjectTree, registry: SkillRegistry,
+                 results: Dict[str, FileResult]) -> Tuple[List[str], List[str]]:
+    """Per-file results plus registry-wide checks (missing, duplicate skills)."""
+    errors, warnings = [], []
+    seen: Dict[str, str] = {}
+    for rel_path in sorted(results):
+        result = results[rel_path]
+        errors += [f"{rel_path}: {message}" for message in result.errors]
+        warnings += [f"{rel_path}: {message}" for message in result.warnings]
+        if result.skill_id:
+            if result.skill_id in seen:
+                errors.append(f"{rel_path}: duplicate {result.skill_id} (also in {seen[result.skill_id]})")
+            else:
+                seen[result.skill_id] = rel_path
+
+    for record in registry:
+        if record.path and record.skill_id not in seen and record.path not in results:
+            errors.append(f"{record.path}: missing SKILL.md for {record.skill_id}")
+    return errors, warnings
+
+
+class RegistrySource:
+    """Loads registries, sharing one instance between identical cache files."""
+
+    def __init__(self, registry_path: Optional[str], content_dir: str):
+        self.registry_path = registry_path
+        self.content_dir = content_dir
+        self._by_digest: Dict[str, Tuple[SkillRegistry, str]] = {}
+        self._fallback: Optional[Tuple[SkillRegistry, str]] = None
+
+    def for_project(self, root: str) -> Tuple[SkillRegistry, str]:
+        """(registry, digest) for a project tree."""
+        path = self.registry_path or os.path.join(root, 'skills', REGISTRY_FILENAME)
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            if self.registry_path:
+                raise
+            return self._library_registry()
+        key = hashlib.sha256(raw).hexdigest()
+        if key not in self._by_digest:
+            registry = SkillRegistry.from_dict(json.loads(raw))
+            self._by_digest[key] = (registry, _registry_digest(registry))
+        return self._by_digest[key]
+
+    def _library_registry(self) -> Tuple[SkillRegistry, str]:
+        """Registry built by populate-skills.py from the content library."""
+        if self._fallback is None:
+            spec = importlib.util.spec_from_file_location("populate_skills", REPO_ROOT / "populate-skills.py")
+            populate = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(populate)
+            with contextlib.redirect_stdout(io.StringIO()):
+                _, registry = populate.load_content_library(self.content_dir)
+            self._fallback = (registry, _registry_digest(registry))
+        return self._fallback
+
+
+def verify_projects(roots: List[str], registries: RegistrySource, jobs: int,
+                    use_cache: bool = True) -> List[ProjectReport]:
+    """Walk every project, check all changed SKILL.md files in parallel, and report."""
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        trees = list(pool.map(walk_project, roots))
+        contexts = []
+        work = []
+        for tree in trees:
+            registry, digest = registries.for_project(tree.root)
+            cache = load_cache(tree, digest) if use_cache else {}
+            contexts.append((tree, registry, digest, cache))
+            work += [(tree.root, rel_path, stat, registry, cache.get(rel_path))
+                     for rel_path, stat in tree.skill_files.items()]
+        checked = iter(pool.map(lambda args: verify_skill_file(*args), work))
+
+    reports = []
+    for tree, registry, digest, cache in contexts:
+        results = {rel_path: next(checked) for rel_path in tree.skill_files}
+        if use_cache and 'skills' in tree.dirs and results != cache:
+            save_cache(tree, digest, results)
+
+        skill_errors, skill_warnings = skill_checks(tree, registry, results)
+        count = len(tree.skill_files)
+        expected = sum(1 for record in registry if record.path)
+        skills = ("Checking skills", [
+            (count >= expected, f"Found {count} skill files (registry lists {expected})"),
+            (True, "Skills populated") if count >= MIN_SKILL_FILES else
+            (None, f"Expected ~{expected or MIN_SKILL_FILES} skills, found {count}"),
+            (not skill_errors, "Skill frontmatter matches the registry"),
+        ])
+        sections = structure_checks(tree) + [skills] + wiring_checks(tree)
+        # Skill file failures are counted per file by skill_checks; the
+        # skills section only summarises them
+        errors = [message for section in sections if section is not skills
+                  for ok, message in section[1] if ok is False]
+        warnings = [message for _, checks in sections for ok, message in checks if ok is None]
+        reports.append(ProjectReport(tree.root, sections, errors + skill_errors,
+                                     warnings + skill_warnings))
+    return reports
+
+
+def print_report(report: ProjectReport, quiet: bool) -> None:
+    if quiet:
+        for error in report.errors:
+            print(f"{report.root}: ❌ {error}")
+        return
+
+    print("=" * 40)
+    print(f"SDLC Framework Setup Verification: {report.root}")
+    print("=" * 40)
+    for number, (title, checks) in enumerate(report.sections, 1):
+        print(f"\n{number}. {title}...")
+        for ok, message in checks:
+            print(f"   {'⚠️ ' if ok is None else '✅' if ok else '❌'} {message}")
+
+    # Section warnings are printed above; per-file results follow the last section
+    for error in report.errors:
+        if error.startswith('skills/'):
+            print(f"   ❌ {error}")
+    for warning in report.warnings:
+        if warning.startswith('skills/'):
+            print(f"   ⚠️  {warning}")
+
+    print("\n" + "=" * 40)
+    if report.errors:
+        print(f"❌ Found {len(report.errors)} issues")
+    else:
+        print("✅ All checks passed!")
+    print("=" * 40)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Verify SDLC framework project setup')
+    parser.add_argument('projects', nargs='*', default=['.'], help='Project directories (default: .)')
+    parser.add_argument('--registry', help=f'Registry cache to check against (default: skills/{REGISTRY_FILENAME})')
+    parser.add_argument('--content-dir', default=str(REPO_ROOT),
+                        help='Content library used when a project has no registry cache')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 4, metavar='N',
+                        help='Worker threads (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help=f'Ignore and do not write {CACHE_FILENAME}')
+    parser.add_argument('--quiet', '-q', action='store_true', help='Only print failures, one per line')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    missing = [root for root in args.projects if not os.path.isdir(root)]
+    if missing:
+        print(f"Error: Not a directory: {', '.join(missing)}")
+        return 2
+
+    try:
+        reports = verify_projects(args.projects, RegistrySource(args.registry, args.content_dir),
+                                  args.jobs, use_cache=not args.no_cache)
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot load skill registry: {e}")
+        return 2
+
+    failed = [report for report in reports if report.errors]
+    if args.json:
+        print(json.dumps([{'project': report.root, 'ok': not report.errors,
+                           'errors': report.errors, 'warnings': report.warnings}
+                          for report in reports], indent=2))
+    elif len(reports) == 1:
+        print_report(reports[0], args.quiet)
+    else:
+        for report in reports:
+            if args.quiet:
+                print_report(report, quiet=True)
+            else:
+                status = f"❌ {len(report.errors)} issues" if report.errors else "✅ ok"
+                print(f"{status:<16} {report.root}")
+                for error in report.errors:
+                    print(f"    - {error}")
+        print(f"\n{len(reports) - len(failed)}/{len(reports)} projects passed")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
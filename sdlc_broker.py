@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+SDLC Agent Message Broker
+Routes inter-agent messages as defined in agents/PROTOCOL.md.
+
+Messages use the protocol envelope (from, to, type, priority, payload,
+context) and are validated on send. Each agent has a bounded priority
+mailbox: critical messages are received before high, medium and low ones,
+and senders wait when a mailbox is full. Escalations are routed by the
+protocol's rules in addition to `to`, based on payload["escalation"]:
+
+    blocker                     -> orchestrator
+    security                    -> security
+    requirement_clarification   -> requirements
+    architecture_decision       -> architecture
+
+In-process use:
+
+    broker = Broker()
+    developer = broker.register("developer")
+    response = await broker.request(Message.from_dict({
+        "from": "orchestrator", "to": "developer", "type": "request",
+        "priority": "high", "payload": {"action": "implement"},
+        "context": {"task_id": "T-1"}}))
+    # meanwhile, in the developer's task:
+    message = await developer.receive()
+    await broker.reply(message, {"status": "done"})
+
+Agents in other processes connect over a Unix socket, exchanging
+newline-delimited JSON frames:
+
+    python3 sdlc_broker.py serve --socket .sdlc/broker.sock
+    python3 sdlc_broker.py send --from developer --to orchestrator --type notification \\
+        --payload '{"escalation": "blocker", "reason": "spec missing"}'
+
+    client = await BrokerClient.connect(".sdlc/broker.sock", "developer")
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_SOCKET = os.path.join(".sdlc", "broker.sock")
+
+# Agent IDs from agents/*/agent.yaml, plus the human approver
+AGENT_IDS = ('orchestrator', 'requirements', 'architecture', 'design', 'test-manager',
+             'developer', 'security', 'devops', 'documentation', 'operations', 'human')
+
+MESSAGE_TYPES = frozenset({'request', 'response', 'notification'})
+
+# Lower rank is received first
+PRIORITIES = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+ESCALATION_RULES = {
+    'blocker': 'orchestrator',
+    'security': 'security',
+    'requirement_clarification': 'requirements',
+    'architecture_decision': 'architecture',
+}
+
+DEFAULT_MAILBOX_SIZE = 1000
+
+
+class ProtocolError(ValueError):
+    """A message that does not follow agents/PROTOCOL.md."""
+
+
+def normalize_agent_id(agent_id: str) -> str:
+    """'security-agent' and 'security' name the same agent."""
+    return agent_id[:-6] if agent_id.endswith('-agent') else agent_id
+
+
+class Message:
+    """A validated protocol envelope."""
+
+    __slots__ = ('sender', 'to', 'type', 'priority', 'payload', 'context')
+
+    def __init__(self, sender: str, to: str, type: str, priority: str = 'medium',
+                 payload: Optional[Dict] = None, context: Optional[Dict] = None):
+        self.sender = sender
+        self.to = to
+        self.type = type
+        self.priority = priority
+        self.payload = payload if payload is not None else {}
+        self.context = context if context is not None else {}
+
+    @classmethod
+    def from_dict(cls, data: Dict, agents=AGENT_IDS) -> 'Message':
+        """Build a message from its JSON form, raising ProtocolError if invalid."""
+        if not isinstance(data, dict):
+            raise ProtocolError("message must be an object")
+        sender, to = data.get('from'), data.get('to')
+        message_type = data.get('type')
+        priority = data.get('priority', 'medium')
+        payload = data.get('payload', {})
+        context = data.get('context', {})
+        for field, value in (('from', sender), ('to', to)):
+            if not isinstance(value, str) or normalize_agent_id(value) not in agents:
+                raise ProtocolError(f"'{field}' must be a known agent id, got {value!r}")
+        if message_type not in MESSAGE_TYPES:
+            raise ProtocolError(f"'type' must be one of {'|'.join(sorted(MESSAGE_TYPES))}, got {message_type!r}")
+        if priority not in PRIORITIES:
+            raise ProtocolError(f"'priority' must be one of {'|'.join(PRIORITIES)}, got {priority!r}")
+        if not isinstance(payload, dict):
+            raise ProtocolError("'payload' must be an object")
+        if not isinstance(context, dict):
+            raise ProtocolError("'context' must be an object")
+        for key in ('task_id', 'phase', 'requirement_id'):
+            if key in context and not isinstance(context[key], str):
+                raise ProtocolError(f"'context.{key}' must be a string")
+        if message_type != 'notification' and not context.get('task_id'):
+            raise ProtocolError(f"a {message_type} needs context.task_id for correlation")
+        escalation = payload.get('escalation')
+        if escalation is not None and escalation not in ESCALATION_RULES:
+            raise ProtocolError(f"unknown escalation {escalation!r} "
+                                f"(expected one of {', '.join(ESCALATION_RULES)})")
+        return cls(normalize_agent_id(sender), normalize_agent_id(to), message_type,
+                   priority, payload, context)
+
+    def to_dict(self) -> Dict:
+        return {'from': self.sender, 'to': self.to, 'type': self.type, 'priority': self.priority,
+                'payload': self.payload, 'context': self.context}
+
+    @property
+    def task_id(self) -> Optional[str]:
+        return self.context.get('task_id')
+
+    def __repr__(self) -> str:
+        return (f"Message({self.sender} -> {self.to}, {self.type}, {self.priority}, "
+                f"task_id={self.task_id!r})")
+
+
+class Mailbox:
+    """One agent's bounded priority queue."""
+
+    def __init__(self, agent_id: str, maxsize: int = DEFAULT_MAILBOX_SIZE):
+        self.agent_id = agent_id
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize)
+        self._seq = itertools.count()
+
+    async def put(self, message: Message) -> None:
+        # The sequence number keeps FIFO order within a priority
+        await self._queue.put((PRIORITIES[message.priority], next(self._seq), message))
+
+    async def receive(self) -> Message:
+        return (await self._queue.get())[2]
+
+    def receive_nowait(self) -> Message:
+        """Next message, raising asyncio.QueueEmpty if there is none."""
+        return self._queue.get_nowait()[2]
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Message:
+        return await self.receive()
+
+
+class Broker:
+    """
+    Routes messages to agent mailboxes.
+
+    Responses whose (to, task_id) matches a pending request() resolve that
+    request instead of being queued.
+    """
+
+    def __init__(self, agents=AGENT_IDS, mailbox_size: int = DEFAULT_MAILBOX_SIZE):
+        self.agents = frozenset(agents)
+        self.mailbox_size = mailbox_size
+        self.mailboxes: Dict[str, Mailbox] = {}
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        self.delivered: Dict[str, int] = {}
+
+    def register(self, agent_id: str) -> Mailbox:
+        """The agent's mailbox; messages sent before registration wait in it."""
+        agent_id = normalize_agent_id(agent_id)
+        if agent_id not in self.agents:
+            raise ProtocolError(f"unknown agent {agent_id!r}")
+        return self._mailbox(agent_id)
+
+    def _mailbox(self, agent_id: str) -> Mailbox:
+        mailbox = self.mailboxes.get(agent_id)
+        if mailbox is None:
+            mailbox = self.mailboxes[agent_id] = Mailbox(agent_id, self.mailbox_size)
+        return mailbox
+
+    def recipients(self, message: Message) -> List[str]:
+        """`to` plus the escalation target, if any."""
+        recipients = [message.to]
+        target = ESCALATION_RULES.get(message.payload.get('escalation'))
+        if target and target != message.to and target != message.sender:
+            recipients.append(target)
+        return recipients
+
+    async def send(self, message) -> List[str]:
+        """
+        Route a Message (or its dict form), waiting while a mailbox is full.
+
+        Returns: the agents it was delivered to
+        """
+        if not isinstance(message, Message):
+            message = Message.from_dict(message, self.agents)
+        if message.type == 'response' and message.task_id:
+            future = self._pending.pop((message.to, message.task_id), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+                self.delivered[message.to] = self.delivered.get(message.to, 0) + 1
+                return [message.to]
+
+        recipients = self.recipients(message)
+        for agent_id in recipients:
+            await self._mailbox(agent_id).put(message)
+            self.delivered[agent_id] = self.delivered.get(agent_id, 0) + 1
+        return recipients
+
+    async def request(self, message, timeout: Optional[float] = None) -> Message:
+        """Send a request and wait for the response with the same task_id."""
+        if not isinstance(message, Message):
+            message = Message.from_dict(message, self.agents)
+        if message.type != 'request':
+            raise ProtocolError("request() needs a message of type 'request'")
+        key = (message.sender, message.task_id)
+        if key in self._pending:
+            raise ProtocolError(f"{message.sender} already awaits a response for task {message.task_id!r}")
+        future = self._pending[key] = asyncio.get_running_loop().create_future()
+        try:
+            await self.send(message)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(key, None)
+
+    async def reply(self, request: Message, payload: Optional[Dict] = None,
+                    priority: Optional[str] = None) -> List[str]:
+        """Send the response to a request, correlated on its task_id."""
+        return await self.send(Message(request.to, request.sender, 'response',
+                                       priority or request.priority, payload or {},
+                                       dict(request.context)))
+
+
+# ---------------------------------------------------------------------------
+# Unix socket transport
+# ---------------------------------------------------------------------------
+#
+# Frames are JSON objects, one per line:
+#   client -> server  {"op": "register", "agent": ID}
+#                     {"op": "send", "message": {...}}
+#                     {"op": "request", "message": {...}}
+#   server -> client  {"op": "message", "message": {...}}
+#                     {"op": "error", "error": TEXT, "task_id": ID (for a failed request)}
+#
+# A "request" is routed like a send, and only the response correlated with
+# its task_id comes back on the connection; the connection does not take
+# over the sending agent's mailbox.
+
+def _frame(data: Dict) -> bytes:
+    return json.dumps(data, separators=(',', ':')).encode() + b'\n'
+
+
+class BrokerServer:
+    """Serves a Broker to agents in other processes over a Unix socket."""
+
+    def __init__(self, broker: Broker, path: str = DEFAULT_SOCKET):
+        self.broker = broker
+        self.path = path
+        self._server = None
+
+    async def start(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path,
+                                                       limit=1 << 20)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def _forward(self, mailbox: Mailbox, writer: asyncio.StreamWriter) -> None:
+        while True:
+            message = await mailbox.receive()
+            writer.write(_frame({'op': 'message', 'message': message.to_dict()}))
+            # Batch frames while more are queued; drain applies backpressure
+            if mailbox.qsize() == 0:
+                await writer.drain()
+
+    async def _request(self, data: Any, writer: asyncio.StreamWriter) -> None:
+        """Route a request frame's message and write its response back to this connection."""
+        context = data.get('context') if isinstance(data, dict) else None
+        task_id = context.get('task_id') if isinstance(context, dict) else None
+        try:
+            response = await self.broker.request(data)
+            writer.write(_frame({'op': 'message', 'message': response.to_dict()}))
+        except ProtocolError as e:
+            writer.write(_frame({'op': 'error', 'error': str(e), 'task_id': task_id}))
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        forwarder = None
+        requests = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    frame = json.loads(line)
+                    op = frame.get('op')
+                    if op == 'send':
+                        await self.broker.send(frame.get('message'))
+                    elif op == 'request':
+                        task = asyncio.ensure_future(self._request(frame.get('message'), writer))
+                        requests.add(task)
+                        task.add_done_callback(requests.discard)
+                    elif op == 'register' and forwarder is None:
+                        mailbox = self.broker.register(str(frame.get('agent')))
+                        forwarder = asyncio.ensure_future(self._forward(mailbox, writer))
+                    else:
+                        raise ProtocolError(f"unexpected op {op!r}")
+                except (ValueError, AttributeError) as e:
+                    writer.write(_frame({'op': 'error', 'error': str(e)}))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if forwarder is not None:
+                forwarder.cancel()
+            for task in requests:
+                task.cancel()
+            writer.close()
+
+
+class BrokerClient:
+    """An agent's connection to a BrokerServer."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, agent_id: Optional[str]):
+        self.agent_id = agent_id
+        self._reader = reader
+        self._writer = writer
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._receiver = asyncio.ensure_future(self._receive_loop())
+
+    @classmethod
+    async def connect(cls, path: str = DEFAULT_SOCKET, agent_id: Optional[str] = None) -> 'BrokerClient':
+        """Connect, registering as agent_id to receive its messages (send-only if None)."""
+        reader, writer = await asyncio.open_unix_connection(path, limit=1 << 20)
+        client = cls(reader, writer, agent_id and normalize_agent_id(agent_id))
+        if agent_id:
+            writer.write(_frame({'op': 'register', 'agent': agent_id}))
+            await writer.drain()
+        return client
+
+    async def _receive_loop(self) -> None:
+        while True:
+            try:
+                line = await self._reader.readline()
+            except (ConnectionError, ValueError) as e:
+                self._fail(ConnectionError(f"broker connection failed: {e}"))
+                return
+            if not line:
+                self._fail(ConnectionError("broker closed the connection"))
+                return
+            try:
+                frame = json.loads(line)
+                if frame.get('op') == 'error':
+                    error = ProtocolError(frame.get('error'))
+                    future = self._pending.pop(frame.get('task_id'), None)
+                    if future is not None and not future.done():
+                        future.set_exception(error)
+                    else:
+                        self._inbox.put_nowait(error)
+                    continue
+                message = Message.from_dict(frame['message'])
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                # The frame cannot be matched to a request, so every waiter hears about it
+                self._fail(ProtocolError(f"invalid frame from broker: {e}"))
+                continue
+            future = self._pending.pop(message.task_id, None) if message.type == 'response' else None
+            if future is not None and not future.done():
+                future.set_result(message)
+            else:
+                self._inbox.put_nowait(message)
+
+    def _fail(self, error: Exception) -> None:
+        """Raise error in every pending request() and in the next receive()."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._inbox.put_nowait(error)
+
+    async def send(self, message, drain: bool = True) -> None:
+        if isinstance(message, Message):
+            message = message.to_dict()
+        self._writer.write(_frame({'op': 'send', 'message': message}))
+        if drain:
+            await self._writer.drain()
+
+    async def receive(self) -> Message:
+        """Next message for this agent; raises errors reported by the broker."""
+        item = await self._inbox.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def request(self, message: Message, timeout: Optional[float] = None) -> Message:
+        """
+        Send a request and wait for the response with the same task_id.
+
+        The response comes back on this connection whether or not it is
+        registered as an agent.
+        """
+        future = self._pending[message.task_id] = asyncio.get_running_loop().create_future()
+        try:
+            self._writer.write(_frame({'op': 'request', 'message': message.to_dict()}))
+            await self._writer.drain()
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            if self._pending.get(message.task_id) is future:
+                del self._pending[message.task_id]
+
+    async def reply(self, request: Message, payload: Optional[Dict] = None) -> None:
+        await self.send(Message(request.to, request.sender, 'response', request.priority,
+                                payload or {}, dict(request.context)))
+
+    async def close(self) -> None:
+        self._receiver.cancel()
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+def _parse_json_object(value: str) -> Any:
+    try:
+        data = json.loads(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid JSON: {e}")
+    if not isinstance(data, dict):
+        raise argparse.ArgumentTypeError("expected a JSON object")
+    return data
+
+
+async def _serve(path: str, mailbox_size: int) -> None:
+    server = BrokerServer(Broker(mailbox_size=mailbox_size), path)
+    await server.start()
+    print(f"✅ Broker listening on {path}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+async def _send(args) -> None:
+    context = {key: value for key, value in (('task_id', args.task_id), ('phase', args.phase),
+                                            ('requirement_id', args.requirement_id)) if value}
+    message = Message.from_dict({'from': args.sender, 'to': args.to, 'type': args.type,
+                                 'priority': args.priority, 'payload': args.payload,
+                                 'context': context})
+    # Send-only: registering as the sender would take over its mailbox
+    client = await BrokerClient.connect(args.socket)
+    try:
+        if args.wait:
+            response = await client.request(message, timeout=args.wait)
+            print(json.dumps(response.to_dict(), indent=2))
+        else:
+            await client.send(message)
+    finally:
+        await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inter-agent message broker (agents/PROTOCOL.md)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help='Run the broker on a Unix socket')
+    serve.add_argument('--socket', default=DEFAULT_SOCKET, help=f'Socket path (default: {DEFAULT_SOCKET})')
+    serve.add_argument('--mailbox-size', type=int, default=DEFAULT_MAILBOX_SIZE,
+                       help=f'Messages queued per agent before senders wait (default: {DEFAULT_MAILBOX_SIZE})')
+
+    send = commands.add_parser('send', help='Send one message through a running broker')
+    send.add_argument('--socket', default=DEFAULT_SOCKET, help=f'Socket path (default: {DEFAULT_SOCKET})')
+    send.add_argument('--from', dest='sender', required=True, help='Sending agent id')
+    send.add_argument('--to', required=True, help='Receiving agent id')
+    send.add_argument('--type', choices=sorted(MESSAGE_TYPES), default='notification')
+    send.add_argument('--priority', choices=list(PRIORITIES), default='medium')
+    send.add_argument('--payload', type=_parse_json_object, default={}, help='Payload as a JSON object')
+    send.add_argument('--task-id', help='context.task_id')
+    send.add_argument('--phase', help='context.phase')
+    send.add_argument('--requirement-id', help='context.requirement_id')
+    send.add_argument('--wait', type=float, metavar='SECONDS',
+                      help='Send as a request and print the response (waits up to SECONDS)')
+
+    args = parser.parse_args()
+    try:
+        if args.command == 'serve':
+            asyncio.run(_serve(args.socket, args.mailbox_size))
+        else:
+            if args.wait:
+                args.type = 'request'
+            asyncio.run(_send(args))
+    except KeyboardInterrupt:
+        return 0
+    except ProtocolError as e:
+        print(f"Error: {e}")
+        return 1
+    except (OSError, asyncio.TimeoutError) as e:
+        print(f"Error: {e or 'timed out waiting for a response'}")
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+12 Factors Enforcement Engine
+Evaluates config/12-factors/enforcement.yaml rules for a trigger event.
+
+Rule conditions are parsed once into compiled predicates and indexed by
+trigger, so a hook only evaluates the rules for its own event:
+
+    python3 sdlc_enforcement.py implementation_start
+    python3 sdlc_enforcement.py code_change --base origin/main
+    python3 sdlc_enforcement.py phase_transition --fact gate_validation_passed=true
+
+    from sdlc_enforcement import Snapshot, load_rules
+    rules = load_rules("config/12-factors/enforcement.yaml")
+    for result in rules.evaluate("pull_request", Snapshot(".")):
+        print(result.action, result.message)
+
+Condition syntax: fact names, `exists(path)`, `changed(glob)`, `true`,
+`false`, `!`, `&&`, `||` and parentheses. Facts and file lookups come from a
+Snapshot of the project taken per trigger event: every exists() path is
+stat'ed at most once and git is only run if a condition needs the changed
+file list, which is then computed once.
+
+Built-in facts (explicit --fact values take precedence):
+    changes_<area>             a changed file matches the area's globs
+                               (CHANGE_FACTS, extendable with a top-level
+                               `change_facts:` mapping in the config)
+    has_requirement_reference  a REQ-NNN ID in the branch name or commit messages
+    gate_validation_passed     .sdlc/workflow-state.json lists the current
+                               phase in gates_passed
+
+The parsed rules are cached in .sdlc/enforcement-rules.json, keyed by the
+config file's size and mtime, so hooks do not need to parse YAML at all.
+The config is read with sdlc_yaml, so PyYAML is optional.
+
+Exit status: 0 when nothing blocks, 1 when a `block` or `require_approval`
+rule fired, 2 when the rules could not be loaded or evaluated.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from sdlc_yaml import load_yaml
+
+DEFAULT_CONFIG = os.path.join("config", "12-factors", "enforcement.yaml")
+CACHE_PATH = os.path.join(".sdlc", "enforcement-rules.json")
+CACHE_FORMAT = 1
+
+# Actions that make a hook fail
+BLOCKING_ACTIONS = frozenset({'block', 'require_approval'})
+
+# Globs (matched against project-relative paths) behind the changes_* facts
+CHANGE_FACTS: Dict[str, List[str]] = {
+    'changes_auth_code': ['*auth*', '*login*', '*session*', '*password*', '*token*',
+                          '*permission*', '*oauth*', '*jwt*'],
+    'changes_data_handling': ['*model*', '*schema*', '*migration*', '*repositor*',
+                              '*/db/*', '*/data/*', '*.sql', '*serializ*', '*/pii/*'],
+}
+
+REQUIREMENT_ID_RE = re.compile(r"\bREQ-\d+\b")
+
+
+class RuleError(Exception):
+    """A condition that cannot be parsed or evaluated."""
+
+
+Predicate = Callable[['Snapshot'], bool]
+
+
+# ---------------------------------------------------------------------------
+# Condition compiler
+# ---------------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(r"\s*(&&|\|\||!|\(|\)|[^\s()!&|]+)")
+
+
+def _tokenize(condition: str) -> List[str]:
+    tokens = []
+    pos = 0
+    condition = condition.rstrip()
+    while pos < len(condition):
+        match = _TOKEN_RE.match(condition, pos)
+        if not match:
+            raise RuleError(f"unexpected character at {pos} in {condition!r}")
+        tokens.append(match.group(1))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser turning a condition into nested closures."""
+
+    def __init__(self, condition: str):
+        self.condition = condition
+        self.tokens = _tokenize(condition)
+        self.pos = 0
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _take(self, expected: Optional[str] = None) -> str:
+        token = self._peek()
+        if token is None or (expected is not None and token != expected):
+            raise RuleError(f"expected {expected or 'a term'} in {self.condition!r}")
+        self.pos += 1
+        return token
+
+    def parse(self) -> Predicate:
+        predicate = self._or()
+        if self._peek() is not None:
+            raise RuleError(f"unexpected {self._peek()!r} in {self.condition!r}")
+        return predicate
+
+    def _or(self) -> Predicate:
+        terms = [self._and()]
+        while self._peek() == '||':
+            self._take()
+            terms.append(self._and())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda snapshot: any(term(snapshot) for term in terms)
+
+    def _and(self) -> Predicate:
+        terms = [self._unary()]
+        while self._peek() == '&&':
+            self._take()
+            terms.append(self._unary())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda snapshot: all(term(snapshot) for term in terms)
+
+    def _unary(self) -> Predicate:
+        if self._peek() == '!':
+            self._take()
+            operand = self._unary()
+            return lambda snapshot: not operand(snapshot)
+        return self._primary()
+
+    def _primary(self) -> Predicate:
+        token = self._take()
+        if token == '(':
+            predicate = self._or()
+            self._take(')')
+            return predicate
+        if token in ('&&', '||', ')'):
+            raise RuleError(f"unexpected {token!r} in {self.condition!r}")
+        if token == 'true':
+            return lambda snapshot: True
+        if token == 'false':
+            return lambda snapshot: False
+
+        if self._peek() == '(':
+            self._take()
+            argument = self._take()
+            self._take(')')
+            if token == 'exists':
+                return lambda snapshot: snapshot.exists(argument)
+            if token == 'changed':
+                return lambda snapshot: snapshot.changed(argument)
+            raise RuleError(f"unknown function {token}() in {self.condition!r}")
+
+        if not re.match(r"^[A-Za-z_]\w*$", token):
+            raise RuleError(f"invalid fact name {token!r} in {self.condition!r}")
+        return lambda snapshot: snapshot.fact(token)
+
+
+def compile_condition(condition: str) -> Predicate:
+    """Compile a condition string into a predicate over a Snapshot."""
+    return _Parser(str(condition)).parse()
+
+
+# ---------------------------------------------------------------------------
+# Project snapshot
+# ---------------------------------------------------------------------------
+
+def _git(root: str, *args: str) -> str:
+    try:
+        result = subprocess.run(['git', '-C', root, *args], capture_output=True,
+                                text=True, check=False)
+    except OSError:
+        return ''
+    return result.stdout if result.returncode == 0 else ''
+
+
+class Snapshot:
+    """
+    Memoized view of a project for one trigger event.
+
+    changed_files defaults to files changed against `base` (committed) plus
+    uncommitted and untracked files, read from git on first use.
+    """
+
+    def __init__(self, root: str = '.', base: Optional[str] = None,
+                 facts: Optional[Dict[str, bool]] = None,
+                 changed_files: Optional[Iterable[str]] = None,
+                 change_facts: Optional[Dict[str, List[str]]] = None):
+        self.root = root
+        self.base = base
+        self.change_facts = change_facts if change_facts is not None else CHANGE_FACTS
+        self._facts: Dict[str, bool] = dict(facts or {})
+        self._exists: Dict[str, bool] = {}
+        self._changed_files = list(changed_files) if changed_files is not None else None
+        self._changed: Dict[str, bool] = {}
+
+    def exists(self, path: str) -> bool:
+        result = self._exists.get(path)
+        if result is None:
+            result = self._exists[path] = os.path.exists(os.path.join(self.root, path))
+        return result
+
+    def changed_files(self) -> List[str]:
+        if self._changed_files is None:
+            names = set()
+            if self.base:
+                names.update(_git(self.root, 'diff', '--name-only', f'{self.base}...HEAD').split('\n'))
+            for line in _git(self.root, 'status', '--porcelain', '--untracked-files=all').split('\n'):
+                if len(line) > 3:
+                    names.add(line[3:].split(' -> ')[-1].strip('"'))
+            names.discard('')
+            self._changed_files = sorted(names)
+        return self._changed_files
+
+    def changed(self, pattern: str) -> bool:
+        result = self._changed.get(pattern)
+        if result is None:
+            result = self._changed[pattern] = any(
+                fnmatch.fnmatchcase(path, pattern) for path in self.changed_files())
+        return result
+
+    def fact(self, name: str) -> bool:
+        value = self._facts.get(name)
+        if value is None:
+            value = self._facts[name] = self._derive(name)
+        return value
+
+    def _derive(self, name: str) -> bool:
+        if name in self.change_facts:
+            return any(self.changed(pattern) for pattern in self.change_facts[name])
+        if name == 'has_requirement_reference':
+            text = _git(self.root, 'rev-parse', '--abbrev-ref', 'HEAD')
+            log_range = f'{self.base}..HEAD' if self.base else '-1'
+            text += _git(self.root, 'log', '--format=%B', log_range)
+            return bool(REQUIREMENT_ID_RE.search(text))
+        if name == 'gate_validation_passed':
+            try:
+                with open(os.path.join(self.root, '.sdlc', 'workflow-state.json'), 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                return False
+            return state.get('current_phase') in state.get('gates_passed', [])
+        raise RuleError(f"unknown fact {name!r} (pass it with --fact {name}=true|false)")
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+class Rule(NamedTuple):
+    rule_id: str
+    factor: Optional[int]
+    trigger: str
+    condition: str
+    action: str
+    message: str
+    approver: Optional[str]
+    predicate: Predicate
+
+
+class RuleResult(NamedTuple):
+    """A rule whose condition held for the event."""
+    rule_id: str
+    factor: Optional[int]
+    action: str
+    message: str
+    approver: Optional[str]
+
+    @property
+    def blocking(self) -> bool:
+        return self.action in BLOCKING_ACTIONS
+
+
+class RuleSet:
+    """Compiled rules indexed by trigger."""
+
+    def __init__(self, rules: Iterable[Rule], change_facts: Optional[Dict[str, List[str]]] = None):
+        self.rules = list(rules)
+        self.change_facts = dict(CHANGE_FACTS, **(change_facts or {}))
+        self.by_trigger: Dict[str, List[Rule]] = {}
+        for rule in self.rules:
+            self.by_trigger.setdefault(rule.trigger, []).append(rule)
+
+    def triggers(self) -> List[str]:
+        return list(self.by_trigger)
+
+    def snapshot(self, root: str = '.', **kwargs) -> Snapshot:
+        """A Snapshot using this rule set's change_facts."""
+        return Snapshot(root, change_facts=self.change_facts, **kwargs)
+
+    def evaluate(self, trigger: str, snapshot: Snapshot) -> List[RuleResult]:
+        """Rules for `trigger` whose condition holds; raises RuleError if one cannot be evaluated."""
+        results = []
+        for rule in self.by_trigger.get(trigger, ()):
+            try:
+                fired = rule.predicate(snapshot)
+            except RuleError as e:
+                raise RuleError(f"{rule.rule_id}: {e}") from None
+            if fired:
+                results.append(RuleResult(rule.rule_id, rule.factor, rule.action,
+                                          rule.message, rule.approver))
+        return results
+
+
+def build_rules(config: Dict) -> RuleSet:
+    """Compile the `enforcement_rules` mapping of a parsed config."""
+    rules = []
+    for rule_id, spec in (config.get('enforcement_rules') or {}).items():
+        if not isinstance(spec, dict) or 'trigger' not in spec or 'condition' not in spec:
+            raise RuleError(f"{rule_id}: a rule needs a trigger and a condition")
+        try:
+            predicate = compile_condition(spec['condition'])
+        except RuleError as e:
+            raise RuleError(f"{rule_id}: {e}") from None
+        rules.append(Rule(
+            rule_id=rule_id,
+            factor=spec.get('factor'),
+            trigger=str(spec['trigger']),
+            condition=str(spec['condition']),
+            action=str(spec.get('action', 'warn')),
+            message=str(spec.get('message', rule_id)),
+            approver=spec.get('approver'),
+            predicate=predicate,
+        ))
+    return RuleSet(rules, config.get('change_facts'))
+
+
+def load_rules(config_path: str = DEFAULT_CONFIG, cache_path: Optional[str] = None) -> RuleSet:
+    """
+    Load and compile the enforcement rules.
+
+    With cache_path, the parsed config is cached there as JSON, keyed by
+    the config's size and mtime, and reused while the config is unchanged.
+    """
+    stat = os.stat(config_path)
+    key = [stat.st_size, stat.st_mtime_ns]
+    if cache_path:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('format') == CACHE_FORMAT and cached.get('config') == key:
+                return build_rules(cached['rules'])
+        except (OSError, ValueError, KeyError):
+            pass
+
+    config = load_yaml(config_path)
+    if not isinstance(config, dict):
+        raise RuleError(f"{config_path}: expected a mapping")
+    rules = build_rules(config)
+
+    if cache_path and os.path.isdir(os.path.dirname(cache_path) or '.'):
+        data = {'format': CACHE_FORMAT, 'config': key,
+                'rules': {name: config[name] for name in ('enforcement_rules', 'change_facts')
+                          if name in config}}
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return rules
+
+
+def _parse_fact(value: str) -> tuple:
+    name, sep, flag = value.partition('=')
+    if not sep or flag.lower() not in ('true', 'false', '1', '0', 'yes', 'no'):
+        raise argparse.ArgumentTypeError(f"expected NAME=true|false, got {value!r}")
+    return name.strip(), flag.lower() in ('true', '1', 'yes')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluate 12 Factors enforcement rules for a trigger')
+    parser.add_argument('trigger', nargs='?', help='Trigger event, e.g. implementation_start')
+    parser.add_argument('--project', default='.', help='Project directory (default: .)')
+    parser.add_argument('--config', help=f'Rules file (default: <project>/{DEFAULT_CONFIG})')
+    parser.add_argument('--base', help='Git ref to diff against for changed files')
+    parser.add_argument('--changed', nargs='*', metavar='FILE',
+                        help='Changed files (instead of asking git)')
+    parser.add_argument('--fact', action='append', type=_parse_fact, default=[], metavar='NAME=BOOL',
+                        help='Set a fact explicitly (repeatable)')
+    parser.add_argument('--list', action='store_true', help='List rules by trigger and exit')
+    parser.add_argument('--no-cache', action='store_true', help=f'Do not read or write {CACHE_PATH}')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    if not args.trigger and not args.list:
+        parser.error('a trigger is required (or --list)')
+
+    config_path = args.config or os.path.join(args.project, DEFAULT_CONFIG)
+    cache_path = None if args.no_cache else os.path.join(args.project, CACHE_PATH)
+    try:
+        rules = load_rules(config_path, cache_path)
+    except (OSError, ValueError, RuleError) as e:
+        print(f"Error: Cannot load enforcement rules: {e}")
+        return 2
+
+    if args.list:
+        for trigger, trigger_rules in rules.by_trigger.items():
+            print(f"{trigger}:")
+            for rule in trigger_rules:
+                print(f"  {rule.rule_id:<32} {rule.action:<17} {rule.condition}")
+        return 0
+
+    snapshot = rules.snapshot(args.project, base=args.base, facts=dict(args.fact),
+                              changed_files=args.changed)
+    try:
+        results = rules.evaluate(args.trigger, snapshot)
+    except RuleError as e:
+        print(f"Error: {e}")
+        return 2
+
+    if args.json:
+        print(json.dumps([dict(result._asdict(), blocking=result.blocking) for result in results], indent=2))
+    else:
+        for result in results:
+            icon = {'block': '❌', 'require_approval': '🔒', 'warn': '⚠️ '}.get(result.action, '•')
+            approver = f" (approver: {result.approver})" if result.approver else ''
+            print(f"{icon} {result.action}: {result.message}{approver} [{result.rule_id}]")
+        if not results:
+            print(f"✅ {args.trigger}: no enforcement rules triggered")
+
+    return 1 if any(result.blocking for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
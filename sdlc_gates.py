@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+"""
+SDLC Gate Validator
+Evaluates the phase gates declared in agents/orchestrator/orchestrator.yaml
+(gates.<name>.required) and config/spec-kit/workflow.yaml (phases[].gate).
+
+Every gate check declares the project files it depends on as glob patterns.
+Results are cached in .sdlc/gate-cache.json keyed by a digest of those
+files' contents, so a check only runs again when one of its inputs
+changed; file hashes are themselves reused while a file's size and mtime
+are unchanged. Failures of checks that run external commands (the test
+suite) are not cached, so a flaky failure is retried on the next run.
+Checks that do need to run are run concurrently.
+
+    python3 sdlc_gates.py requirements
+    python3 sdlc_gates.py implementation --test-command "npm test"
+    python3 sdlc_gates.py --all --record
+    python3 sdlc_gates.py --approve code_review_approved
+
+    from sdlc_gates import GateEngine
+    engine = GateEngine(".")
+    for result in engine.evaluate(["architecture"])["architecture"]:
+        print(result.name, result.passed, result.detail)
+
+--record adds passing gates to gates_passed in .sdlc/workflow-state.json,
+which is what the gate_validation_passed enforcement fact reads. Manual
+checks (code_review_approved, code_complete) pass once recorded with
+--approve.
+
+Exit status: 0 when every check passed, 1 when a check failed, 2 on
+configuration errors.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sdlc_yaml import load_yaml
+
+ORCHESTRATOR_CONFIG = os.path.join("agents", "orchestrator", "orchestrator.yaml")
+SPEC_KIT_CONFIG = os.path.join("config", "spec-kit", "workflow.yaml")
+SUPERPOWERS_CONFIG = os.path.join("config", "superpowers", "config.yaml")
+WORKFLOW_STATE = os.path.join(".sdlc", "workflow-state.json")
+CACHE_PATH = os.path.join(".sdlc", "gate-cache.json")
+CACHE_FORMAT = 1
+
+DEFAULT_COVERAGE_TARGET = 80
+
+# Directories never treated as check inputs
+SKIP_DIRS = {'.git', 'node_modules', '.venv', 'venv', '__pycache__', '.pytest_cache',
+             '.mypy_cache', '.ruff_cache', '.tox', '.nox', 'dist', 'build', '.next'}
+
+SPEC_INPUTS = ('.specify/spec.md', 'docs/requirements/**/*.md')
+
+# A test run can read any file in the project, so the test checks depend on
+# the whole tree (SKIP_DIRS already leaves out VCS, dependency and build
+# directories), less what the framework and the test run itself write.
+SOURCE_INPUTS = ('**', '!.sdlc/**', '!coverage/**', '!htmlcov/**', '!coverage.xml', '!coverage.json',
+                 '!.coverage', '!.coverage.*', '!**/*.egg-info/**', '!**/*.pyc', '!**/*.log',
+                 '!target/**', '!out/**', '!skills/.skill-*.json')
+
+COVERAGE_INPUTS = ('coverage.xml', 'coverage.json', 'coverage/coverage-summary.json')
+
+
+class Check(NamedTuple):
+    name: str
+    # Project-relative globs ('**' crosses directories, '!' excludes)
+    inputs: Tuple[str, ...]
+    # (engine, input paths) -> (passed, detail)
+    run: Callable[['GateEngine', List[str]], Tuple[bool, str]]
+    # GateEngine attributes that are part of the cache key
+    params: Tuple[str, ...] = ()
+    # False for checks that run external commands: a failure may be flaky,
+    # so it is re-run next time instead of being served from the cache
+    cache_failures: bool = True
+
+
+class CheckResult(NamedTuple):
+    name: str
+    passed: bool
+    detail: str
+    cached: bool
+    seconds: float
+
+
+class Gate(NamedTuple):
+    name: str
+    checks: List[str]
+    approver: Optional[str]
+    source: str
+
+
+CHECKS: Dict[str, Check] = {}
+
+
+def check(*names: str, inputs: Tuple[str, ...], params: Tuple[str, ...] = (),
+          cache_failures: bool = True):
+    """Register a check function under one or more gate check names."""
+    def register(run):
+        for name in names:
+            CHECKS[name] = Check(name, tuple(inputs), run, params, cache_failures)
+        return run
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Input resolution and hashing
+# ---------------------------------------------------------------------------
+
+def _glob_regex(pattern: str) -> 're.Pattern':
+    if pattern.endswith('/'):
+        pattern += '**'
+    regex = ''
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex += '(?:.*/)?'
+            i += 3
+        elif pattern.startswith('**', i):
+            regex += '.*'
+            i += 2
+        elif pattern[i] == '*':
+            regex += '[^/]*'
+            i += 1
+        elif pattern[i] == '?':
+            regex += '[^/]'
+            i += 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return re.compile(regex + r'\Z')
+
+
+def match_inputs(paths: List[str], patterns: Tuple[str, ...]) -> List[str]:
+    """Paths matching any include pattern and no '!' exclude pattern."""
+    include = [_glob_regex(p) for p in patterns if not p.startswith('!')]
+    exclude = [_glob_regex(p[1:]) for p in patterns if p.startswith('!')]
+    return [path for path in paths
+            if any(r.match(path) for r in include) and not any(r.match(path) for r in exclude)]
+
+
+def _read_text(root: str, path: str) -> str:
+    try:
+        with open(os.path.join(root, path), 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    except OSError:
+        return ''
+
+
+# ---------------------------------------------------------------------------
+# Gate checks
+# ---------------------------------------------------------------------------
+
+def _has_content(engine: 'GateEngine', paths: List[str]) -> List[str]:
+    return [path for path in paths if _read_text(engine.root, path).strip()]
+
+
+@check('spec_document_exists', inputs=('.specify/spec.md',))
+def _spec_document_exists(engine, paths):
+    if _has_content(engine, paths):
+        return True, '.specify/spec.md'
+    return False, '.specify/spec.md is missing or empty'
+
+
+@check('requirements_documented', inputs=SPEC_INPUTS)
+def _requirements_documented(engine, paths):
+    documented = _has_content(engine, paths)
+    if documented:
+        return True, f"{len(documented)} requirement document(s)"
+    return False, 'no .specify/spec.md or docs/requirements/*.md'
+
+
+def _search(engine, paths, pattern: str, what: str):
+    regex = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    found = [path for path in paths if regex.search(_read_text(engine.root, path))]
+    if found:
+        return True, f"{what} in {', '.join(found[:3])}"
+    return False, f"no {what} in {len(paths)} document(s)"
+
+
+@check('acceptance_criteria_defined', inputs=SPEC_INPUTS)
+def _acceptance_criteria_defined(engine, paths):
+    return _search(engine, paths, r"acceptance criteria|^\W*given\b.*\n\W*when\b", 'acceptance criteria')
+
+
+@check('user_journeys_mapped', inputs=SPEC_INPUTS + ('docs/**/*journey*',))
+def _user_journeys_mapped(engine, paths):
+    journey_docs = [path for path in paths if 'journey' in os.path.basename(path).lower()]
+    if journey_docs:
+        return True, f"journey document {journey_docs[0]}"
+    return _search(engine, paths, r"user journey|journey map", 'user journeys')
+
+
+@check('architecture_document_exists', 'architecture_documented', inputs=('docs/architecture/*.md',))
+def _architecture_documented(engine, paths):
+    documents = _has_content(engine, paths)
+    if documents:
+        return True, ', '.join(documents[:3])
+    return False, 'no docs/architecture/*.md'
+
+
+@check('adrs_written', inputs=('docs/architecture/adrs/*.md',))
+def _adrs_written(engine, paths):
+    adrs = [path for path in _has_content(engine, paths)
+            if not re.match(r"(readme|template|index)", os.path.basename(path), re.IGNORECASE)]
+    if adrs:
+        return True, f"{len(adrs)} ADR(s)"
+    return False, 'no ADRs in docs/architecture/adrs/'
+
+
+@check('database_schema_defined', inputs=('docs/architecture/**/*.md', '**/*.sql', '**/migrations/**',
+                                          '**/schema.*', '**/*.prisma'))
+def _database_schema_defined(engine, paths):
+    schema_files = [path for path in paths if not path.endswith('.md')]
+    if schema_files:
+        return True, f"{len(schema_files)} schema file(s)"
+    return _search(engine, paths, r"^#+.*\b(database|schema|data model)\b", 'database schema section')
+
+
+def _load_tasks(engine, paths):
+    if not paths:
+        return None
+    try:
+        data = json.loads(_read_text(engine.root, paths[0]))
+    except ValueError:
+        return None
+    tasks = data.get('tasks') if isinstance(data, dict) else data
+    return tasks if isinstance(tasks, list) else None
+
+
+@check('tasks_decomposed', inputs=('.sdlc/tasks.json',))
+def _tasks_decomposed(engine, paths):
+    tasks = _load_tasks(engine, paths)
+    if tasks:
+        return True, f"{len(tasks)} task(s)"
+    return False, '.sdlc/tasks.json is missing, invalid or empty'
+
+
+@check('dependencies_mapped', inputs=('.sdlc/tasks.json',))
+def _dependencies_mapped(engine, paths):
+    tasks = _load_tasks(engine, paths)
+    if not tasks:
+        return False, 'no tasks in .sdlc/tasks.json'
+    unmapped = [str(task.get('id', n)) for n, task in enumerate(tasks)
+                if not isinstance(task, dict) or not ('dependencies' in task or 'depends_on' in task)]
+    if unmapped:
+        return False, f"tasks without dependencies: {', '.join(unmapped[:5])}"
+    return True, f"{len(tasks)} task(s) with dependencies"
+
+
+@check('all_tests_pass', 'tests_passing', inputs=SOURCE_INPUTS, params=('test_command',),
+       cache_failures=False)
+def _tests_pass(engine, paths):
+    command = engine.test_command
+    if not command:
+        return False, 'no test command found (use --test-command)'
+    try:
+        result = subprocess.run(command, shell=True, cwd=engine.root, capture_output=True, text=True)
+    except OSError as e:
+        return False, f"{command}: {e}"
+    output = (result.stdout + result.stderr).strip().split('\n')
+    summary = output[-1] if output else ''
+    if result.returncode == 0:
+        return True, f"{command}: {summary}"
+    return False, f"{command} exited {result.returncode}: {summary}"
+
+
+def _coverage_percent(engine, path: str) -> Optional[float]:
+    text = _read_text(engine.root, path)
+    try:
+        if path.endswith('.xml'):
+            match = re.search(r'<coverage[^>]*\bline-rate="([\d.]+)"', text)
+            return float(match.group(1)) * 100 if match else None
+        data = json.loads(text)
+        if 'totals' in data:
+            return float(data['totals']['percent_covered'])
+        return float(data['total']['lines']['pct'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+@check('coverage_minimum_met', 'coverage_met', inputs=COVERAGE_INPUTS, params=('coverage_target',))
+def _coverage_met(engine, paths):
+    target = engine.coverage_target
+    for path in paths:
+        percent = _coverage_percent(engine, path)
+        if percent is not None:
+            passed = percent >= target
+            return passed, f"{percent:.1f}% line coverage ({'≥' if passed else '<'} {target}%, {path})"
+    return False, 'no coverage report (coverage.xml, coverage.json or coverage/coverage-summary.json)'
+
+
+def _recorded_approval(name: str):
+    def run(engine, paths):
+        if name in engine.workflow_state().get('approvals', []):
+            return True, 'approved'
+        return False, f"not approved (record with --approve {name})"
+    return run
+
+
+for _name in ('code_review_approved', 'code_complete'):
+    CHECKS[_name] = Check(_name, ('.sdlc/workflow-state.json',), _recorded_approval(_name))
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+def load_gates(root: str = '.') -> Dict[str, Gate]:
+    """Gates from the orchestrator config and the spec-kit phases."""
+    gates: Dict[str, Gate] = {}
+    orchestrator_path = os.path.join(root, ORCHESTRATOR_CONFIG)
+    if os.path.exists(orchestrator_path):
+        for name, spec in ((load_yaml(orchestrator_path) or {}).get('gates') or {}).items():
+            spec = spec or {}
+            gates[name] = Gate(name, list(spec.get('required') or []), spec.get('approver'),
+                               ORCHESTRATOR_CONFIG)
+    spec_kit_path = os.path.join(root, SPEC_KIT_CONFIG)
+    if os.path.exists(spec_kit_path):
+        for phase in (load_yaml(spec_kit_path) or {}).get('phases') or []:
+            if isinstance(phase, dict) and phase.get('name') and phase.get('gate'):
+                existing = gates.get(phase['name'])
+                checks = (existing.checks if existing else []) + [
+                    name for name in phase['gate'] if not existing or name not in existing.checks]
+                gates[phase['name']] = Gate(phase['name'], checks,
+                                            existing.approver if existing else None,
+                                            existing.source if existing else SPEC_KIT_CONFIG)
+    return gates
+
+
+def detect_test_command(root: str) -> Optional[str]:
+    """The project's test command, guessed from its build files."""
+    if os.environ.get('SDLC_TEST_COMMAND'):
+        return os.environ['SDLC_TEST_COMMAND']
+    if os.path.exists(os.path.join(root, 'package.json')):
+        return 'npm test --silent'
+    if any(os.path.exists(os.path.join(root, name))
+           for name in ('pyproject.toml', 'setup.py', 'setup.cfg', 'pytest.ini', 'tox.ini', 'tests')):
+        return f'{sys.executable} -m pytest -q'
+    return None
+
+
+class GateEngine:
+    """
+    Evaluates gate checks with results cached by input content.
+
+    A check's cache key covers its input paths and their SHA-256 digests plus
+    any parameter it depends on (test command, coverage target), so changing
+    either re-runs it.
+    """
+
+    def __init__(self, root: str = '.', jobs: Optional[int] = None,
+                 test_command: Optional[str] = None, use_cache: bool = True):
+        self.root = root
+        self.jobs = jobs or min(8, (os.cpu_count() or 1) + 2)
+        self.test_command = test_command or detect_test_command(root)
+        self.cache_path = os.path.join(root, CACHE_PATH) if use_cache else None
+        self.coverage_target = self._coverage_target()
+        self._cache = self._load_cache()
+        self._files: Optional[List[str]] = None
+        self._hashes: Dict[str, list] = {}
+        self._state: Optional[Dict] = None
+
+    def _coverage_target(self) -> float:
+        path = os.path.join(self.root, SUPERPOWERS_CONFIG)
+        try:
+            config = load_yaml(path) or {}
+            return float((config.get('tdd_config') or {}).get('coverage_target', DEFAULT_COVERAGE_TARGET))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return DEFAULT_COVERAGE_TARGET
+
+    def _load_cache(self) -> Dict:
+        empty = {'format': CACHE_FORMAT, 'files': {}, 'checks': {}}
+        if not self.cache_path:
+            return empty
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return empty
+        return cache if cache.get('format') == CACHE_FORMAT else empty
+
+    def save_cache(self) -> None:
+        if not self.cache_path or not os.path.isdir(os.path.dirname(self.cache_path)):
+            return
+        if self._files is not None:
+            # Keep hashes only for files that still exist
+            self._cache['files'] = {path: self._hashes.get(path) or self._cache['files'][path]
+                                    for path in self._files
+                                    if path in self._hashes or path in self._cache['files']}
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._cache, f, separators=(',', ':'))
+        os.replace(tmp_path, self.cache_path)
+
+    def files(self) -> List[str]:
+        """Project-relative paths of all candidate input files (walked once)."""
+        if self._files is None:
+            files = []
+            stack = ['']
+            while stack:
+                rel_dir = stack.pop()
+                try:
+                    entries = os.scandir(os.path.join(self.root, rel_dir) if rel_dir else self.root)
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                stack.append(rel)
+                        elif entry.is_file() and rel != CACHE_PATH.replace(os.sep, '/'):
+                            files.append(rel)
+            self._files = sorted(files)
+        return self._files
+
+    def file_hash(self, path: str) -> str:
+        """SHA-256 of a file, reused from the cache while size and mtime match."""
+        entry = self._hashes.get(path)
+        if entry is not None:
+            return entry[2]
+        stat = os.stat(os.path.join(self.root, path))
+        cached = self._cache['files'].get(path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            entry = cached
+        else:
+            digest = hashlib.sha256()
+            with open(os.path.join(self.root, path), 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            entry = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        self._hashes[path] = entry
+        return entry[2]
+
+    def workflow_state(self) -> Dict:
+        if self._state is None:
+            try:
+                with open(os.path.join(self.root, WORKFLOW_STATE), 'r', encoding='utf-8') as f:
+                    self._state = json.load(f)
+            except (OSError, ValueError):
+                self._state = {}
+        return self._state
+
+    def _key(self, check: Check, paths: List[str]) -> str:
+        params = [str(getattr(self, name)) for name in check.params]
+        digest = hashlib.sha256(f"{check.run.__qualname__}\0{params}\n".encode())
+        for path in paths:
+            digest.update(f"{path}\0{self.file_hash(path)}\n".encode())
+        return digest.hexdigest()
+
+    def _run(self, check: Check, paths: List[str]) -> Tuple[bool, str, float]:
+        start = time.perf_counter()
+        try:
+            passed, detail = check.run(self, paths)
+        except Exception as e:  # a broken check fails its gate instead of the run
+            passed, detail = False, f"check raised {type(e).__name__}: {e}"
+        return passed, detail, time.perf_counter() - start
+
+    def run_checks(self, names: List[str]) -> Dict[str, CheckResult]:
+        """Evaluate checks by name, reusing cached results where inputs are unchanged."""
+        results: Dict[str, CheckResult] = {}
+        stale = []
+        for name in dict.fromkeys(names):
+            check_def = CHECKS.get(name)
+            if check_def is None:
+                results[name] = CheckResult(name, False, 'no check defined for this gate item', False, 0.0)
+                continue
+            paths = match_inputs(self.files(), check_def.inputs)
+            key = self._key(check_def, paths)
+            cached = self._cache['checks'].get(name)
+            if cached and cached['key'] == key:
+                results[name] = CheckResult(name, cached['passed'], cached['detail'], True, 0.0)
+            else:
+                stale.append((check_def, paths, key))
+
+        # Aliases (all_tests_pass / tests_passing) share one run
+        unique = {}
+        for check_def, paths, key in stale:
+            unique.setdefault((check_def.run, key), (check_def, paths))
+        if unique:
+            # Shared state is loaded here, not lazily from the worker threads
+            self.workflow_state()
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                outcomes = dict(zip(unique, pool.map(lambda item: self._run(*item), unique.values())))
+            for check_def, _, key in stale:
+                passed, detail, seconds = outcomes[(check_def.run, key)]
+                if passed or check_def.cache_failures:
+                    self._cache['checks'][check_def.name] = {'key': key, 'passed': passed, 'detail': detail}
+                else:
+                    self._cache['checks'].pop(check_def.name, None)
+                results[check_def.name] = CheckResult(check_def.name, passed, detail, False, seconds)
+        return results
+
+    def evaluate(self, gate_names: List[str], gates: Optional[Dict[str, Gate]] = None) -> Dict[str, List[CheckResult]]:
+        """Results per gate; checks shared between gates are evaluated once."""
+        gates = gates if gates is not None else load_gates(self.root)
+        unknown = [name for name in gate_names if name not in gates]
+        if unknown:
+            raise KeyError(f"unknown gate(s): {', '.join(unknown)}")
+        names = [name for gate in gate_names for name in gates[gate].checks]
+        results = self.run_checks(names)
+        self.save_cache()
+        return {gate: [results[name] for name in gates[gate].checks] for gate in gate_names}
+
+
+def update_workflow_state(root: str, gates_passed: List[str] = (), approvals: List[str] = ()) -> None:
+    """Add gates to gates_passed and checks to approvals in workflow-state.json."""
+    path = os.path.join(root, WORKFLOW_STATE)
+    with open(path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    for key, names in (('gates_passed', gates_passed), ('approvals', approvals)):
+        values = state.setdefault(key, [])
+        values.extend(name for name in names if name not in values)
+    state['updated_at'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate SDLC phase gates')
+    parser.add_argument('gates', nargs='*', help='Gates to validate (e.g. requirements, plan)')
+    parser.add_argument('--project', default='.', help='Project directory (default: .)')
+    parser.add_argument('--all', action='store_true', help='Validate every gate')
+    parser.add_argument('--list', action='store_true', help='List gates and their checks')
+    parser.add_argument('--jobs', type=int, help='Checks to run concurrently')
+    parser.add_argument('--test-command', help='Command for all_tests_pass/tests_passing '
+                                               '(default: $SDLC_TEST_COMMAND or detected)')
+    parser.add_argument('--no-cache', action='store_true', help=f'Ignore and do not write {CACHE_PATH}')
+    parser.add_argument('--record', action='store_true',
+                        help=f'Add passing gates to gates_passed in {WORKFLOW_STATE}')
+    parser.add_argument('--approve', action='append', default=[], metavar='CHECK',
+                        help=f'Record a manual approval (e.g. code_review_approved) in {WORKFLOW_STATE}')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    try:
+        gates = load_gates(args.project)
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot load gate configuration: {e}")
+        return 2
+    if not gates:
+        print(f"Error: No gates found in {ORCHESTRATOR_CONFIG} or {SPEC_KIT_CONFIG}")
+        return 2
+
+    if args.approve:
+        try:
+            update_workflow_state(args.project, approvals=args.approve)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot update {WORKFLOW_STATE}: {e}")
+            return 2
+        print(f"✅ Recorded approval: {', '.join(args.approve)}")
+        if not args.gates and not args.all:
+            return 0
+
+    if args.list:
+        for gate in gates.values():
+            approver = f" (approver: {gate.approver})" if gate.approver else ''
+            print(f"{gate.name}{approver} [{gate.source}]")
+            for name in gate.checks:
+                print(f"  {name}{'' if name in CHECKS else '  (no check defined)'}")
+        return 0
+
+    gate_names = list(gates) if args.all else args.gates
+    if not gate_names:
+        parser.error('name at least one gate, or use --all or --list')
+
+    engine = GateEngine(args.project, jobs=args.jobs, test_command=args.test_command,
+                        use_cache=not args.no_cache)
+    start = time.perf_counter()
+    try:
+        results = engine.evaluate(gate_names, gates)
+    except KeyError as e:
+        print(f"Error: {e.args[0]} (available: {', '.join(gates)})")
+        return 2
+    elapsed = time.perf_counter() - start
+
+    passed_gates = [gate for gate, checks in results.items() if all(r.passed for r in checks)]
+    if args.json:
+        print(json.dumps({gate: [r._asdict() for r in checks] for gate, checks in results.items()}, indent=2))
+    else:
+        for gate, checks in results.items():
+            print(f"{'✅' if gate in passed_gates else '❌'} {gate}")
+            for r in checks:
+                timing = 'cached' if r.cached else f"{r.seconds * 1e3:.0f} ms"
+                print(f"   {'✓' if r.passed else '✗'} {r.name}: {r.detail} ({timing})")
+        checks = {r.name: r for gate_checks in results.values() for r in gate_checks}
+        ran = sum(1 for r in checks.values() if not r.cached)
+        print(f"\n{len(passed_gates)}/{len(results)} gates passed in {elapsed * 1e3:.0f} ms "
+              f"({ran} of {len(checks)} check(s) run, the rest cached)")
+
+    if args.record and passed_gates:
+        try:
+            update_workflow_state(args.project, gates_passed=passed_gates)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot update {WORKFLOW_STATE}: {e}")
+            return 2
+
+    return 0 if len(passed_gates) == len(results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
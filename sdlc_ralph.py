@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Ralph Loop Scheduler
+Runs the per-phase Ralph agent loops of a full SDLC cycle concurrently.
+
+Phases come from agents/orchestrator/orchestrator.yaml (workflow.phases),
+each handled by the agent its `delegation` entry names. A phase starts once
+the phases it depends on have completed, so independent loops (design and
+test design, testing and security review, ...) run side by side on a fixed
+number of worker slots. When a loop finishes early its slot goes to the
+ready loop with the longest remaining chain of work.
+
+Each loop reruns its command until the output contains the agent's
+completion promise from .ralph/config.yaml, e.g.
+<promise>IMPLEMENTATION_COMPLETE</promise>, or its iteration budget
+(max_iterations, capped by safety.absolute_max_iterations) is spent.
+Output is streamed to .sdlc/ralph-logs/ and scanned chunk by chunk, so
+transcripts are never held in memory.
+
+    python3 sdlc_ralph.py --dry-run
+    python3 sdlc_ralph.py --slots 3 --command 'claude -p "$(cat {prompt_file})"'
+    python3 sdlc_ralph.py --phases implementation testing security_review --total-budget 120
+
+The command is run through the shell with {agent}, {phase}, {iteration},
+{promise}, {prompt_file} and {project} substituted; other braces (${VAR},
+awk programs, ...) reach the shell as written. It is checked before any
+loop starts. The prompt file is .ralph/prompts/<phase>.md when present,
+otherwise a generated one. A loop fails when its command is not found, or
+when it exits non-zero without output several iterations in a row.
+
+Phase dependencies default to PHASE_DEPENDENCIES; a
+`workflow.depends_on: {phase: [phase, ...]}` mapping in orchestrator.yaml
+overrides them, and phases missing from both depend on the phase before
+them.
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import shlex
+import subprocess
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from sdlc_yaml import load_yaml
+
+RALPH_CONFIG = os.path.join(".ralph", "config.yaml")
+ORCHESTRATOR_CONFIG = os.path.join("agents", "orchestrator", "orchestrator.yaml")
+PROMPTS_DIR = os.path.join(".ralph", "prompts")
+DEFAULT_LOG_DIR = os.path.join(".sdlc", "ralph-logs")
+DEFAULT_COMMAND = 'claude -p "$(cat {prompt_file})"'
+DEFAULT_MAX_ITERATIONS = 50
+
+PHASE_DEPENDENCIES = {
+    'requirements': [],
+    'architecture': ['requirements'],
+    'design': ['requirements'],
+    'test_design': ['requirements'],
+    'implementation': ['architecture', 'design', 'test_design'],
+    'testing': ['implementation'],
+    'security_review': ['implementation'],
+    'deployment': ['testing', 'security_review'],
+    'operations': ['deployment'],
+}
+
+READ_CHUNK = 64 * 1024
+
+PLACEHOLDERS = ('agent', 'phase', 'iteration', 'promise', 'prompt_file', 'project')
+PLACEHOLDER_RE = re.compile(r"\{(%s)\}" % '|'.join(PLACEHOLDERS))
+# {name} not preceded by $ that is not a placeholder, most likely a typo
+_UNKNOWN_PLACEHOLDER_RE = re.compile(r"(?<!\$)\{([a-z_]+)\}")
+
+# Consecutive silent non-zero exits after which a loop counts as failed
+MAX_SILENT_FAILURES = 3
+
+
+class Loop(NamedTuple):
+    phase: str
+    agent: str
+    promise: str
+    max_iterations: int
+    # Upper end of typical_iterations, used to rank ready loops
+    typical: int
+    depends_on: List[str]
+
+
+class LoopResult(NamedTuple):
+    phase: str
+    agent: str
+    status: str          # complete | exhausted | failed | blocked
+    iterations: int
+    seconds: float
+    detail: str
+
+
+def _loop_key(agent_id: str) -> str:
+    """'test-manager-agent' -> 'test_manager' (the .ralph/config.yaml key)."""
+    if agent_id.endswith('-agent'):
+        agent_id = agent_id[:-6]
+    return agent_id.replace('-', '_')
+
+
+def _typical_upper(value, default: int) -> int:
+    text = str(value or '')
+    try:
+        return int(text.split('-')[-1])
+    except ValueError:
+        return default
+
+
+def load_loops(root: str = '.') -> List[Loop]:
+    """One loop per workflow phase, in phase order."""
+    ralph = load_yaml(os.path.join(root, RALPH_CONFIG)) or {}
+    orchestrator = load_yaml(os.path.join(root, ORCHESTRATOR_CONFIG)) or {}
+    workflow = orchestrator.get('workflow') or {}
+    phases = workflow.get('phases') or list(PHASE_DEPENDENCIES)
+    delegation = orchestrator.get('delegation') or {}
+    overrides = workflow.get('depends_on') or {}
+
+    default_max = int((ralph.get('defaults') or {}).get('max_iterations', DEFAULT_MAX_ITERATIONS))
+    absolute_max = int((ralph.get('safety') or {}).get('absolute_max_iterations', default_max))
+    agent_loops = ralph.get('agent_loops') or {}
+
+    loops = []
+    for index, phase in enumerate(phases):
+        agent_id = delegation.get(phase) or delegation.get(phase.split('_')[0]) or phase
+        key = _loop_key(agent_id)
+        spec = agent_loops.get(key) or {}
+        if phase in overrides:
+            depends_on = list(overrides[phase] or [])
+        elif phase in PHASE_DEPENDENCIES:
+            depends_on = [p for p in PHASE_DEPENDENCIES[phase] if p in phases]
+        else:
+            depends_on = phases[index - 1:index]
+        late = [p for p in depends_on if p not in phases[:index]]
+        if late:
+            raise ValueError(f"{phase} depends on {', '.join(late)}, which is not an earlier phase")
+        max_iterations = min(int(spec.get('max_iterations', default_max)), absolute_max)
+        loops.append(Loop(phase, key, spec.get('completion_promise') or f"{phase.upper()}_COMPLETE",
+                          max_iterations, _typical_upper(spec.get('typical_iterations'), max_iterations),
+                          depends_on))
+    return loops
+
+
+def critical_path(loops: List[Loop]) -> Dict[str, int]:
+    """Typical iterations from the start of each phase to the end of the cycle."""
+    dependents: Dict[str, List[str]] = {loop.phase: [] for loop in loops}
+    for loop in loops:
+        for dependency in loop.depends_on:
+            dependents.setdefault(dependency, []).append(loop.phase)
+    remaining: Dict[str, int] = {}
+    for loop in reversed(loops):
+        remaining[loop.phase] = loop.typical + max(
+            (remaining[p] for p in dependents[loop.phase] if p in remaining), default=0)
+    return remaining
+
+
+class PromiseScanner:
+    """Finds a marker in streamed output, keeping only a marker-sized tail."""
+
+    def __init__(self, promise: str):
+        self.marker = f"<promise>{promise}</promise>".encode()
+        self._tail = b''
+        self.found = False
+
+    def feed(self, chunk: bytes) -> bool:
+        if not self.found:
+            window = self._tail + chunk
+            self.found = self.marker in window
+            self._tail = window[-(len(self.marker) - 1):]
+        return self.found
+
+
+def _prompt_file(root: str, loop: Loop, log_dir: str) -> str:
+    path = os.path.join(root, PROMPTS_DIR, f"{loop.phase}.md")
+    if os.path.exists(path):
+        return path
+    path = os.path.join(log_dir, f"{loop.phase}.prompt.md")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"# {loop.phase.replace('_', ' ').title()} Loop\n\n"
+                f"You are the {loop.agent.replace('_', '-')} agent. Continue the {loop.phase} phase "
+                f"from the current state of the project.\n\n"
+                f"When the phase is complete, output: <promise>{loop.promise}</promise>\n")
+    return path
+
+
+def render_command(command: str, values: Dict[str, object]) -> str:
+    """Substitute the known {placeholders}; everything else is left as written."""
+    return PLACEHOLDER_RE.sub(lambda match: str(values[match.group(1)]), command)
+
+
+def check_command(root: str, command: str) -> List[str]:
+    """
+    Problems with a loop command, found before any loop runs.
+
+    Returns: error messages; an empty list when the command can be run
+    """
+    if not command.strip():
+        return ['the command is empty']
+    sample = render_command(command, {'agent': 'developer', 'phase': 'implementation', 'iteration': 1,
+                                      'promise': 'DONE', 'prompt_file': 'prompt.md',
+                                      'project': shlex.quote(root)})
+    syntax = subprocess.run(['sh', '-n', '-c', sample], capture_output=True, text=True)
+    if syntax.returncode != 0:
+        return [f"not valid shell: {syntax.stderr.strip() or sample}"]
+    try:
+        program = shlex.split(sample)[0]
+    except (ValueError, IndexError):
+        return []  # sh accepted it; leave unusual syntax to the shell
+    if '=' not in program:
+        found = subprocess.run(['sh', '-c', 'command -v "$1"', 'sh', program], cwd=root,
+                               capture_output=True)
+        if found.returncode != 0:
+            return [f"command not found: {program}"]
+    return []
+
+
+class Scheduler:
+    """Runs loops on `slots` workers, respecting dependencies and budgets."""
+
+    def __init__(self, root: str, loops: List[Loop], command: str = DEFAULT_COMMAND,
+                 slots: int = 2, total_budget: Optional[int] = None,
+                 log_dir: Optional[str] = None, cost_warning: Optional[int] = None):
+        self.root = root
+        self.loops = loops
+        self.command = command
+        self.slots = slots
+        self.total_budget = total_budget
+        self.log_dir = log_dir or os.path.join(root, DEFAULT_LOG_DIR)
+        self.cost_warning = cost_warning
+        self.iterations_used = 0
+        self.results: Dict[str, LoopResult] = {}
+        self._priority = critical_path(loops)
+
+    async def _iterate(self, loop: Loop, iteration: int, prompt_file: str, log) -> tuple:
+        """Run one iteration; returns (promise seen, exit code, bytes of output)."""
+        command = render_command(self.command, {
+            'agent': loop.agent.replace('_', '-'), 'phase': loop.phase, 'iteration': iteration,
+            'promise': loop.promise, 'prompt_file': shlex.quote(prompt_file),
+            'project': shlex.quote(self.root)})
+        log.write(f"\n=== {loop.phase} iteration {iteration}: {command}\n".encode())
+        process = await asyncio.create_subprocess_shell(
+            command, cwd=self.root, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+            env=dict(os.environ, RALPH_PHASE=loop.phase, RALPH_AGENT=loop.agent,
+                     RALPH_ITERATION=str(iteration), RALPH_PROMISE=loop.promise))
+        scanner = PromiseScanner(loop.promise)
+        output = 0
+        try:
+            while True:
+                chunk = await process.stdout.read(READ_CHUNK)
+                if not chunk:
+                    break
+                log.write(chunk)
+                output += len(chunk)
+                scanner.feed(chunk)
+            return scanner.found, await process.wait(), output
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+
+    async def run_loop(self, loop: Loop) -> LoopResult:
+        start = time.perf_counter()
+        os.makedirs(self.log_dir, exist_ok=True)
+        prompt_file = _prompt_file(self.root, loop, self.log_dir)
+        iteration = 0
+        silent_failures = 0
+        with open(os.path.join(self.log_dir, f"{loop.phase}.log"), 'ab') as log:
+            while iteration < loop.max_iterations:
+                if self.total_budget is not None and self.iterations_used >= self.total_budget:
+                    return LoopResult(loop.phase, loop.agent, 'exhausted', iteration,
+                                      time.perf_counter() - start, 'total iteration budget spent')
+                iteration += 1
+                self.iterations_used += 1
+                if iteration == self.cost_warning:
+                    print(f"⚠️  {loop.phase}: {iteration} iterations (cost warning threshold)")
+                found, code, output = await self._iterate(loop, iteration, prompt_file, log)
+                if found:
+                    return LoopResult(loop.phase, loop.agent, 'complete', iteration,
+                                      time.perf_counter() - start, loop.promise)
+                if code == 127:
+                    return LoopResult(loop.phase, loop.agent, 'failed', iteration,
+                                      time.perf_counter() - start, 'command not found')
+                # A command that keeps failing silently is broken, not still working
+                silent_failures = silent_failures + 1 if code != 0 and not output else 0
+                if silent_failures >= MAX_SILENT_FAILURES:
+                    return LoopResult(loop.phase, loop.agent, 'failed', iteration,
+                                      time.perf_counter() - start,
+                                      f"exited {code} without output {silent_failures} times in a row")
+        return LoopResult(loop.phase, loop.agent, 'exhausted', iteration, time.perf_counter() - start,
+                          f"no {loop.promise} within {loop.max_iterations} iterations")
+
+    def _ready(self, started) -> List[Loop]:
+        ready = []
+        for loop in self.loops:
+            if loop.phase in started:
+                continue
+            states = [self.results.get(p) for p in loop.depends_on]
+            if any(r is not None and r.status != 'complete' for r in states):
+                blockers = [p for p, r in zip(loop.depends_on, states) if r and r.status != 'complete']
+                self.results[loop.phase] = LoopResult(loop.phase, loop.agent, 'blocked', 0, 0.0,
+                                                      f"waiting on {', '.join(blockers)}")
+                started.add(loop.phase)
+                print(f"⏭️  {loop.phase}: blocked by {', '.join(blockers)}")
+            elif all(r is not None for r in states):
+                ready.append(loop)
+        return sorted(ready, key=lambda loop: -self._priority[loop.phase])
+
+    async def run(self) -> List[LoopResult]:
+        started = set()
+        running: Dict[asyncio.Task, Loop] = {}
+        try:
+            while True:
+                # A finished loop frees its slot for the most critical ready loop
+                for loop in self._ready(started)[:self.slots - len(running)]:
+                    started.add(loop.phase)
+                    print(f"▶️  {loop.phase} ({loop.agent.replace('_', '-')}, budget {loop.max_iterations})")
+                    running[asyncio.ensure_future(self.run_loop(loop))] = loop
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    loop = running.pop(task)
+                    result = task.result()
+                    self.results[loop.phase] = result
+                    icon = '✅' if result.status == 'complete' else '❌'
+                    print(f"{icon} {loop.phase}: {result.status} after {result.iterations} "
+                          f"iteration(s) in {result.seconds:.1f}s ({result.detail})")
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        return [self.results[loop.phase] for loop in self.loops if loop.phase in self.results]
+
+
+def print_plan(loops: List[Loop]) -> None:
+    priority = critical_path(loops)
+    print(f"{'phase':<16} {'agent':<14} {'budget':>6} {'typical':>7} {'path':>5}  depends on")
+    for loop in loops:
+        print(f"{loop.phase:<16} {loop.agent.replace('_', '-'):<14} {loop.max_iterations:>6} "
+              f"{loop.typical:>7} {priority[loop.phase]:>5}  {', '.join(loop.depends_on) or '-'}")
+    serial = sum(loop.typical for loop in loops)
+    longest = max(priority.values(), default=0)
+    print(f"\nTypical iterations: {serial} running one loop at a time, {longest} along the critical path")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run Ralph agent loops for the SDLC phases concurrently')
+    parser.add_argument('--project', default='.', help='Project directory (default: .)')
+    parser.add_argument('--phases', nargs='+', help='Only run these phases (others count as complete)')
+    parser.add_argument('--slots', type=int, default=2, help='Loops to run at once (default: 2)')
+    parser.add_argument('--command', default=os.environ.get('RALPH_COMMAND', DEFAULT_COMMAND),
+                        help='Command run per iteration (default: $RALPH_COMMAND or claude -p)')
+    parser.add_argument('--total-budget', type=int, help='Iterations allowed across all loops')
+    parser.add_argument('--max-iterations', type=int, help='Override every loop\'s iteration budget')
+    parser.add_argument('--yes', action='store_true',
+                        help='Allow budgets above safety.require_confirmation_above')
+    parser.add_argument('--dry-run', action='store_true', help='Show the schedule without running it')
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.project)
+    try:
+        loops = load_loops(root)
+        ralph = load_yaml(os.path.join(root, RALPH_CONFIG)) or {}
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot load loop configuration: {e}")
+        return 2
+
+    safety = ralph.get('safety') or {}
+    if args.max_iterations:
+        cap = int(safety.get('absolute_max_iterations', args.max_iterations))
+        loops = [loop._replace(max_iterations=min(args.max_iterations, cap)) for loop in loops]
+    if args.phases:
+        unknown = [p for p in args.phases if p not in {loop.phase for loop in loops}]
+        if unknown:
+            print(f"Error: Unknown phase(s): {', '.join(unknown)}")
+            return 2
+        loops = [loop._replace(depends_on=[p for p in loop.depends_on if p in args.phases])
+                 for loop in loops if loop.phase in args.phases]
+
+    if args.dry_run:
+        print_plan(loops)
+        return 0
+
+    for name in sorted(set(_UNKNOWN_PLACEHOLDER_RE.findall(args.command)) - set(PLACEHOLDERS)):
+        print(f"⚠️  {{{name}}} in --command is not a placeholder; it is passed to the shell as written")
+    problems = check_command(root, args.command)
+    if problems:
+        print(f"Error: Cannot run --command {args.command!r}: {'; '.join(problems)}")
+        return 2
+
+    confirm_above = safety.get('require_confirmation_above')
+    large = [loop.phase for loop in loops if confirm_above and loop.max_iterations > int(confirm_above)]
+    if large and not args.yes:
+        print(f"Error: {', '.join(large)} may run more than {confirm_above} iterations; pass --yes to confirm")
+        return 2
+
+    log_dir = (ralph.get('logging') or {}).get('log_directory')
+    scheduler = Scheduler(root, loops, command=args.command, slots=max(1, args.slots),
+                          total_budget=args.total_budget,
+                          log_dir=os.path.join(root, log_dir) if log_dir else None,
+                          cost_warning=safety.get('cost_warning_threshold'))
+    start = time.perf_counter()
+    try:
+        results = asyncio.run(scheduler.run())
+    except KeyboardInterrupt:
+        print("\nCancelled; running loops were stopped")
+        return 130
+    elapsed = time.perf_counter() - start
+
+    busy = sum(result.seconds for result in results)
+    complete = sum(1 for result in results if result.status == 'complete')
+    print(f"\n{complete}/{len(results)} loops complete, {scheduler.iterations_used} iterations, "
+          f"{elapsed:.1f}s wall ({busy:.1f}s of loop time)")
+    print(f"Logs: {scheduler.log_dir}")
+    return 0 if complete == len(results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
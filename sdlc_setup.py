@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+SDLC Framework Setup Runner
+Runs the phases of setup-sdlc-framework.sh as a dependency graph.
+
+Every phase function of the script is declared in PHASES with the phases
+it depends on and the files it writes. A phase starts as soon as its
+dependencies are done, so independent phases (Spec Kit, Superpowers, BMAD,
+Ralph and 12 Factors configuration; agents next to skills) run side by
+side. A phase is skipped when its outputs exist and its inputs are
+unchanged since it last completed: the phase's function body, the project
+name, the content files it reads and the inputs of the phases it depends
+on, recorded in .sdlc/setup-state.json.
+
+    python3 sdlc_setup.py --project-dir ~/projects/studyabroad-v1
+    python3 sdlc_setup.py --project-dir ~/projects/studyabroad-v1 --yes --jobs 6
+    python3 sdlc_setup.py --project-dir ~/projects/studyabroad-v1 --list
+
+Each phase runs in its own bash, with the script sourced (so its `main` does
+not run) and --dry-run and --yes passed through. Without --yes, phases that
+prompt get the terminal one at a time while the others run with their output
+buffered; with --yes, or when stdin is not a terminal, every prompt takes its
+default answer. The runner makes each phase's git commit once the phase has
+finished, one commit at a time, covering that phase's declared outputs.
+"""
+
+import argparse
+import asyncio
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SCRIPT = os.path.join(SCRIPT_DIR, "setup-sdlc-framework.sh")
+STATE_FILE = os.path.join(".sdlc", "setup-state.json")
+STATE_FORMAT = 1
+
+AGENTS = ('orchestrator', 'requirements', 'architecture', 'design', 'test-manager',
+          'developer', 'security', 'devops', 'documentation', 'operations')
+
+
+class Phase(NamedTuple):
+    number: int
+    function: str
+    title: str
+    depends_on: List[int]
+    # Files and directories the phase writes, relative to the project
+    outputs: List[str]
+    # Files the phase reads, relative to the script directory (globs allowed)
+    inputs: List[str] = []
+    # Whether the phase may prompt on the terminal
+    prompts: bool = False
+
+
+PHASES = [
+    Phase(1, 'phase_1_foundation', 'Foundation Setup', [],
+          ['.gitignore', '.env.example', 'CLAUDE.md'], prompts=True),
+    Phase(2, 'phase_2_spec_kit', 'Spec Kit Installation', [1],
+          ['config/spec-kit/workflow.yaml', '.specify/templates/requirement.md',
+           '.specify/constitution.md'], prompts=True),
+    Phase(3, 'phase_3_superpowers', 'Obra Superpowers Installation', [1],
+          ['config/superpowers/config.yaml'], prompts=True),
+    Phase(4, 'phase_4_bmad', 'BMAD Method Installation', [1],
+          ['.bmad-core', 'config/bmad/agent-mapping.yaml', '.bmad/config.yaml']),
+    Phase(5, 'phase_5_ralph', 'Ralph Wiggum Configuration', [1],
+          ['.ralph/config.yaml', '.ralph/prompts/tdd-implementation.md', '.ralph/prompts/bug-fix.md'],
+          prompts=True),
+    Phase(6, 'phase_6_12factors', '12 Factors Integration', [1],
+          ['config/12-factors/factors.yaml', 'config/12-factors/enforcement.yaml']),
+    Phase(7, 'phase_7_agents', 'Wiring Your 10 Agents', [1],
+          [f"agents/{agent}/agent.yaml" for agent in AGENTS] + ['agents/PROTOCOL.md']),
+    Phase(8, 'phase_8_skills', 'Creating Your 116 Skills', [1],
+          ['skills'], inputs=['populate-skills.py', 'all-skills-content.md', 'skill_*.py'],
+          prompts=True),
+    Phase(9, 'phase_9_orchestrator', 'Orchestrator Configuration', [7],
+          ['agents/orchestrator/orchestrator.yaml', 'agents/orchestrator/commands.md']),
+    Phase(10, 'phase_10_testing', 'Testing the Integration', [2, 3, 4, 5, 6, 7, 8, 9],
+          ['scripts/verify-setup.sh', '.sdlc/workflow-state.json'], prompts=True),
+    Phase(11, 'phase_11_production', 'Production Workflow', [1], ['README.md']),
+    Phase(12, 'phase_12_plugins', 'Plugin Installation', [10, 11], [], prompts=True),
+]
+
+
+class PhaseResult(NamedTuple):
+    number: int
+    function: str
+    status: str          # done | up-to-date | skipped | failed | blocked
+    start: float         # seconds after the run started
+    seconds: float
+    detail: str
+
+
+def phase_source(script_text: str, function: str) -> Optional[str]:
+    """The body of `function() { ... }` in the script, or None."""
+    match = re.search(rf"^{re.escape(function)}\(\) \{{\n.*?^\}}$", script_text, re.M | re.S)
+    return match.group(0) if match else None
+
+
+def load_state(path: str) -> Dict[str, str]:
+    """Phase number -> input key of its last completed run."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('format') != STATE_FORMAT:
+        return {}
+    return data.get('phases', {})
+
+
+def save_state(path: str, phases: Dict[str, str]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.setup-state-')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({'format': STATE_FORMAT, 'phases': phases}, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp, path)
+
+
+class SetupRunner:
+    """Runs phases on `jobs` workers, respecting dependencies and skipping up-to-date phases."""
+
+    def __init__(self, script: str, project_dir: str, phases: List[Phase] = PHASES,
+                 jobs: int = 4, dry_run: bool = False, interactive: bool = False,
+                 force: bool = False, start_phase: int = 1):
+        self.script = script
+        self.project_dir = project_dir
+        self.phases = phases
+        self.jobs = jobs
+        self.dry_run = dry_run
+        self.interactive = interactive
+        self.force = force
+        self.start_phase = start_phase
+        self.state_path = os.path.join(project_dir, STATE_FILE)
+        self.state = load_state(self.state_path)
+        self.results: Dict[int, PhaseResult] = {}
+        with open(script, 'r', encoding='utf-8') as f:
+            self.script_text = f.read()
+        self._keys: Dict[int, str] = {}
+        self._by_number = {phase.number: phase for phase in phases}
+        self._terminal = asyncio.Lock()
+        self._git_lock = asyncio.Lock()
+        self._started = 0.0
+
+    def phase_key(self, phase: Phase) -> str:
+        """Digest of everything the phase's output depends on."""
+        if phase.number not in self._keys:
+            digest = hashlib.sha256()
+            digest.update((phase_source(self.script_text, phase.function) or '').encode())
+            digest.update(os.path.basename(self.project_dir).encode())
+            script_dir = os.path.dirname(os.path.abspath(self.script))
+            for pattern in phase.inputs:
+                for path in sorted(glob.glob(os.path.join(script_dir, pattern))):
+                    digest.update(os.path.basename(path).encode())
+                    with open(path, 'rb') as f:
+                        digest.update(hashlib.sha256(f.read()).digest())
+            for number in phase.depends_on:
+                if number in self._by_number:
+                    digest.update(self.phase_key(self._by_number[number]).encode())
+            self._keys[phase.number] = digest.hexdigest()
+        return self._keys[phase.number]
+
+    def up_to_date(self, phase: Phase) -> bool:
+        if self.force or self.state.get(str(phase.number)) != self.phase_key(phase):
+            return False
+        return all(os.path.exists(os.path.join(self.project_dir, path)) for path in phase.outputs)
+
+    def _command(self, phase: Phase) -> List[str]:
+        args = ['--project-dir', self.project_dir]
+        if self.dry_run:
+            args.append('--dry-run')
+        if not (self.interactive and phase.prompts):
+            args.append('--yes')
+        body = 'script="$1"; shift\nsource "$script"\nparse_args "$@"\n' + phase.function
+        return ['bash', '-c', body, 'sdlc_setup', self.script] + args
+
+    async def _git(self, *args: str) -> Tuple[int, str, str]:
+        """Run git in the project; returns (exit status, stdout, stderr)."""
+        process = await asyncio.create_subprocess_exec(
+            'git', *args, cwd=self.project_dir, stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        stdout, stderr = await process.communicate()
+        return process.returncode, stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
+
+    async def _commit(self, phase: Phase, message: str) -> Optional[str]:
+        """
+        Commit the phase's outputs.
+
+        Returns: None on success (or when there is nothing to commit), else
+        git's error output
+        """
+        paths = [path for path in phase.outputs if os.path.exists(os.path.join(self.project_dir, path))]
+        if not paths or not os.path.isdir(os.path.join(self.project_dir, '.git')):
+            return None
+        # Only the runner stages files, so the commit holds just this phase's
+        # outputs. Ignored outputs are left out, as git add would refuse the
+        # whole list for them.
+        async with self._git_lock:
+            code, stdout, stderr = await self._git('check-ignore', '--', *paths)
+            if code not in (0, 1):
+                return stderr.strip() or f"git check-ignore exited {code}"
+            ignored = set(stdout.splitlines())
+            paths = [path for path in paths if path not in ignored]
+            if not paths:
+                return None
+            code, _, stderr = await self._git('add', '-A', '--', *paths)
+            if code != 0:
+                return stderr.strip() or f"git add exited {code}"
+            code, _, _ = await self._git('diff', '--cached', '--quiet', '--', *paths)
+            if code == 0:
+                return None
+            code, _, stderr = await self._git('commit', '-q', '-m', message)
+            if code != 0:
+                # Unstage, so the next phase's commit does not pick these up
+                await self._git('reset', '-q', '--', *paths)
+                return stderr.strip() or f"git commit exited {code}"
+        return None
+
+    async def run_phase(self, phase: Phase) -> PhaseResult:
+        start = time.perf_counter()
+        fd, commit_file = tempfile.mkstemp(prefix=f"sdlc-setup-{phase.number}-")
+        os.close(fd)
+        env = dict(os.environ, SDLC_COMMIT_FILE=commit_file)
+        cwd = self.project_dir if os.path.isdir(self.project_dir) else SCRIPT_DIR
+        try:
+            if self.interactive and phase.prompts:
+                async with self._terminal:
+                    process = await asyncio.create_subprocess_exec(*self._command(phase), cwd=cwd, env=env)
+                    code = await process.wait()
+            else:
+                process = await asyncio.create_subprocess_exec(
+                    *self._command(phase), cwd=cwd, env=env, stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+                output, _ = await process.communicate()
+                async with self._terminal:
+                    sys.stdout.write(output.decode('utf-8', 'replace'))
+                    sys.stdout.flush()
+                code = process.returncode
+
+            with open(commit_file, 'r', encoding='utf-8') as f:
+                message = f.read().strip()
+            commit_error = None
+            if code == 0 and message:
+                commit_error = await self._commit(phase, message)
+        finally:
+            os.unlink(commit_file)
+
+        if code != 0:
+            status, detail = 'failed', f"exit status {code}"
+        elif commit_error:
+            async with self._terminal:
+                print(f"❌ Phase {phase.number}: git commit failed:\n{commit_error}")
+            status, detail = 'failed', 'git commit failed'
+        else:
+            status, detail = 'done', ''
+        return PhaseResult(phase.number, phase.function, status, start - self._started,
+                           time.perf_counter() - start, detail)
+
+    def _ready(self, started) -> List[Phase]:
+        ready = []
+        for phase in self.phases:
+            if phase.number in started:
+                continue
+            states = [self.results.get(n) for n in phase.depends_on if n in self._by_number]
+            failed = [r.number for r in states if r is not None and r.status in ('failed', 'blocked')]
+            if failed:
+                self.results[phase.number] = PhaseResult(
+                    phase.number, phase.function, 'blocked', 0.0, 0.0,
+                    f"phase {', '.join(map(str, failed))} did not complete")
+                started.add(phase.number)
+                print(f"⏭️  Phase {phase.number}: blocked")
+            elif all(r is not None for r in states):
+                ready.append(phase)
+        return ready
+
+    async def run(self) -> List[PhaseResult]:
+        self._started = time.perf_counter()
+        started = set()
+        running: Dict[asyncio.Task, Phase] = {}
+        try:
+            while True:
+                for phase in self._ready(started):
+                    if phase.number < self.start_phase:
+                        started.add(phase.number)
+                        self.results[phase.number] = PhaseResult(
+                            phase.number, phase.function, 'skipped', 0.0, 0.0,
+                            f"before --phase {self.start_phase}")
+                    elif self.up_to_date(phase):
+                        started.add(phase.number)
+                        self.results[phase.number] = PhaseResult(
+                            phase.number, phase.function, 'up-to-date', 0.0, 0.0, 'outputs current')
+                        print(f"✔ Phase {phase.number}: {phase.title} is up to date")
+                    elif len(running) < self.jobs:
+                        started.add(phase.number)
+                        running[asyncio.ensure_future(self.run_phase(phase))] = phase
+                if not running:
+                    if len(started) == len(self.phases):
+                        break
+                    continue
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    phase = running.pop(task)
+                    result = task.result()
+                    self.results[phase.number] = result
+                    if result.status == 'done' and not self.dry_run:
+                        self.state[str(phase.number)] = self.phase_key(phase)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            if not self.dry_run and os.path.isdir(self.project_dir):
+                try:
+                    save_state(self.state_path, self.state)
+                except OSError as e:
+                    print(f"Warning: Cannot write {self.state_path}: {e}")
+        return [self.results[phase.number] for phase in self.phases if phase.number in self.results]
+
+
+def print_plan(runner: SetupRunner) -> None:
+    print(f"{'phase':<24} {'depends on':<22} {'outputs':>7}  status")
+    for phase in runner.phases:
+        status = 'up to date' if runner.up_to_date(phase) else 'will run'
+        if phase.number < runner.start_phase:
+            status = 'skipped'
+        print(f"{phase.number:>2} {phase.function[len(f'phase_{phase.number}_'):]:<21} "
+              f"{', '.join(map(str, phase.depends_on)) or '-':<22} {len(phase.outputs):>7}  {status}")
+
+
+def print_timings(results: List[PhaseResult], elapsed: float) -> None:
+    print(f"\n{'phase':<24} {'status':<11} {'start (s)':>9} {'time (s)':>9}  detail")
+    for result in results:
+        name = result.function[len(f'phase_{result.number}_'):]
+        print(f"{result.number:>2} {name:<21} {result.status:<11} {result.start:>9.1f} "
+              f"{result.seconds:>9.1f}  {result.detail}")
+    busy = sum(result.seconds for result in results)
+    print(f"\n{elapsed:.1f}s wall, {busy:.1f}s of phase time"
+          + (f" ({busy / elapsed:.1f}x concurrency)" if busy > 0 else ''))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the SDLC framework setup phases as a dependency graph')
+    parser.add_argument('--project-dir', default='.', help='Project directory (default: .)')
+    parser.add_argument('--script', default=DEFAULT_SCRIPT, help='Setup script providing the phase functions')
+    parser.add_argument('--phase', '--skip-to', dest='phase', type=int, default=1, metavar='N',
+                        help='Start from phase N; earlier phases count as done')
+    parser.add_argument('--jobs', '-j', type=int, default=4, help='Phases to run at once (default: 4)')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would be done without making changes')
+    parser.add_argument('--yes', '-y', action='store_true', help='Accept the default answer to every prompt')
+    parser.add_argument('--force', action='store_true', help='Run phases even when they are up to date')
+    parser.add_argument('--list', action='store_true', help='Show the phase graph and what would run')
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.script):
+        print(f"Error: Setup script not found: {args.script}")
+        return 2
+    project_dir = os.path.abspath(os.path.expanduser(args.project_dir))
+    runner = SetupRunner(os.path.abspath(args.script), project_dir, jobs=max(1, args.jobs),
+                         dry_run=args.dry_run, interactive=not args.yes and sys.stdin.isatty(),
+                         force=args.force, start_phase=args.phase)
+    missing = [phase.function for phase in PHASES if phase_source(runner.script_text, phase.function) is None]
+    if missing:
+        print(f"Error: {args.script} does not define {', '.join(missing)}")
+        return 2
+
+    if args.list:
+        print_plan(runner)
+        return 0
+
+    print(f"Project directory: {project_dir}")
+    if args.dry_run:
+        print("DRY RUN MODE - No changes will be made")
+    if runner.interactive:
+        answer = input("Continue with setup? [Y/n] ").strip()
+        if answer and not answer.lower().startswith('y'):
+            print("Setup cancelled")
+            return 0
+
+    start = time.perf_counter()
+    try:
+        results = asyncio.run(runner.run())
+    except KeyboardInterrupt:
+        print("\nCancelled; running phases were stopped")
+        return 130
+    print_timings(results, time.perf_counter() - start)
+
+    failed = [result for result in results if result.status in ('failed', 'blocked')]
+    if failed:
+        print(f"Resume with: {os.path.basename(__file__)} --project-dir {project_dir}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Requirement Traceability Index
+Maps requirement IDs to the specs, designs, code, tests and commits that
+reference them, and back (see skills REQ-008 and TEST-006).
+
+The index lives in .sdlc/trace-index.json and is updated incrementally:
+in a git checkout, only files changed since the indexed commit (plus
+uncommitted and untracked ones) are looked at. Otherwise, or with --full,
+every file (in git, every non-ignored file) is checked and only those
+whose size or mtime changed are rescanned. Queries update the index
+first, so they never grep the tree.
+
+    python3 sdlc_trace.py update
+    python3 sdlc_trace.py show REQ-001
+    python3 sdlc_trace.py coverage
+    python3 sdlc_trace.py impact src/auth/login.ts        # tests to re-run
+    python3 sdlc_trace.py impact --git origin/main
+    python3 sdlc_trace.py impact REQ-004
+
+IDs follow the REQ-008 scheme (REQ-, NFR-, US-, DES-, TC-, ADR- and a
+number). Files under skills/ are not indexed: they are skill templates
+whose example IDs do not belong to the project.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+INDEX_PATH = os.path.join(".sdlc", "trace-index.json")
+INDEX_FORMAT = 1
+
+ID_RE = re.compile(rb"\b(?:REQ|NFR|US|DES|TC|ADR)-\d+\b")
+
+# Prefixes of IDs that state requirements (the coverage query's subjects)
+REQUIREMENT_PREFIXES = ('REQ-', 'NFR-', 'US-')
+
+SKIP_DIRS = {'.git', 'node_modules', '.venv', 'venv', '__pycache__', '.pytest_cache',
+             '.mypy_cache', '.tox', 'dist', 'build', '.next', 'coverage', 'skills', '.sdlc'}
+
+TEXT_EXTENSIONS = {
+    '.md', '.txt', '.rst', '.adoc', '.yaml', '.yml', '.json', '.feature', '.gherkin',
+    '.py', '.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs', '.java', '.kt', '.go', '.rs',
+    '.rb', '.php', '.cs', '.swift', '.c', '.h', '.cpp', '.hpp', '.scala', '.sql', '.sh',
+    '.vue', '.svelte', '.html', '.css', '.scss', '.tf', '.proto', '.graphql',
+}
+
+KINDS = ('spec', 'design', 'test', 'code', 'doc')
+
+_TEST_RE = re.compile(r"(^|/)(tests?|__tests__|spec|e2e)/|(^|/)test_[^/]*$|_test\.[^/.]+$"
+                      r"|\.(test|spec)\.[^/.]+$|\.feature$")
+
+
+def artifact_kind(path: str) -> str:
+    """Classify a project-relative path as spec, design, test, code or doc."""
+    if path.startswith(('.specify/', 'docs/requirements/')):
+        return 'spec'
+    if path.startswith(('docs/architecture/', 'docs/design/')):
+        return 'design'
+    if _TEST_RE.search(path):
+        return 'test'
+    if path.startswith('docs/') or os.path.splitext(path)[1] in ('.md', '.txt', '.rst', '.adoc'):
+        return 'doc'
+    return 'code'
+
+
+def _indexable(path: str) -> bool:
+    parts = path.split('/')
+    return (not any(part in SKIP_DIRS for part in parts[:-1])
+            and os.path.splitext(path)[1].lower() in TEXT_EXTENSIONS)
+
+
+def _git(root: str, *args: str) -> Optional[str]:
+    try:
+        result = subprocess.run(['git', '-C', root, *args], capture_output=True, text=True, check=False)
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _git_diff(root: str, *revisions: str) -> Optional[List[str]]:
+    """Changed paths under root, relative to it (root may be below the repository top)."""
+    diff = _git(root, 'diff', '--name-only', '--relative', '--no-renames', *revisions)
+    return None if diff is None else [path for path in diff.split('\n') if path]
+
+
+def _git_status(root: str) -> Optional[Set[str]]:
+    """Modified and untracked paths under root, relative to it."""
+    prefix = _git(root, 'rev-parse', '--show-prefix')
+    status = _git(root, 'status', '--porcelain', '--untracked-files=all', '--no-renames', '--', '.')
+    if prefix is None or status is None:
+        return None
+    # Porcelain paths are always relative to the repository top
+    prefix = prefix.strip()
+    paths = (line[3:].strip('"') for line in status.split('\n') if len(line) > 3)
+    return {path[len(prefix):] for path in paths if path.startswith(prefix)}
+
+
+class TraceIndex:
+    """
+    Bidirectional requirement <-> artifact index.
+
+    files:   path -> [size, mtime_ns, [ids]]
+    ids:     id -> [paths]
+    commits: sha -> [subject, [ids]]
+    """
+
+    def __init__(self, root: str = '.', index_path: Optional[str] = None):
+        self.root = root
+        self.index_path = index_path or os.path.join(root, INDEX_PATH)
+        self.files: Dict[str, list] = {}
+        self.ids: Dict[str, Set[str]] = {}
+        self.commits: Dict[str, list] = {}
+        self.head: Optional[str] = None
+        # Paths that differed from HEAD when indexed; rechecked on the next update
+        self.dirty: Set[str] = set()
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('format') != INDEX_FORMAT:
+            return
+        self.files = data['files']
+        self.ids = {req_id: set(paths) for req_id, paths in data['ids'].items()}
+        self.commits = data['commits']
+        self.head = data.get('head')
+        self.dirty = set(data.get('dirty', []))
+
+    def save(self) -> None:
+        directory = os.path.dirname(self.index_path)
+        os.makedirs(directory, exist_ok=True)
+        data = {'format': INDEX_FORMAT, 'head': self.head, 'dirty': sorted(self.dirty),
+                'files': self.files, 'ids': {req_id: sorted(paths) for req_id, paths in sorted(self.ids.items())},
+                'commits': self.commits}
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, self.index_path)
+
+    # -- updating ----------------------------------------------------------
+
+    def _set_ids(self, path: str, new_ids: Iterable[str]) -> None:
+        old = set(self.files[path][2]) if path in self.files else set()
+        new = set(new_ids)
+        for req_id in old - new:
+            paths = self.ids.get(req_id)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self.ids[req_id]
+        for req_id in new - old:
+            self.ids.setdefault(req_id, set()).add(path)
+
+    def _refresh(self, path: str) -> bool:
+        """Rescan one path if its size or mtime changed; True if it was rescanned or removed."""
+        try:
+            stat = os.stat(os.path.join(self.root, path))
+        except OSError:
+            if path in self.files:
+                self._set_ids(path, ())
+                del self.files[path]
+                return True
+            return False
+        entry = self.files.get(path)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return False
+        try:
+            with open(os.path.join(self.root, path), 'rb') as f:
+                found = sorted({m.decode() for m in ID_RE.findall(f.read())})
+        except OSError:
+            return False
+        self._set_ids(path, found)
+        self.files[path] = [stat.st_size, stat.st_mtime_ns, found]
+        return True
+
+    def _walk(self) -> List[str]:
+        paths = []
+        stack = ['']
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = os.scandir(os.path.join(self.root, rel_dir) if rel_dir else self.root)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(rel)
+                    elif _indexable(rel):
+                        paths.append(rel)
+        return paths
+
+    def _tracked(self) -> List[str]:
+        """Tracked and untracked, non-ignored files of a git checkout."""
+        listing = _git(self.root, 'ls-files', '--cached', '--others', '--exclude-standard') or ''
+        return [path for path in listing.split('\n') if path and _indexable(path)]
+
+    def _git_candidates(self, head: str) -> Optional[Set[str]]:
+        """Paths that may differ from the index, from git; None if git cannot tell."""
+        if not self.head:
+            return None
+        committed = _git_diff(self.root, self.head, head)
+        changed = _git_status(self.root)
+        if committed is None or changed is None:
+            return None
+        self.dirty, previously_dirty = changed, self.dirty
+        return set(committed) | changed | previously_dirty
+
+    def update(self, full: bool = False) -> Dict[str, int]:
+        """Bring the index up to date; returns counts of checked and rescanned files."""
+        head = (_git(self.root, 'rev-parse', 'HEAD') or '').strip() or None
+        candidates = None if full or head is None else self._git_candidates(head)
+        if candidates is None:
+            if head:
+                self.dirty = _git_status(self.root) or set()
+            present = set(self._tracked() if head else self._walk())
+            candidates = present | (set(self.files) - present)
+        candidates = {path for path in candidates if path and _indexable(path)}
+
+        rescanned = sum(1 for path in sorted(candidates) if self._refresh(path))
+        new_commits = self._update_commits(head)
+        self.head = head
+        self.save()
+        return {'checked': len(candidates), 'rescanned': rescanned, 'files': len(self.files),
+                'ids': len(self.ids), 'commits': new_commits}
+
+    def _update_commits(self, head: Optional[str]) -> int:
+        if not head or head == self.head:
+            return 0
+        # Only the new commits when the indexed head is an ancestor, else all history
+        known = self.head and _git(self.root, 'merge-base', '--is-ancestor', self.head, head) is not None
+        revision = f"{self.head}..{head}" if known else head
+        log = _git(self.root, 'log', '--format=%H%x00%s%x00%b%x1e', revision)
+        if log is None:
+            return 0
+        added = 0
+        for record in log.split('\x1e'):
+            fields = record.strip('\n').split('\x00')
+            if len(fields) < 3:
+                continue
+            sha, subject, body = fields[0], fields[1], fields[2]
+            found = sorted({m.decode() for m in ID_RE.findall(f"{subject}\n{body}".encode())})
+            if found:
+                self.commits[sha] = [subject, found]
+                added += 1
+        return added
+
+    # -- queries -----------------------------------------------------------
+
+    def artifacts(self, req_id: str) -> Dict[str, List[str]]:
+        """Files referencing req_id, grouped by kind."""
+        grouped: Dict[str, List[str]] = {}
+        for path in sorted(self.ids.get(req_id, ())):
+            grouped.setdefault(artifact_kind(path), []).append(path)
+        return grouped
+
+    def commits_for(self, req_id: str) -> List[tuple]:
+        return [(sha, subject) for sha, (subject, found) in self.commits.items() if req_id in found]
+
+    def requirements(self) -> List[str]:
+        """Requirement IDs stated in spec documents."""
+        return sorted(req_id for req_id, paths in self.ids.items()
+                      if req_id.startswith(REQUIREMENT_PREFIXES)
+                      and any(artifact_kind(path) == 'spec' for path in paths))
+
+    def coverage(self) -> Dict[str, Dict[str, int]]:
+        """Per requirement, the number of test, code and design artifacts referencing it."""
+        report = {}
+        for req_id in self.requirements():
+            kinds = self.artifacts(req_id)
+            report[req_id] = {kind: len(kinds.get(kind, ())) for kind in ('design', 'code', 'test')}
+        return report
+
+    def impact(self, changes: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Impact of changed files and/or IDs, in TEST-006 categories.
+
+        Tests referencing an affected ID must run; other artifacts that
+        reference it should be reviewed.
+        """
+        affected: Set[str] = set()
+        changed_paths: Set[str] = set()
+        for change in changes:
+            if ID_RE.fullmatch(change.encode()):
+                affected.add(change)
+            else:
+                path = os.path.relpath(change, self.root) if os.path.isabs(change) else change
+                changed_paths.add(path.replace(os.sep, '/'))
+                affected.update(self.files.get(path, (0, 0, []))[2])
+
+        must_run, must_review = set(), set()
+        for req_id in affected:
+            for path in self.ids.get(req_id, ()):
+                if path in changed_paths:
+                    continue
+                (must_run if artifact_kind(path) == 'test' else must_review).add(path)
+        must_run.update(path for path in changed_paths if artifact_kind(path) == 'test')
+        return {'requirements': sorted(affected), 'must_run': sorted(must_run),
+                'must_review': sorted(must_review)}
+
+
+def _print_update(stats: Dict[str, int], elapsed: float) -> None:
+    print(f"✅ Index updated in {elapsed * 1e3:.0f} ms: {stats['rescanned']} of {stats['checked']} "
+          f"checked file(s) rescanned, {stats['files']} files, {stats['ids']} IDs, "
+          f"{stats['commits']} new commit(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Requirement traceability index')
+    parser.add_argument('--project', default='.', help='Project directory (default: .)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--no-update', action='store_true', help='Query the index as it is')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    update = commands.add_parser('update', help='Update the index')
+    update.add_argument('--full', action='store_true', help='Walk the whole tree instead of asking git')
+
+    show = commands.add_parser('show', help='Artifacts and commits referencing IDs')
+    show.add_argument('ids', nargs='+', help='Requirement IDs, e.g. REQ-001')
+
+    coverage = commands.add_parser('coverage', help='Design/code/test coverage of spec requirements')
+    coverage.add_argument('--uncovered', action='store_true', help='Only list requirements without tests')
+
+    impact = commands.add_parser('impact', help='Tests and artifacts affected by changes')
+    impact.add_argument('changes', nargs='*', help='Changed files or requirement IDs')
+    impact.add_argument('--git', nargs='?', const='HEAD', metavar='BASE',
+                        help='Also use files changed against BASE (default: uncommitted changes)')
+
+    args = parser.parse_args()
+    index = TraceIndex(args.project)
+
+    if args.command == 'update' or not args.no_update:
+        start = time.perf_counter()
+        stats = index.update(full=getattr(args, 'full', False))
+        if args.command == 'update':
+            if args.json:
+                print(json.dumps(stats))
+            else:
+                _print_update(stats, time.perf_counter() - start)
+            return 0
+
+    if args.command == 'show':
+        result = {req_id: {'artifacts': index.artifacts(req_id),
+                           'commits': [{'sha': sha, 'subject': subject}
+                                       for sha, subject in index.commits_for(req_id)]}
+                  for req_id in args.ids}
+        if args.json:
+            print(json.dumps(result, indent=2))
+            return 0
+        for req_id, found in result.items():
+            print(f"{req_id}:")
+            if not found['artifacts'] and not found['commits']:
+                print("  (no references)")
+            for kind in KINDS:
+                for path in found['artifacts'].get(kind, ()):
+                    print(f"  {kind:<7} {path}")
+            for commit in found['commits']:
+                print(f"  commit  {commit['sha'][:10]} {commit['subject']}")
+        return 0
+
+    if args.command == 'coverage':
+        report = index.coverage()
+        if args.uncovered:
+            report = {req_id: counts for req_id, counts in report.items() if not counts['test']}
+        if args.json:
+            print(json.dumps(report, indent=2))
+            return 0
+        print(f"{'requirement':<12} {'design':>6} {'code':>5} {'tests':>5}")
+        for req_id, counts in report.items():
+            mark = '' if counts['test'] else '  ❌ untested'
+            print(f"{req_id:<12} {counts['design']:>6} {counts['code']:>5} {counts['test']:>5}{mark}")
+        total = len(index.requirements())
+        tested = sum(1 for counts in index.coverage().values() if counts['test'])
+        print(f"\n{tested}/{total} requirements have tests"
+              + (f" ({tested / total:.0%})" if total else ''))
+        return 0 if tested == total else 1
+
+    changes = list(args.changes)
+    if args.git:
+        changes += _git_diff(args.project, args.git) or []
+        changes += sorted(_git_status(args.project) or ())
+    if not changes:
+        parser.error('impact needs changed files or IDs (or --git)')
+    result = index.impact(dict.fromkeys(changes))
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+    print(f"Affected requirements: {', '.join(result['requirements']) or '(none)'}")
+    print(f"\nMUST_RUN ({len(result['must_run'])} test file(s)):")
+    for path in result['must_run']:
+        print(f"  {path}")
+    print(f"\nMUST_REVIEW ({len(result['must_review'])} artifact(s)):")
+    for path in result['must_review']:
+        print(f"  {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
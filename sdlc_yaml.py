@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+SDLC Config Loader
+Reads the framework's YAML config files (agents/, config/, .ralph/, ...).
+
+PyYAML is used when installed. Otherwise a built-in parser handles the
+subset of YAML the framework's files use: nested mappings, block
+sequences of scalars or mappings, inline [a, b] lists, quoted strings,
+'|' and '>' block scalars and '#' comments.
+
+    from sdlc_yaml import load_yaml
+    orchestrator = load_yaml("agents/orchestrator/orchestrator.yaml")
+    print(orchestrator["gates"]["requirements"]["required"])
+"""
+
+import re
+from typing import Any, List, Tuple
+
+_KEY_RE = re.compile(r"""^("[^"]*"|'[^']*'|[^\s'"#-][^:]*?|-[^\s:][^:]*?):(?:\s+|$)""")
+_INT_RE = re.compile(r"^[-+]?\d+$")
+_FLOAT_RE = re.compile(r"^[-+]?(\d+\.\d*|\.\d+)([eE][-+]?\d+)?$")
+_BOOLEANS = {'true': True, 'yes': True, 'on': True, 'false': False, 'no': False, 'off': False}
+
+
+def _strip_comment(text: str) -> str:
+    quote = None
+    for i, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '\'"' and (i == 0 or text[i - 1] in ' [,:-'):
+            quote = char
+        elif char == '#' and (i == 0 or text[i - 1] in ' \t'):
+            return text[:i].rstrip()
+    return text.rstrip()
+
+
+def parse_scalar(value: str) -> Any:
+    """Convert a plain, quoted or inline-list scalar to its Python value."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '\'"':
+        return value[1:-1]
+    if value.startswith('[') and value.endswith(']'):
+        return [parse_scalar(item) for item in value[1:-1].split(',') if item.strip()]
+    if value == '{}':
+        return {}
+    lowered = value.lower()
+    if lowered in _BOOLEANS:
+        return _BOOLEANS[lowered]
+    if lowered in ('', '~', 'null'):
+        return None
+    if _INT_RE.match(value):
+        return int(value)
+    if _FLOAT_RE.match(value):
+        return float(value)
+    return value
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.raw = text.split('\n')
+        # (raw line number, indent, content) of every line with content
+        self.lines: List[Tuple[int, int, str]] = []
+        for number, raw in enumerate(self.raw):
+            content = _strip_comment(raw)
+            if content.strip() and content.strip() != '---':
+                self.lines.append((number, len(content) - len(content.lstrip()), content.strip()))
+        self.i = 0
+
+    def parse(self) -> Any:
+        if not self.lines:
+            return None
+        value = self._block(self.lines[0][1])
+        if self.i < len(self.lines):
+            raise ValueError(f"line {self.lines[self.i][0] + 1}: unexpected indentation")
+        return value
+
+    @staticmethod
+    def _is_item(content: str) -> bool:
+        return content == '-' or content.startswith('- ')
+
+    def _block(self, indent: int) -> Any:
+        if self._is_item(self.lines[self.i][2]):
+            return self._sequence(indent)
+        return self._mapping(indent)
+
+    def _mapping(self, indent: int) -> dict:
+        result = {}
+        while self.i < len(self.lines):
+            number, line_indent, content = self.lines[self.i]
+            if line_indent != indent or self._is_item(content):
+                break
+            match = _KEY_RE.match(content)
+            if not match:
+                raise ValueError(f"line {number + 1}: expected 'key: value'")
+            key = parse_scalar(match.group(1))
+            value = content[match.end():]
+            self.i += 1
+            if value[:1] in ('|', '>'):
+                result[key] = self._block_scalar(number, indent, value)
+            elif value:
+                result[key] = parse_scalar(value)
+            else:
+                result[key] = self._nested(indent)
+        return result
+
+    def _nested(self, indent: int) -> Any:
+        """Value of a key with nothing after the colon."""
+        if self.i >= len(self.lines):
+            return None
+        _, line_indent, content = self.lines[self.i]
+        # Sequences may sit at the same indent as their key
+        if line_indent > indent or (line_indent == indent and self._is_item(content)):
+            return self._block(line_indent)
+        return None
+
+    def _sequence(self, indent: int) -> list:
+        items = []
+        while self.i < len(self.lines):
+            number, line_indent, content = self.lines[self.i]
+            if line_indent != indent or not self._is_item(content):
+                break
+            rest = content[1:].lstrip()
+            if not rest:
+                self.i += 1
+                items.append(self._nested(indent))
+            elif _KEY_RE.match(rest) and not rest.startswith('['):
+                # "- key: value" starts a mapping indented past the dash
+                item_indent = indent + len(content) - len(rest)
+                self.lines[self.i] = (number, item_indent, rest)
+                items.append(self._mapping(item_indent))
+            else:
+                self.i += 1
+                items.append(parse_scalar(rest))
+        return items
+
+    def _block_scalar(self, number: int, indent: int, header: str) -> str:
+        end = number + 1
+        while end < len(self.raw) and (not self.raw[end].strip()
+                                       or len(self.raw[end]) - len(self.raw[end].lstrip()) > indent):
+            end += 1
+        body = self.raw[number + 1:end]
+        while body and not body[-1].strip():
+            body.pop()
+        while self.i < len(self.lines) and self.lines[self.i][0] < end:
+            self.i += 1
+        if not body:
+            return ''
+        margin = min(len(line) - len(line.lstrip()) for line in body if line.strip())
+        body = [line[margin:] for line in body]
+        if header[0] == '|':
+            text = '\n'.join(body)
+        else:
+            text = re.sub(r"(?<!\n)\n(?!\n)", ' ', '\n'.join(body)).replace('\n\n', '\n')
+        return text if header.endswith('-') else text + '\n'
+
+
+def parse_simple_yaml(text: str) -> Any:
+    """Parse YAML text with the built-in subset parser."""
+    return _Parser(text).parse()
+
+
+def load_yaml(path: str) -> Any:
+    """Load a YAML file, with PyYAML when available."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    try:
+        import yaml
+    except ImportError:
+        return parse_simple_yaml(text)
+    return yaml.safe_load(text)
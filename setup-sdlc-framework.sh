@@ -8,8 +8,12 @@
 #   ./setup-sdlc-framework.sh --phase 3       # Start from phase 3
 #   ./setup-sdlc-framework.sh --skip-to 5     # Skip to phase 5
 #   ./setup-sdlc-framework.sh --dry-run       # Show what would be done
+#   ./setup-sdlc-framework.sh --yes           # Accept the default answer to every prompt
 #   ./setup-sdlc-framework.sh --project-dir /path/to/project  # Use specific directory
 #
+# sdlc_setup.py runs the same phases as a dependency graph, concurrently
+# where they are independent and skipping phases that are up to date.
+#
 
 set -e  # Exit on error
 
@@ -35,6 +39,7 @@ NC='\033[0m' # No Color
 # State tracking
 CURRENT_PHASE=1
 DRY_RUN=false
+NON_INTERACTIVE=false
 START_PHASE=1
 
 # =============================================================================
@@ -81,6 +86,9 @@ prompt_continue() {
     local message="${1:-Press Enter to continue...}"
     echo ""
     echo -e "${YELLOW}${message}${NC}"
+    if [[ "$NON_INTERACTIVE" == true ]]; then
+        return 0
+    fi
     read -r
 }
 
@@ -95,7 +103,12 @@ prompt_yes_no() {
     fi
 
     echo -e "${YELLOW}${message} ${prompt}${NC}"
-    read -r response
+    if [[ "$NON_INTERACTIVE" == true ]]; then
+        response="$default"
+        echo "$response"
+    else
+        read -r response
+    fi
 
     if [[ -z "$response" ]]; then
         response="$default"
@@ -147,6 +160,21 @@ create_file() {
     fi
 }
 
+commit_phase() {
+    local message="$1"
+
+    if [[ "$DRY_RUN" == true ]]; then
+        return 0
+    fi
+    if [[ -n "${SDLC_COMMIT_FILE:-}" ]]; then
+        # Run by sdlc_setup.py, which commits once the phase has finished
+        echo "$message" > "$SDLC_COMMIT_FILE"
+        return 0
+    fi
+    git add -A
+    git commit -m "$message" || true
+}
+
 # =============================================================================
 # Phase Functions
 # =============================================================================
@@ -266,6 +294,14 @@ Thumbs.db
 # Project specific
 .sdlc/workflow-state.json
 .sdlc/ralph-logs/
+
+# SDLC framework tool caches
+.sdlc/setup-state.json
+.sdlc/gate-cache.json
+.sdlc/trace-index.json
+.sdlc/enforcement-rules.json
+.sdlc/broker.sock
+skills/.skill-verify-cache.json
 "
 
     # Create .env template
@@ -342,10 +378,7 @@ This project uses a 10-agent SDLC framework with 116 skills, integrating:
 - PII encryption required
 "
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "chore: initialize ${PROJECT_NAME} project structure" || true
-    fi
+    commit_phase "chore: initialize ${PROJECT_NAME} project structure"
 
     print_success "Phase 1 complete!"
 }
@@ -514,10 +547,7 @@ Every feature must demonstrably improve the student experience across the journe
 - Prefer well-supported libraries
 "
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "feat: configure Spec Kit with ${PROJECT_NAME} workflow" || true
-    fi
+    commit_phase "feat: configure Spec Kit with ${PROJECT_NAME} workflow"
 
     print_success "Phase 2 complete!"
 }
@@ -580,10 +610,7 @@ code_review_config:
     - payment/
 "
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "feat: configure Obra Superpowers for ${PROJECT_NAME}" || true
-    fi
+    commit_phase "feat: configure Obra Superpowers for ${PROJECT_NAME}"
 
     print_success "Phase 3 complete!"
 }
@@ -764,10 +791,7 @@ checklists:
   change: .bmad-core/checklists/change-checklist.md
 "
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "feat: install and configure BMAD method for ${PROJECT_NAME}" || true
-    fi
+    commit_phase "feat: install and configure BMAD method for ${PROJECT_NAME}"
 
     print_success "Phase 4 complete!"
 }
@@ -916,10 +940,7 @@ When all criteria met, output: <promise>IMPLEMENTATION_COMPLETE</promise>
 When all criteria met, output: <promise>BUG_FIXED</promise>
 "
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "feat: configure Ralph Wiggum plugin for autonomous execution loops" || true
-    fi
+    commit_phase "feat: configure Ralph Wiggum plugin for autonomous execution loops"
 
     print_success "Phase 5 complete!"
 }
@@ -1045,10 +1066,7 @@ enforcement_rules:
     message: 'Factor 11: Security review required'
 "
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "feat: add 12 Factors configuration for ${PROJECT_NAME}" || true
-    fi
+    commit_phase "feat: add 12 Factors configuration for ${PROJECT_NAME}"
 
     print_success "Phase 6 complete!"
 }
@@ -1582,10 +1600,7 @@ All inter-agent communication uses this structure:
 4. Architecture decisions -> Architecture Agent
 "
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "feat: create agent definitions and communication protocol" || true
-    fi
+    commit_phase "feat: create agent definitions and communication protocol"
 
     print_success "Phase 7 complete!"
 }
@@ -1604,16 +1619,23 @@ phase_8_skills() {
                     --content-dir "${CONTENT_DIR}" \
                     --skills-dir "${PROJECT_DIR}/skills" \
                     --dry-run \
+                    --incremental \
                     --verify-ownership
             else
                 python3 "${CONTENT_DIR}/populate-skills.py" \
                     --content-dir "${CONTENT_DIR}" \
                     --skills-dir "${PROJECT_DIR}/skills" \
+                    --incremental \
                     --verify-ownership
             fi
+            print_info "Optional agent indexes, built by re-running with any of these flags:"
+            echo "  python3 ${CONTENT_DIR}/populate-skills.py --content-dir ${CONTENT_DIR} --skills-dir ${PROJECT_DIR}/skills --incremental [flags]"
+            echo "  --search-index   BM25 search index (skills/.skill-search.json)"
+            echo "  --section-toc    per-section table of contents for partial SKILL.md loads"
+            echo "  --context-packs  prebuilt per-agent context packs (skills/.context-packs/)"
         else
             print_info "Skipping skill population - you can run it later with:"
-            echo "  python3 ${CONTENT_DIR}/populate-skills.py --content-dir ${CONTENT_DIR} --skills-dir ${PROJECT_DIR}/skills"
+            echo "  python3 ${CONTENT_DIR}/populate-skills.py --content-dir ${CONTENT_DIR} --skills-dir ${PROJECT_DIR}/skills --incremental"
         fi
     else
         print_warning "Skill content files not found"
@@ -1630,10 +1652,7 @@ phase_8_skills() {
         fi
     fi
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "feat: populate 116 skills with ownership pattern" || true
-    fi
+    commit_phase "feat: populate 116 skills with ownership pattern"
 
     print_success "Phase 8 complete!"
 }
@@ -1730,10 +1749,7 @@ delegation:
 \`\`\`
 "
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "feat: configure orchestrator with workflow and gates" || true
-    fi
+    commit_phase "feat: configure orchestrator with workflow and gates"
 
     print_success "Phase 9 complete!"
 }
@@ -1744,9 +1760,24 @@ phase_10_testing() {
     cd "$PROJECT_DIR"
 
     print_step "Creating integration test script..."
+    # The full checks live in the framework's scripts/verify-setup.py (it imports
+    # the framework's skill modules); without the framework, the wrapper runs
+    # the same structural checks in bash.
     create_file "scripts/verify-setup.sh" '#!/bin/bash
 # Verify SDLC Framework Setup
+# Runs the SDLC framework verifier (cached, parallel SKILL.md checks) when the
+# framework is available, and the self-contained checks below otherwise.
 
+cd "$(dirname "$0")/.." || exit 2
+
+VERIFIER="${SDLC_VERIFIER:-'"${SCRIPT_DIR}"'/scripts/verify-setup.py}"
+if [ -f "$VERIFIER" ] && command -v python3 >/dev/null 2>&1; then
+    exec python3 "$VERIFIER" "$@"
+fi
+
+echo "ℹ️  Framework verifier not found ($VERIFIER); running basic checks"
+echo "   (set SDLC_VERIFIER to the framework'"'"'s scripts/verify-setup.py for SKILL.md checks)"
+echo ""
 echo "========================================"
 echo "SDLC Framework Setup Verification"
 echo "========================================"
@@ -1831,8 +1862,7 @@ echo "6. Checking skill wiring in agents..."
 wired_agents=0
 for agent in "${agents[@]}"; do
     if [ -f "agents/$agent/agent.yaml" ]; then
-        skill_refs=$(grep -c "skills:" "agents/$agent/agent.yaml" 2>/dev/null || echo "0")
-        skill_lines=$(grep -A 20 "superpowers:" "agents/$agent/agent.yaml" 2>/dev/null | grep -c "      - " || echo "0")
+        skill_lines=$(grep -A 20 "superpowers:" "agents/$agent/agent.yaml" 2>/dev/null | grep -c "      - " || true)
         if [ "$skill_lines" -gt 0 ]; then
             echo "   ✅ agents/$agent has $skill_lines skills wired"
             ((wired_agents++))
@@ -1855,7 +1885,7 @@ bmad_wired=0
 for agent in "${agents[@]}"; do
     if [ -f "agents/$agent/agent.yaml" ]; then
         if grep -q "personas:" "agents/$agent/agent.yaml" 2>/dev/null; then
-            persona_count=$(grep -A 10 "bmad:" "agents/$agent/agent.yaml" 2>/dev/null | grep -c "file:" || echo "0")
+            persona_count=$(grep -A 10 "bmad:" "agents/$agent/agent.yaml" 2>/dev/null | grep -c "file:" || true)
             if [ "$persona_count" -gt 0 ]; then
                 echo "   ✅ agents/$agent has $persona_count BMAD persona(s) linked"
                 ((bmad_wired++))
@@ -1906,10 +1936,7 @@ exit $errors
   "updated_at": "'$(date -u +"%Y-%m-%dT%H:%M:%SZ")'"
 }'
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "feat: add integration test script and initial workflow state" || true
-    fi
+    commit_phase "feat: add integration test script and initial workflow state"
 
     print_success "Phase 10 complete!"
 }
@@ -1978,10 +2005,7 @@ This project uses a 10-agent SDLC framework. See [CLAUDE.md](CLAUDE.md) for deta
 [Your License]
 "
 
-    if [[ "$DRY_RUN" != true ]]; then
-        git add -A
-        git commit -m "docs: add README and finalize project setup" || true
-    fi
+    commit_phase "docs: add README and finalize project setup"
 
     print_success "Phase 11 complete!"
 }
@@ -2068,6 +2092,10 @@ parse_args() {
                 DRY_RUN=true
                 shift
                 ;;
+            --yes|-y)
+                NON_INTERACTIVE=true
+                shift
+                ;;
             --project-dir)
                 PROJECT_DIR="$2"
                 PROJECT_NAME="$(basename "${PROJECT_DIR}")"
@@ -2080,6 +2108,7 @@ parse_args() {
                 echo "  --phase N       Start from phase N"
                 echo "  --skip-to N     Skip to phase N"
                 echo "  --dry-run       Show what would be done without making changes"
+                echo "  --yes, -y       Accept the default answer to every prompt"
                 echo "  --project-dir   Override project directory"
                 echo "  --help          Show this help message"
                 echo ""
@@ -2156,5 +2185,7 @@ main() {
     done
 }
 
-# Run main
-main "$@"
+# Run main (unless sourced, as sdlc_setup.py does to run single phases)
+if [[ "${BASH_SOURCE[0]}" == "$0" ]]; then
+    main "$@"
+fi
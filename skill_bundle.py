@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Skill Bundle
+Packs a populated skills tree into a single file for fast agent startup.
+
+Instead of walking skills/**/SKILL.md and parsing 116 frontmatter blocks,
+an agent opens one bundle, reads its header index and slices out just the
+skills it needs straight from a memory map:
+
+    from skill_bundle import SkillBundle
+    with SkillBundle("skills/.skills.bundle") as bundle:
+        bundle.frontmatter("DEV-011")["owner"]   # 'developer'
+        bundle.text("DEV-011")                   # full SKILL.md
+
+Layout (all integers little-endian):
+
+    magic        8 bytes   b"SKBUNDLE"
+    header_len   uint32    length of the JSON header in bytes
+    header       JSON      {"format": 1, "skills": {skill_id: [offset, length, path, frontmatter]}}
+    data         bytes     concatenated UTF-8 SKILL.md files
+
+Offsets are relative to the start of the data section.
+"""
+
+import json
+import mmap
+import struct
+from typing import Dict, Iterable, List, Tuple, Union
+
+from skill_frontmatter import parse_list_value, tokenize_frontmatter
+
+# Bundle file written at the root of a skills tree by populate-skills.py --bundle
+BUNDLE_FILENAME = ".skills.bundle"
+
+BUNDLE_MAGIC = b"SKBUNDLE"
+BUNDLE_FORMAT = 1
+_HEADER_LEN = struct.Struct("<I")
+
+FrontmatterValue = Union[str, List[str]]
+
+
+def parse_frontmatter(text: str) -> Dict[str, FrontmatterValue]:
+    """
+    Parse the simple 'key: value' frontmatter of a rendered SKILL.md.
+
+    Inline lists such as '[DEV-001, DEV-002]' become Python lists.
+    Returns an empty dict when the text has no frontmatter.
+    """
+    if not text.startswith('---\n'):
+        return {}
+    end = text.find('\n---\n', 4)
+    if end == -1:
+        return {}
+
+    fields, _ = tokenize_frontmatter(text[4:end], table=None)
+    for key, value in fields.items():
+        if value.startswith('[') and value.endswith(']'):
+            fields[key] = parse_list_value(value)
+    return fields
+
+
+def pack_bundle(entries: Iterable[Tuple[str, str, str]]) -> bytes:
+    """
+    Pack (skill_id, path, SKILL.md text) entries into bundle bytes.
+    """
+    index = {}
+    chunks = []
+    offset = 0
+    for skill_id, path, text in entries:
+        data = text.encode('utf-8')
+        index[skill_id] = [offset, len(data), path, parse_frontmatter(text)]
+        chunks.append(data)
+        offset += len(data)
+
+    header = json.dumps({'format': BUNDLE_FORMAT, 'skills': index},
+                        separators=(',', ':')).encode('utf-8')
+    return b''.join([BUNDLE_MAGIC, _HEADER_LEN.pack(len(header)), header] + chunks)
+
+
+class SkillBundle:
+    """
+    Read-only view of a bundle file backed by a memory map.
+
+    view() returns zero-copy memoryview slices into the map; release them
+    before calling close().
+    """
+
+    def __init__(self, bundle_path: str):
+        self._file = open(bundle_path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files
+            self._file.close()
+            raise ValueError(f"not a skill bundle: {bundle_path}")
+
+        try:
+            if self._map[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+                raise ValueError(f"not a skill bundle: {bundle_path}")
+            start = len(BUNDLE_MAGIC)
+            (header_len,) = _HEADER_LEN.unpack_from(self._map, start)
+            start += _HEADER_LEN.size
+            header = json.loads(self._map[start:start + header_len])
+            if header.get('format') != BUNDLE_FORMAT:
+                raise ValueError(f"unsupported bundle format: {header.get('format')!r}")
+        except Exception:
+            self.close()
+            raise
+
+        self._data_start = start + header_len
+        self._index: Dict[str, list] = header['skills']
+
+    def __enter__(self) -> 'SkillBundle':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, skill_id: str) -> bool:
+        return skill_id in self._index
+
+    def skill_ids(self) -> List[str]:
+        return list(self._index)
+
+    def path(self, skill_id: str) -> str:
+        return self._index[skill_id][2]
+
+    def frontmatter(self, skill_id: str) -> Dict[str, FrontmatterValue]:
+        """Pre-parsed frontmatter of a skill (no file data is touched)."""
+        return self._index[skill_id][3]
+
+    def view(self, skill_id: str) -> memoryview:
+        """Zero-copy view of a skill's UTF-8 SKILL.md bytes."""
+        offset, length = self._index[skill_id][:2]
+        start = self._data_start + offset
+        return memoryview(self._map)[start:start + length]
+
+    def text(self, skill_id: str) -> str:
+        """Decoded SKILL.md content of a skill."""
+        offset, length = self._index[skill_id][:2]
+        start = self._data_start + offset
+        return self._map[start:start + length].decode('utf-8')
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
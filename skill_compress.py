@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Compressed Content Libraries
+Opens content library files that may be gzip, xz or zstd compressed.
+
+The codec is chosen from the file's magic bytes rather than its name, and
+data is decompressed as it is read, so a compressed library streams into
+the SKILL_ID block parser without being expanded in memory first:
+
+    from skill_compress import open_content_file
+    with open_content_file("all-skills-content.md.zst") as f:
+        for line in f:
+            ...
+
+gzip and xz use the standard library. zstd uses the standard library's
+compression.zstd on Python 3.14+, or the optional `zstandard` package.
+"""
+
+import gzip
+import io
+import lzma
+from pathlib import Path
+from typing import IO, Optional, Union
+
+# Extensions accepted for compressed libraries (content is still sniffed)
+COMPRESSED_SUFFIXES = ('.gz', '.xz', '.zst')
+
+_MAGIC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+
+# Raised by the decompressors for corrupt or truncated input
+DECOMPRESSION_ERRORS = (OSError, EOFError, lzma.LZMAError, ValueError)
+
+
+def detect_codec(path: Union[str, Path]) -> Optional[str]:
+    """'gzip', 'xz' or 'zstd' from the file's magic bytes, or None for plain text."""
+    with open(path, 'rb') as f:
+        head = f.read(6)
+    for magic, codec in _MAGIC:
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def _zstd_reader(raw: IO[bytes]) -> IO[bytes]:
+    try:
+        from compression import zstd
+        return zstd.ZstdFile(raw)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError("zstd-compressed library needs Python 3.14+ or the 'zstandard' package "
+                         "(pip install zstandard)") from None
+    reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+    return io.BufferedReader(reader)
+
+
+def _open_codec(path: Union[str, Path], codec: Optional[str]) -> IO[bytes]:
+    if codec == 'gzip':
+        return gzip.open(path, 'rb')
+    if codec == 'xz':
+        return lzma.open(path, 'rb')
+    if codec == 'zstd':
+        raw = open(path, 'rb')
+        try:
+            return _zstd_reader(raw)
+        except BaseException:
+            raw.close()
+            raise
+    return open(path, 'rb')
+
+
+def open_binary(path: Union[str, Path]) -> IO[bytes]:
+    """Open a content file for reading decompressed bytes."""
+    return _open_codec(path, detect_codec(path))
+
+
+def open_content_file(path: Union[str, Path]) -> IO[str]:
+    """Open a content file as UTF-8 text with universal newlines."""
+    codec = detect_codec(path)
+    if codec is None:
+        return open(path, 'r', encoding='utf-8')
+    return io.TextIOWrapper(_open_codec(path, codec), encoding='utf-8')
+
+
+def read_content_bytes(path: Union[str, Path]) -> bytes:
+    """The whole decompressed file."""
+    with open_binary(path) as f:
+        return f.read()
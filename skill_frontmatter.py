@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Skill Frontmatter Tokenizer
+Single-pass parser for the 'key: value' metadata at the top of skill blocks.
+
+Shared by populate-skills.py (rendering and extract_metadata_from_block),
+the skill registry and the skill bundle. Each line is stripped once and its
+key dispatched through FIELD_TABLE, which says what field it fills and how
+its value is read:
+
+    SCALAR  'name: code-review'
+    LIST    'collaborators: [security, architecture]' or a block list:
+                collaborators:
+                  - security
+                  - architecture
+            (block lists are normalized to the inline form)
+    BLOCK   'collaboration_rules: |' followed by indented or '- ' lines,
+            kept verbatim and joined with newlines
+
+    from skill_frontmatter import tokenize_frontmatter
+    fields, body_start = tokenize_frontmatter(block_text)
+    fields['owner'], block_text[body_start:]
+
+Scanning stops at the first markdown heading; lines that are not
+'key: value' pairs (such as '---' rules) are skipped.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+SCALAR = 0
+LIST = 1
+BLOCK = 2
+
+# key -> (field name, kind); 'agent' is the legacy spelling of 'owner'
+FIELD_TABLE: Dict[str, Tuple[str, int]] = {
+    'name': ('name', SCALAR),
+    'description': ('description', SCALAR),
+    'skill_id': ('skill_id', SCALAR),
+    'owner': ('owner', SCALAR),
+    'agent': ('owner', SCALAR),
+    'collaborators': ('collaborators', LIST),
+    'collaboration_rules': ('collaboration_rules', BLOCK),
+    'project': ('project', SCALAR),
+    'version': ('version', SCALAR),
+    'when_to_use': ('when_to_use', SCALAR),
+    'dependencies': ('dependencies', LIST),
+}
+
+
+def parse_list_value(value: str) -> List[str]:
+    """Parse an inline YAML list such as '[security, architecture]'."""
+    value = value.strip()
+    if value.startswith('[') and value.endswith(']'):
+        value = value[1:-1]
+    items = (item.strip().strip('\'"') for item in value.split(','))
+    return [item for item in items if item]
+
+
+def _finish(fields: Dict[str, str], field: str, kind: int, lines: List[str]) -> None:
+    """Store a multi-line value collected after 'key:'."""
+    if kind != BLOCK and not lines:
+        return
+    if kind == BLOCK:
+        fields[field] = '\n'.join(lines)
+    elif kind == LIST:
+        items = [line.strip()[1:].strip().strip('\'"') for line in lines]
+        fields[field] = f"[{', '.join(item for item in items if item)}]"
+    else:
+        fields[field] = ' '.join(line.strip() for line in lines)
+
+
+def tokenize_frontmatter(text: str,
+                         table: Optional[Dict[str, Tuple[str, int]]] = FIELD_TABLE
+                         ) -> Tuple[Dict[str, str], Optional[int]]:
+    """
+    Parse frontmatter fields from the top of text in one pass.
+
+    Keys missing from `table` are ignored; with table=None every key is
+    read as a SCALAR field of the same name. Values are returned as strings,
+    LIST values in inline '[a, b]' form.
+
+    Returns: (fields, body_start) where body_start is the offset of the
+    first heading line, or None if text has no heading.
+    """
+    fields: Dict[str, str] = {}
+    pending = None  # (field, kind, continuation lines) of a multi-line value
+    pos = 0
+    end = len(text)
+    find = text.find
+
+    while pos <= end:
+        newline = find('\n', pos)
+        if newline == -1:
+            newline = end
+        line = text[pos:newline]
+        stripped = line.strip()
+
+        if pending is not None:
+            if stripped != '---' and (line.startswith(' ') or stripped.startswith('-')):
+                pending[2].append(line)
+                pos = newline + 1
+                continue
+            _finish(fields, *pending)
+            pending = None
+
+        if stripped.startswith('#'):
+            return fields, pos
+
+        colon = stripped.find(':')
+        if colon > 0:
+            key = stripped[:colon].rstrip()
+            entry = table.get(key) if table is not None else (key, SCALAR)
+            if entry is not None:
+                field, kind = entry
+                value = stripped[colon + 1:].strip()
+                if kind == BLOCK:
+                    pending = (field, kind, [] if value in ('|', '') else [value])
+                else:
+                    fields[field] = value
+                    if not value:
+                        pending = (field, kind, [])
+
+        pos = newline + 1
+
+    if pending is not None:
+        _finish(fields, *pending)
+    return fields, None
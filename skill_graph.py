@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Skill Dependency Graph
+Load order and transitive dependencies for skills.
+
+Built at populate time from each skill's `dependencies: [...]` field and
+written next to the skills tree (GRAPH_FILENAME). Every skill gets an ordinal
+equal to its position in topological load order, and its transitive closure
+is stored as a bitset over those ordinals, so resolving everything a skill
+needs is a single lookup:
+
+    from skill_graph import load_graph
+    graph = load_graph("skills/.skill-graph.json")
+    graph.requires("REQ-007")   # ['REQ-001', 'REQ-006', 'REQ-008'], in load order
+
+Cycles and dependencies on unknown skill IDs are detected and reported
+rather than rejected; skills in a cycle are loaded together.
+"""
+
+import json
+from typing import Dict, Iterable, List, Tuple
+
+# Graph artifact written at the root of each populated skills tree
+GRAPH_FILENAME = ".skill-graph.json"
+
+GRAPH_FORMAT = 1
+
+
+def _strongly_connected(nodes: List[str], edges: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Tarjan's algorithm, iterative to cope with very deep dependency chains.
+
+    With edges pointing from a skill to its dependencies, components are
+    returned dependencies-first, i.e. in load order.
+    """
+    index_of: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack = set()
+    stack: List[str] = []
+    components = []
+    counter = 0
+
+    for root in nodes:
+        if root in index_of:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, child = work.pop()
+            if child == 0:
+                index_of[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+
+            targets = edges.get(node, [])
+            for i in range(child, len(targets)):
+                target = targets[i]
+                if target not in index_of:
+                    work.append((node, i + 1))
+                    work.append((target, 0))
+                    break
+                if target in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[target])
+            else:
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+    return components
+
+
+class SkillGraph:
+    """
+    Dependency graph with topological order and precomputed closures.
+
+    order[i] is the skill with ordinal i; closures[skill_id] has bit i set
+    when that skill (transitively) depends on order[i].
+    """
+
+    def __init__(self, order: List[str], dependencies: Dict[str, List[str]],
+                 closures: Dict[str, int], cycles: List[List[str]],
+                 dangling: Dict[str, List[str]]):
+        self.order = order
+        self.ordinal = {skill_id: i for i, skill_id in enumerate(order)}
+        self.dependencies = dependencies
+        self.closures = closures
+        self.cycles = cycles
+        self.dangling = dangling
+
+    def __contains__(self, skill_id: str) -> bool:
+        return skill_id in self.ordinal
+
+    def closure_bits(self, skill_id: str) -> int:
+        """Bitset of every skill skill_id transitively depends on."""
+        return self.closures[skill_id]
+
+    def requires(self, skill_id: str) -> List[str]:
+        """Everything skill_id needs loaded first, in load order."""
+        bits = self.closures[skill_id]
+        required = []
+        while bits:
+            low = bits & -bits
+            required.append(self.order[low.bit_length() - 1])
+            bits ^= low
+        return required
+
+    def load_order(self, skill_ids: Iterable[str]) -> List[str]:
+        """skill_ids plus all their dependencies, in load order."""
+        bits = 0
+        for skill_id in skill_ids:
+            bits |= self.closures[skill_id] | (1 << self.ordinal[skill_id])
+        return [skill_id for i, skill_id in enumerate(self.order) if bits >> i & 1]
+
+    def to_dict(self) -> Dict:
+        return {
+            'format': GRAPH_FORMAT,
+            'order': self.order,
+            'dependencies': self.dependencies,
+            'closures': {skill_id: format(bits, 'x') for skill_id, bits in self.closures.items()},
+            'cycles': self.cycles,
+            'dangling': self.dangling,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SkillGraph':
+        if data.get('format') != GRAPH_FORMAT:
+            raise ValueError(f"unsupported graph format: {data.get('format')!r}")
+        closures = {skill_id: int(bits, 16) for skill_id, bits in data['closures'].items()}
+        return cls(data['order'], data['dependencies'], closures, data['cycles'], data['dangling'])
+
+
+def build_graph(dependencies: Iterable[Tuple[str, Iterable[str]]]) -> SkillGraph:
+    """
+    Build the dependency graph from (skill_id, dependency IDs) pairs.
+
+    Dependencies on IDs that are not themselves skills are recorded in
+    `dangling` and left out of the graph. Skills in a cycle share one
+    closure (which excludes the skill itself).
+    """
+    declared = {skill_id: list(deps) for skill_id, deps in dependencies}
+    nodes = list(declared)
+
+    edges: Dict[str, List[str]] = {}
+    dangling: Dict[str, List[str]] = {}
+    for skill_id, deps in declared.items():
+        edges[skill_id] = [dep for dep in deps if dep in declared]
+        missing = [dep for dep in deps if dep not in declared]
+        if missing:
+            dangling[skill_id] = missing
+
+    components = _strongly_connected(nodes, edges)
+
+    position = {skill_id: i for i, skill_id in enumerate(nodes)}
+    order: List[str] = []
+    cycles: List[List[str]] = []
+    for component in components:
+        component.sort(key=position.__getitem__)
+        if len(component) > 1 or component[0] in edges[component[0]]:
+            cycles.append(component)
+        order.extend(component)
+    ordinal = {skill_id: i for i, skill_id in enumerate(order)}
+
+    # Components arrive dependencies-first, so every dependency outside the
+    # current component already has its closure.
+    closures: Dict[str, int] = {}
+    for component in components:
+        members = set(component)
+        bits = 0
+        for skill_id in component:
+            for dep in edges[skill_id]:
+                bits |= 1 << ordinal[dep]
+                if dep not in members:
+                    bits |= closures[dep]
+        for skill_id in component:
+            closures[skill_id] = bits & ~(1 << ordinal[skill_id])
+
+    return SkillGraph(order, edges, closures, cycles, dangling)
+
+
+def graph_to_json(graph: SkillGraph) -> str:
+    """Serialize a graph to its artifact format."""
+    return json.dumps(graph.to_dict(), separators=(',', ':')) + '\n'
+
+
+def load_graph(graph_path: str) -> SkillGraph:
+    """Load a graph artifact written by populate-skills.py."""
+    with open(graph_path, 'r', encoding='utf-8') as f:
+        return SkillGraph.from_dict(json.load(f))
+
+
+def describe_problems(graph: SkillGraph) -> List[str]:
+    """Human-readable warnings for cycles and dangling dependencies."""
+    problems = [f"Dependency cycle: {' → '.join(cycle + cycle[:1])}" for cycle in graph.cycles]
+    problems += [f"{skill_id} depends on unknown skill(s): {', '.join(missing)}"
+                 for skill_id, missing in graph.dangling.items()]
+    return problems
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Agent Context Packs
+Prebuilt per-agent context: the agent definition plus every skill the agent
+owns or collaborates on, in one file.
+
+populate-skills.py --context-packs writes one pack per agent under
+PACKS_DIRNAME in the skills tree. Each SKILL.md is split into sections (its
+frontmatter and introduction, then one section per '##' heading), and every
+section carries a token estimate and a priority:
+
+    0  agent definition (agents/<agent>/agent.yaml)
+    1  summaries (frontmatter and introduction) of owned skills
+    2  summaries of skills the agent collaborates on
+    3  remaining sections of owned skills
+    4  remaining sections of collaborating skills
+
+A budgeted variant keeps the highest-priority sections that fit in N
+tokens, so a tight budget still covers every skill at summary level.
+Variants for DEFAULT_PACK_BUDGETS are precomputed; other budgets are
+fitted on load:
+
+    from skill_packs import load_pack
+    pack = load_pack("skills/.context-packs/developer.json")
+    pack.tokens            # estimate for the whole pack
+    pack.text(8000)        # highest-priority sections within ~8000 tokens
+
+Pack layout (JSON):
+
+    {"format": 1, "agent": name, "tokens": n,
+     "sections": [[priority, skill_id, title, tokens, text], ...],
+     "budgets": {"8000": [section index, ...]}}
+
+Token counts are estimates (about four characters per token), good enough
+for budgeting without a tokenizer.
+"""
+
+import json
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Directory of per-agent packs at the root of a skills tree
+PACKS_DIRNAME = ".context-packs"
+
+# Pack cache keys, kept next to the packs
+PACK_INDEX_FILENAME = "index.json"
+
+PACK_FORMAT = 1
+
+DEFAULT_PACK_BUDGETS = (4000, 8000, 16000, 32000)
+
+PRIORITY_DEFINITION = 0
+PRIORITY_OWNED_SUMMARY = 1
+PRIORITY_SHARED_SUMMARY = 2
+PRIORITY_OWNED_SECTION = 3
+PRIORITY_SHARED_SECTION = 4
+
+# Section: [priority, skill_id ('' for the agent definition), title, tokens, text]
+Section = list
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: about four characters per token."""
+    return (len(text) + 3) // 4
+
+
+def split_skill(text: str) -> List[Tuple[str, str]]:
+    """
+    Split a SKILL.md into (title, text) sections that concatenate back to it.
+
+    The first section holds the frontmatter and everything before the first
+    '##' heading; each later one runs from a '##' heading to the next.
+    Headings inside fenced code blocks are ignored.
+    """
+    sections = []
+    title = 'summary'
+    start = 0
+    offset = 0
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        if line.startswith('```'):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith('## ') and offset > 0:
+            sections.append((title, text[start:offset]))
+            title, start = line[3:].strip(), offset
+        offset += len(line)
+    sections.append((title, text[start:]))
+    return sections
+
+
+def fit_sections(sections: List[Section], budget: int) -> List[int]:
+    """
+    Indexes (in pack order) of the sections kept within `budget` tokens.
+
+    Sections are taken by priority, then pack order; one that does not fit
+    is skipped so that smaller sections after it can still be included.
+    """
+    kept = []
+    remaining = budget
+    for index in sorted(range(len(sections)), key=lambda i: (sections[i][0], i)):
+        tokens = sections[index][3]
+        if tokens <= remaining:
+            kept.append(index)
+            remaining -= tokens
+    return sorted(kept)
+
+
+def build_pack(agent: str, definition: Optional[str],
+               owned: Iterable[Tuple[str, str]], shared: Iterable[Tuple[str, str]],
+               budgets: Iterable[int] = DEFAULT_PACK_BUDGETS) -> Dict:
+    """
+    Build an agent's pack from its definition text and (skill_id, SKILL.md
+    text) pairs for owned and collaborating skills.
+    """
+    sections: List[Section] = []
+    if definition:
+        text = f"# Agent definition: {agent}\n\n```yaml\n{definition.rstrip()}\n```\n\n"
+        sections.append([PRIORITY_DEFINITION, '', 'agent definition', estimate_tokens(text), text])
+    for skills, summary, rest in ((owned, PRIORITY_OWNED_SUMMARY, PRIORITY_OWNED_SECTION),
+                                  (shared, PRIORITY_SHARED_SUMMARY, PRIORITY_SHARED_SECTION)):
+        for skill_id, text in skills:
+            if not text.endswith('\n'):
+                text += '\n'
+            for n, (title, chunk) in enumerate(split_skill(text)):
+                sections.append([summary if n == 0 else rest, skill_id, title, estimate_tokens(chunk), chunk])
+
+    return {
+        'format': PACK_FORMAT,
+        'agent': agent,
+        'tokens': sum(section[3] for section in sections),
+        'sections': sections,
+        'budgets': {str(budget): fit_sections(sections, budget) for budget in budgets},
+    }
+
+
+def pack_to_json(pack: Dict) -> str:
+    return json.dumps(pack, separators=(',', ':')) + '\n'
+
+
+class ContextPack:
+    """A loaded agent context pack."""
+
+    def __init__(self, data: Dict):
+        if data.get('format') != PACK_FORMAT:
+            raise ValueError(f"unsupported context pack format: {data.get('format')!r}")
+        self.agent: str = data['agent']
+        self.tokens: int = data['tokens']
+        self.sections: List[Section] = data['sections']
+        self.budgets: Dict[int, List[int]] = {int(budget): kept for budget, kept in data['budgets'].items()}
+
+    def skills(self) -> List[str]:
+        """Skill IDs in the pack, in pack order."""
+        seen = {}
+        for section in self.sections:
+            if section[1]:
+                seen.setdefault(section[1], None)
+        return list(seen)
+
+    def select(self, budget: Optional[int] = None) -> List[int]:
+        """Indexes of the sections within `budget` tokens (all sections for None)."""
+        if budget is None or budget >= self.tokens:
+            return list(range(len(self.sections)))
+        if budget in self.budgets:
+            return self.budgets[budget]
+        return fit_sections(self.sections, budget)
+
+    def text(self, budget: Optional[int] = None) -> str:
+        """The pack as one markdown document, optionally fitted to a token budget."""
+        return ''.join(self.sections[index][4] for index in self.select(budget))
+
+
+def load_pack(path: str) -> ContextPack:
+    """Load a pack written by populate-skills.py --context-packs."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return ContextPack(json.load(f))
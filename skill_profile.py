@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Skill Populate Profiler
+Per-stage and per-skill timing for populate-skills.py runs.
+
+Enable with `populate-skills.py --profile [TRACE]` or by setting
+POPULATE_SKILLS_PROFILE (to a trace path, or to 1 for the default path).
+Each stage (parse, render, commit, ...) and each rendered skill is recorded
+with its wall and CPU time plus the bytes and files it read and wrote. The
+run ends with a summary table, and a Chrome trace-event file that can be
+opened in chrome://tracing or https://ui.perfetto.dev.
+
+Instrumented code asks for the active profiler and wraps work in spans:
+
+    profiler = active_profiler()
+    with profiler.stage('render', project=project):
+        ...
+        profiler.count('bytes_written', len(data))
+
+When profiling is off, active_profiler() returns NULL_PROFILER, whose
+spans and counters do nothing.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Environment variable that turns profiling on without the CLI flag
+PROFILE_ENV = "POPULATE_SKILLS_PROFILE"
+
+DEFAULT_TRACE_FILENAME = "populate-skills-trace.json"
+
+# Counters shown in the summary table, in column order
+COUNTERS = ('bytes_read', 'bytes_written', 'files_read', 'files_written')
+
+
+class _Span:
+    """A timed region; counters roll up into the enclosing span on exit."""
+
+    __slots__ = ('profiler', 'name', 'cat', 'args', 'counters', 'parent',
+                 'start', 'cpu_start', 'thread_cpu')
+
+    def __init__(self, profiler: 'Profiler', name: str, cat: str, args: Dict):
+        self.profiler = profiler
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.counters: Dict[str, int] = {}
+        self.parent = None
+        # Stages may fan out to worker threads, so they are charged process
+        # CPU time; per-skill spans run on one thread and use thread time.
+        self.thread_cpu = cat != 'stage'
+
+    def __enter__(self) -> '_Span':
+        self.parent = self.profiler._enter(self)
+        self.cpu_start = time.thread_time() if self.thread_cpu else time.process_time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        end = time.perf_counter()
+        cpu = (time.thread_time() if self.thread_cpu else time.process_time()) - self.cpu_start
+        self.profiler._exit(self, end - self.start, cpu)
+
+    def add(self, counter: str, value: int = 1) -> None:
+        # Stage spans are shared with worker threads: callers hold profiler._lock
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def add(self, counter: str, value: int = 1) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullProfiler:
+    """Profiler stand-in used when profiling is off."""
+
+    enabled = False
+
+    def stage(self, name: str, **args) -> _NullSpan:
+        return _NULL_SPAN
+
+    def span(self, name: str, cat: str = 'skill', **args) -> _NullSpan:
+        return _NULL_SPAN
+
+    def count(self, counter: str, value: int = 1) -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class Profiler:
+    """
+    Records spans as Chrome trace 'complete' events and aggregates them.
+
+    stage() spans are run-level phases; span() marks finer work such as one
+    skill, possibly on a worker thread. count() adds to the innermost span
+    of the calling thread, or to the innermost open stage when the thread
+    has none.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._open_stages: List[_Span] = []
+        self._thread_ids: Dict[int, int] = {}
+        self.events: List[Dict] = []
+        # name -> [calls, wall seconds, cpu seconds, counters] per category
+        self.stages: Dict[str, list] = {}
+        self.skills: Dict[str, list] = {}
+
+    def stage(self, name: str, **args) -> _Span:
+        return _Span(self, name, 'stage', args)
+
+    def span(self, name: str, cat: str = 'skill', **args) -> _Span:
+        return _Span(self, name, cat, args)
+
+    def count(self, counter: str, value: int = 1) -> None:
+        stack = getattr(self._local, 'stack', None)
+        with self._lock:
+            if stack:
+                stack[-1].add(counter, value)
+            elif self._open_stages:
+                self._open_stages[-1].add(counter, value)
+
+    def _enter(self, span: _Span) -> Optional[_Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        parent = stack[-1] if stack else None
+        stack.append(span)
+        if span.cat == 'stage':
+            with self._lock:
+                self._open_stages.append(span)
+        elif parent is None:
+            with self._lock:
+                parent = self._open_stages[-1] if self._open_stages else None
+        return parent
+
+    def _exit(self, span: _Span, wall: float, cpu: float) -> None:
+        self._local.stack.pop()
+        thread = threading.get_ident()
+        with self._lock:
+            if span.cat == 'stage':
+                self._open_stages.remove(span)
+            if span.parent is not None:
+                for counter, value in span.counters.items():
+                    span.parent.add(counter, value)
+
+            tid = self._thread_ids.setdefault(thread, len(self._thread_ids))
+            self.events.append({
+                'name': span.name,
+                'cat': span.cat,
+                'ph': 'X',
+                'ts': round((span.start - self._origin) * 1e6, 3),
+                'dur': round(wall * 1e6, 3),
+                'pid': os.getpid(),
+                'tid': tid,
+                'args': dict(span.args, cpu_ms=round(cpu * 1e3, 3), **span.counters),
+            })
+
+            totals = self.stages if span.cat == 'stage' else self.skills
+            entry = totals.setdefault(span.name, [0, 0.0, 0.0, {}])
+            entry[0] += 1
+            entry[1] += wall
+            entry[2] += cpu
+            for counter, value in span.counters.items():
+                entry[3][counter] = entry[3].get(counter, 0) + value
+
+    def trace(self) -> Dict:
+        """The recorded run in Chrome trace-event format."""
+        pid = os.getpid()
+        names = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                  'args': {'name': 'main' if tid == 0 else f'worker-{tid}'}}
+                 for tid in self._thread_ids.values()]
+        return {'traceEvents': names + self.events, 'displayTimeUnit': 'ms'}
+
+    def write_trace(self, trace_path: str) -> None:
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            json.dump(self.trace(), f, separators=(',', ':'))
+            f.write('\n')
+
+    def summary(self, slowest: int = 5) -> str:
+        """Per-stage table plus per-skill totals and the slowest skills."""
+        header = f"{'stage':<16} {'calls':>5} {'wall (ms)':>10} {'cpu (ms)':>10}"
+        header += ''.join(f" {counter:>13}" for counter in COUNTERS)
+        lines = [header, '-' * len(header)]
+        for name, (calls, wall, cpu, counters) in self.stages.items():
+            row = f"{name:<16} {calls:>5} {wall * 1e3:>10.1f} {cpu * 1e3:>10.1f}"
+            row += ''.join(f" {counters.get(counter, 0):>13,}" for counter in COUNTERS)
+            lines.append(row)
+
+        if self.skills:
+            walls = sorted(((entry[1], name) for name, entry in self.skills.items()), reverse=True)
+            total_wall = sum(wall for wall, _ in walls)
+            total_cpu = sum(entry[2] for entry in self.skills.values())
+            lines.append('')
+            lines.append(f"Skills: {len(walls)} rendered, {total_wall * 1e3:.1f} ms wall "
+                         f"({total_wall / len(walls) * 1e6:.0f} µs avg), {total_cpu * 1e3:.1f} ms cpu")
+            lines.append("Slowest: " + ', '.join(f"{name} {wall * 1e3:.2f} ms"
+                                                 for wall, name in walls[:slowest]))
+        return '\n'.join(lines)
+
+
+_active = NULL_PROFILER
+
+
+def active_profiler():
+    """The profiler instrumented code should report to."""
+    return _active
+
+
+def start_profiling() -> Profiler:
+    """Install a fresh Profiler as the active profiler."""
+    global _active
+    _active = Profiler()
+    return _active
+
+
+def stop_profiling() -> None:
+    global _active
+    _active = NULL_PROFILER
+
+
+def trace_path_from_env() -> Optional[str]:
+    """Trace path requested through PROFILE_ENV, if any."""
+    value = os.environ.get(PROFILE_ENV, '').strip()
+    if not value or value.lower() in ('0', 'false', 'no', 'off'):
+        return None
+    if value.lower() in ('1', 'true', 'yes', 'on'):
+        return DEFAULT_TRACE_FILENAME
+    return value
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Skill Registry
+Indexed lookup of skill IDs, paths, owners and collaborators.
+
+The registry is built from the content library's own SKILL_ID / SKILL_PATH
+headers and owner / collaborators / collaboration_rules / dependencies fields,
+falling back to the built-in configuration in populate-skills.py for any
+field a block does not declare.
+
+populate-skills.py writes the registry next to the skills tree as a compact
+JSON cache (REGISTRY_FILENAME) with every index precomputed, so other tools
+can load it with a single json.load and answer lookups by owner, collaborator,
+ID prefix or path without importing the populate script or re-parsing the
+content library:
+
+    from skill_registry import load_registry
+    registry = load_registry("skills/.skill-registry.json")
+    registry.owned_by("security")        # ['SEC-001', ...]
+    registry.collaborating("developer")  # ['REQ-007', 'ARCH-010', ...]
+"""
+
+import json
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from skill_frontmatter import FIELD_TABLE, parse_list_value, tokenize_frontmatter
+
+# Cache file written at the root of each populated skills tree
+REGISTRY_FILENAME = ".skill-registry.json"
+
+# Bump when the cache layout changes; older caches are rejected on load
+REGISTRY_FORMAT = 2
+
+
+class SkillRecord(NamedTuple):
+    """Registry entry for a single skill."""
+    skill_id: str
+    path: str
+    owner: str
+    collaborators: Tuple[str, ...]
+    collaboration_rules: str
+    dependencies: Tuple[str, ...] = ()
+
+
+def skill_prefix(skill_id: str) -> str:
+    """ID prefix used for owner mapping, e.g. 'DEV' for 'DEV-011'."""
+    return skill_id.split('-')[0]
+
+
+_REGISTRY_FIELDS = {key: entry for key, entry in FIELD_TABLE.items()
+                    if entry[0] in ('owner', 'collaborators', 'collaboration_rules', 'dependencies')}
+
+
+def _frontmatter_fields(frontmatter: str) -> Dict[str, str]:
+    """Extract owner, collaborators, collaboration_rules and dependencies from block frontmatter."""
+    fields, _ = tokenize_frontmatter(frontmatter, _REGISTRY_FIELDS)
+    return fields
+
+
+class SkillRegistry:
+    """
+    Skill records plus precomputed indexes.
+
+    Indexes map owner, collaborator and ID prefix to lists of skill IDs (in
+    registry order) and path to skill ID. Pass `indexes` to reuse indexes
+    loaded from a cache instead of rebuilding them.
+    """
+
+    def __init__(self, records: Iterable[SkillRecord], owners: Dict[str, str],
+                 indexes: Optional[Dict[str, Dict]] = None):
+        self.skills: Dict[str, SkillRecord] = {record.skill_id: record for record in records}
+        self.owners = dict(owners)
+        if indexes is None:
+            indexes = self._build_indexes()
+        self.by_owner: Dict[str, List[str]] = indexes['owner']
+        self.by_collaborator: Dict[str, List[str]] = indexes['collaborator']
+        self.by_prefix: Dict[str, List[str]] = indexes['prefix']
+        self.by_path: Dict[str, str] = indexes['path']
+
+    def _build_indexes(self) -> Dict[str, Dict]:
+        by_owner, by_collaborator, by_prefix, by_path = {}, {}, {}, {}
+        for skill_id, record in self.skills.items():
+            by_owner.setdefault(record.owner, []).append(skill_id)
+            for collaborator in record.collaborators:
+                by_collaborator.setdefault(collaborator, []).append(skill_id)
+            by_prefix.setdefault(skill_prefix(skill_id), []).append(skill_id)
+            by_path[record.path] = skill_id
+        return {
+            'owner': by_owner,
+            'collaborator': by_collaborator,
+            'prefix': by_prefix,
+            'path': by_path,
+        }
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def __contains__(self, skill_id: str) -> bool:
+        return skill_id in self.skills
+
+    def __iter__(self) -> Iterator[SkillRecord]:
+        return iter(self.skills.values())
+
+    def get(self, skill_id: str) -> Optional[SkillRecord]:
+        return self.skills.get(skill_id)
+
+    def owner_of(self, skill_id: str) -> str:
+        """Owner agent for a skill, falling back to its ID prefix mapping."""
+        record = self.skills.get(skill_id)
+        if record is not None:
+            return record.owner
+        return self.owners.get(skill_prefix(skill_id), "unknown")
+
+    def owned_by(self, owner: str) -> List[str]:
+        return self.by_owner.get(owner, [])
+
+    def collaborating(self, agent: str) -> List[str]:
+        return self.by_collaborator.get(agent, [])
+
+    def with_prefix(self, prefix: str) -> List[str]:
+        return self.by_prefix.get(prefix, [])
+
+    def for_path(self, path: str) -> Optional[str]:
+        return self.by_path.get(path)
+
+    def cross_cutting(self) -> List[SkillRecord]:
+        """Skills that list at least one collaborator."""
+        return [record for record in self.skills.values() if record.collaborators]
+
+    def to_dict(self) -> Dict:
+        return {
+            'format': REGISTRY_FORMAT,
+            'owners': self.owners,
+            'skills': [list(record[:3]) + [list(record.collaborators), record.collaboration_rules,
+                                           list(record.dependencies)]
+                       for record in self.skills.values()],
+            'index': {
+                'owner': self.by_owner,
+                'collaborator': self.by_collaborator,
+                'prefix': self.by_prefix,
+                'path': self.by_path,
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SkillRegistry':
+        if data.get('format') != REGISTRY_FORMAT:
+            raise ValueError(f"unsupported registry format: {data.get('format')!r}")
+        records = (SkillRecord(skill_id, path, owner, tuple(collaborators), rules, tuple(dependencies))
+                   for skill_id, path, owner, collaborators, rules, dependencies in data['skills'])
+        return cls(records, data['owners'], indexes=data['index'])
+
+
+def build_registry(blocks: Iterable, default_paths: Dict[str, str],
+                   default_owners: Dict[str, str],
+                   default_cross_cutting: Dict[str, Dict]) -> SkillRegistry:
+    """
+    Build a registry from content library blocks plus built-in defaults.
+
+    `blocks` yields objects with skill_id, path and frontmatter attributes
+    (populate-skills.py SkillBlock records). Fields a block declares win over
+    the defaults; skills that only exist in default_paths are kept so that
+    placeholders can still be created for them. Registry order is the
+    default order followed by any skills only the library knows about.
+    """
+    declared = {}
+    owners = dict(default_owners)
+    for block in blocks:
+        fields = _frontmatter_fields(block.frontmatter)
+        declared[block.skill_id] = (block.path, fields)
+        if fields.get('owner'):
+            owners.setdefault(skill_prefix(block.skill_id), fields['owner'])
+
+    records = []
+    skill_ids = list(default_paths) + [skill_id for skill_id in declared if skill_id not in default_paths]
+    for skill_id in skill_ids:
+        path, fields = declared.get(skill_id, ('', {}))
+        defaults = default_cross_cutting.get(skill_id, {})
+
+        collaborators = parse_list_value(fields.get('collaborators', ''))
+        if not collaborators:
+            collaborators = list(defaults.get('collaborators', []))
+
+        records.append(SkillRecord(
+            skill_id=skill_id,
+            path=path or default_paths.get(skill_id, ''),
+            owner=fields.get('owner') or owners.get(skill_prefix(skill_id), "unknown"),
+            collaborators=tuple(collaborators),
+            collaboration_rules=fields.get('collaboration_rules') or defaults.get('collaboration_rules', ''),
+            dependencies=tuple(parse_list_value(fields.get('dependencies', ''))),
+        ))
+
+    return SkillRegistry(records, owners)
+
+
+def registry_to_json(registry: SkillRegistry) -> str:
+    """Serialize a registry to the compact cache format."""
+    return json.dumps(registry.to_dict(), separators=(',', ':')) + '\n'
+
+
+def load_registry(cache_path: str) -> SkillRegistry:
+    """Load a registry cache written by populate-skills.py."""
+    with open(cache_path, 'r', encoding='utf-8') as f:
+        return SkillRegistry.from_dict(json.load(f))
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Skill Search Index
+Inverted full-text index over SKILL.md files with BM25 ranking.
+
+populate-skills.py --search-index builds the index alongside the skills tree
+(SEARCH_INDEX_FILENAME). Each posting carries a precomputed BM25 weight and
+the sections (headings) the term occurs in, so routing a request to a skill
+is a handful of dictionary lookups instead of a grep over the tree:
+
+    python3 skill_search.py skills/.skill-search.json rollback migration
+
+    from skill_search import load_index
+    index = load_index("skills/.skill-search.json")
+    for hit in index.search("OWASP input validation", limit=5):
+        print(hit.skill_id, hit.score, hit.sections)
+
+Updates are incremental: only skills whose text changed are re-tokenized;
+BM25 weights are then recomputed from the stored term statistics.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+# Index file written at the root of a skills tree by populate-skills.py
+SEARCH_INDEX_FILENAME = ".skill-search.json"
+
+INDEX_FORMAT = 2
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Name of the pseudo-section holding text before the first heading
+PREAMBLE_SECTION = "(frontmatter)"
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-_][a-z0-9]+)*")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have if in into is it its of on or
+that the this to was were will with when which who use used using
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case word tokens; hyphenated IDs such as 'dev-011' stay whole."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def _analyze(text: str) -> Tuple[List[str], Dict[str, list], int]:
+    """
+    Split a SKILL.md into sections and collect term statistics.
+
+    Headings inside fenced code blocks are ignored, as in
+    skill_sections.compute_toc(), so shell comments are not sections:
+
+    >>> sections, terms, _ = _analyze("# Deploy\\n```bash\\n# roll back\\n```\\n## Verify\\n")
+    >>> sections
+    ['(frontmatter)', 'Deploy', 'Verify']
+    >>> terms['roll']
+    [1, [1]]
+
+    Returns: (section names, {term: [term frequency, [section ids]]}, length)
+    """
+    sections = [PREAMBLE_SECTION]
+    terms: Dict[str, list] = {}
+    length = 0
+    in_fence = False
+    for line in text.split('\n'):
+        if line.startswith('```'):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith('#'):
+            sections.append(line.lstrip('#').strip())
+        section = len(sections) - 1
+        for token in tokenize(line):
+            length += 1
+            stats = terms.get(token)
+            if stats is None:
+                terms[token] = [1, [section]]
+            else:
+                stats[0] += 1
+                if stats[1][-1] != section:
+                    stats[1].append(section)
+    return sections, terms, length
+
+
+class SearchHit(NamedTuple):
+    """A ranked search result."""
+    skill_id: str
+    score: float
+    sections: List[str]
+
+
+class SearchIndex:
+    """
+    Per-skill term statistics plus BM25-weighted postings.
+
+    docs:     skill_id -> {'hash', 'length', 'sections', 'terms'}
+    postings: term -> [[skill_id, weight], ...] sorted by weight, descending
+    """
+
+    def __init__(self, docs: Dict[str, Dict] = None, postings: Dict[str, list] = None):
+        self.docs: Dict[str, Dict] = docs or {}
+        self.postings: Dict[str, list] = postings if postings is not None else {}
+        if postings is None and self.docs:
+            self._rebuild_postings()
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def update(self, documents: Iterable[Tuple[str, str]]) -> Tuple[int, int, int]:
+        """
+        Bring the index in line with (skill_id, text) documents.
+
+        Skills whose text hash is unchanged keep their term statistics;
+        skills missing from `documents` are dropped.
+
+        Returns: (changed, unchanged, removed) counts
+        """
+        changed = unchanged = 0
+        seen = set()
+        for skill_id, text in documents:
+            seen.add(skill_id)
+            digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            doc = self.docs.get(skill_id)
+            if doc is not None and doc['hash'] == digest:
+                unchanged += 1
+                continue
+            sections, terms, length = _analyze(text)
+            self.docs[skill_id] = {
+                'hash': digest,
+                'length': length,
+                'sections': sections,
+                'terms': terms,
+            }
+            changed += 1
+
+        removed = [skill_id for skill_id in self.docs if skill_id not in seen]
+        for skill_id in removed:
+            del self.docs[skill_id]
+
+        if changed or removed:
+            self._rebuild_postings()
+        return changed, unchanged, len(removed)
+
+    def _rebuild_postings(self) -> None:
+        """Recompute BM25 weights from the stored term statistics."""
+        total = len(self.docs)
+        avg_length = sum(doc['length'] for doc in self.docs.values()) / total if total else 0.0
+
+        postings: Dict[str, list] = {}
+        for skill_id, doc in self.docs.items():
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc['length'] / avg_length) if avg_length else BM25_K1
+            for term, (tf, _) in doc['terms'].items():
+                postings.setdefault(term, []).append([skill_id, tf * (BM25_K1 + 1) / (tf + norm)])
+
+        for term, entries in postings.items():
+            df = len(entries)
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for entry in entries:
+                entry[1] = round(entry[1] * idf, 6)
+            entries.sort(key=lambda entry: -entry[1])
+        self.postings = postings
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """Rank skills for a free-text query."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        scores: Dict[str, float] = {}
+        for term in terms:
+            for skill_id, weight in self.postings.get(term, ()):
+                scores[skill_id] = scores.get(skill_id, 0.0) + weight
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        hits = []
+        for skill_id, score in ranked:
+            doc = self.docs[skill_id]
+            section_ids = sorted({section for term in terms if term in doc['terms']
+                                  for section in doc['terms'][term][1]})
+            hits.append(SearchHit(skill_id, round(score, 4),
+                                  [doc['sections'][i] for i in section_ids]))
+        return hits
+
+    def to_dict(self) -> Dict:
+        return {'format': INDEX_FORMAT, 'docs': self.docs, 'postings': self.postings}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SearchIndex':
+        if data.get('format') != INDEX_FORMAT:
+            raise ValueError(f"unsupported search index format: {data.get('format')!r}")
+        return cls(data['docs'], data['postings'])
+
+
+def index_to_json(index: SearchIndex) -> str:
+    """Serialize an index to its on-disk format."""
+    return json.dumps(index.to_dict(), separators=(',', ':')) + '\n'
+
+
+def load_index(index_path: str) -> SearchIndex:
+    """Load an index written by populate-skills.py."""
+    with open(index_path, 'r', encoding='utf-8') as f:
+        return SearchIndex.from_dict(json.load(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search skills by keyword')
+    parser.add_argument('index', help=f'Path to {SEARCH_INDEX_FILENAME}')
+    parser.add_argument('query', nargs='+', help='Search terms')
+    parser.add_argument('-n', '--limit', type=int, default=10, help='Maximum results (default: 10)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    try:
+        index = load_index(args.index)
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot load search index {args.index}: {e}")
+        return 1
+
+    hits = index.search(' '.join(args.query), limit=args.limit)
+    if args.json:
+        print(json.dumps([hit._asdict() for hit in hits], indent=2))
+    else:
+        for hit in hits:
+            print(f"{hit.score:8.3f}  {hit.skill_id:<10} {', '.join(hit.sections)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
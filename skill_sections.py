@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Skill Section Index
+Byte-range table of contents for SKILL.md files, for section-level loading.
+
+populate-skills.py --section-toc writes SECTIONS_FILENAME next to the skills
+tree: for every skill, the byte range of its frontmatter and of each heading
+(a section runs until the next heading of the same or a higher level, so
+"Process" includes its "Step N" subsections). Agents that only need a
+skill's frontmatter plus one or two sections read just those bytes:
+
+    from skill_sections import SectionReader
+    reader = SectionReader("skills")
+    reader.read("DEV-011", ["Process", "## Validation"])
+
+Each table records the file's size and mtime when it was indexed. If a
+SKILL.md has changed either since the table was written, the reader falls
+back to reading and indexing the whole file.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+# Table of contents written at the root of a skills tree by populate-skills.py
+SECTIONS_FILENAME = ".skill-sections.json"
+
+TOC_FORMAT = 2
+
+
+def compute_toc(data: bytes) -> Dict:
+    """
+    Compute the section table of a SKILL.md.
+
+    Returns: {'size': n, 'frontmatter': [start, end],
+              'sections': [[title, level, start, end], ...]}
+    Headings inside fenced code blocks are ignored.
+    """
+    frontmatter = [0, 0]
+    sections: List[list] = []
+    open_sections: List[list] = []
+    in_fence = False
+    offset = 0
+
+    lines = data.split(b'\n')
+    if lines and lines[0] == b'---':
+        end = 4
+        for line in lines[1:]:
+            end += len(line) + 1
+            if line == b'---':
+                frontmatter = [0, min(end, len(data))]
+                break
+
+    for line in lines:
+        start = offset
+        offset += len(line) + 1
+        if start < frontmatter[1]:
+            continue
+        if line.startswith(b'```'):
+            in_fence = not in_fence
+            continue
+        if in_fence or not line.startswith(b'#'):
+            continue
+
+        level = len(line) - len(line.lstrip(b'#'))
+        while open_sections and open_sections[-1][1] >= level:
+            open_sections.pop()[3] = start
+        section = [line[level:].strip().decode('utf-8', 'replace'), level, start, None]
+        sections.append(section)
+        open_sections.append(section)
+
+    for section in open_sections:
+        section[3] = len(data)
+    return {'size': len(data), 'frontmatter': frontmatter, 'sections': sections}
+
+
+def _normalize(name: str) -> str:
+    """'## Process' and 'process' name the same section."""
+    return name.lstrip('#').strip().lower()
+
+
+def toc_to_json(tocs: Dict[str, Dict]) -> str:
+    """Serialize per-skill tables ({skill_id: {'path', 'size', 'mtime_ns', ...}})."""
+    return json.dumps({'format': TOC_FORMAT, 'skills': tocs}, separators=(',', ':')) + '\n'
+
+
+class SectionReader:
+    """Reads selected sections of SKILL.md files using the section table."""
+
+    def __init__(self, skills_dir: str, toc_path: Optional[str] = None):
+        self.skills_dir = skills_dir
+        with open(toc_path or os.path.join(skills_dir, SECTIONS_FILENAME), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format') != TOC_FORMAT:
+            raise ValueError(f"unsupported section table format: {data.get('format')!r}")
+        self.tocs: Dict[str, Dict] = data['skills']
+
+    def sections(self, skill_id: str) -> List[str]:
+        """Headings of a skill, in document order."""
+        return [section[0] for section in self.tocs[skill_id]['sections']]
+
+    def read(self, skill_id: str, names: Optional[Iterable[str]] = None,
+             include_frontmatter: bool = True) -> str:
+        """
+        Read the frontmatter and the named sections of a skill.
+
+        With names=None only the frontmatter is returned. Unknown section
+        names are ignored; nested or repeated sections are read once.
+        """
+        entry = self.tocs[skill_id]
+        path = os.path.join(self.skills_dir, entry['path'])
+        with open(path, 'rb') as f:
+            toc = entry
+            stat = os.fstat(f.fileno())
+            if stat.st_size != entry['size'] or stat.st_mtime_ns != entry.get('mtime_ns'):
+                # Stale table: index the current file instead
+                whole = f.read()
+                toc = compute_toc(whole)
+
+            wanted = {_normalize(name) for name in names or ()}
+            ranges = [tuple(toc['frontmatter'])] if include_frontmatter and toc['frontmatter'][1] else []
+            ranges += [(section[2], section[3]) for section in toc['sections']
+                       if _normalize(section[0]) in wanted]
+
+            chunks = []
+            covered_to = -1
+            for start, end in sorted(ranges):
+                if end <= covered_to:
+                    continue
+                start = max(start, covered_to)
+                if toc is entry:
+                    f.seek(start)
+                    chunks.append(f.read(end - start))
+                else:
+                    chunks.append(whole[start:end])
+                covered_to = end
+        return b''.join(chunks).decode('utf-8')
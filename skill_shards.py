@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Sharded Content Libraries
+Keeps a byte-range index of a content library so that a run which only
+needs a few skills reads just their blocks.
+
+populate-skills.py --write-shards splits a library into one file per skill
+ID prefix, next to an index of where every block sits:
+
+    skills-content-sec.md       SEC-* blocks
+    skills-content-dev.md       DEV-* blocks
+    ...
+    skills-content-index.json   shard index
+
+Shards are ordinary content files (they match skills-content-*.md), so a
+full run reads them like any other library. --only / --owner runs look the
+requested skills up in the index and seek straight to their blocks:
+
+    from skill_shards import load_shard_index, read_ranges
+    files = load_shard_index("content/")
+    offset, length, path, frontmatter = files["skills-content-sec.md"]["skills"]["SEC-001"]
+
+Index layout:
+
+    {"format": 1,
+     "files": {name: {"size": bytes, "mtime_ns": int,
+                      "skills": {skill_id: [offset, length, path, frontmatter]}}}}
+
+Offsets are byte offsets of a block's 'SKILL_ID:' line in the file. The
+block headers are kept in the index so the skill registry can be built
+without reading any block bodies. A file's entries are only trusted while
+its size and mtime match; populate-skills.py re-indexes files that changed.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+# Shard index, written next to the content files
+SHARD_INDEX_FILENAME = "skills-content-index.json"
+
+SHARD_INDEX_FORMAT = 1
+
+
+class IndexEntry(NamedTuple):
+    """Where one SKILL_ID block sits, plus its header (as build_registry() reads it)."""
+    skill_id: str
+    path: str
+    frontmatter: str
+    file: str
+    offset: int
+    length: int
+
+
+def shard_file_name(prefix: str) -> str:
+    """Shard file for a skill ID prefix, e.g. 'skills-content-sec.md' for 'SEC'."""
+    return f"skills-content-{prefix.lower()}.md"
+
+
+def file_stamp(path: str) -> Tuple[int, int]:
+    """(size, mtime_ns) used to decide whether a file's index entries are current."""
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def load_shard_index(content_dir: str) -> Dict[str, Dict]:
+    """
+    Load the shard index of content_dir.
+
+    Returns: the "files" mapping, empty when the index is missing, unreadable
+    or in another format
+    """
+    try:
+        with open(os.path.join(content_dir, SHARD_INDEX_FILENAME), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('format') != SHARD_INDEX_FORMAT:
+        return {}
+    return data.get('files', {})
+
+
+def save_shard_index(content_dir: str, files: Dict[str, Dict]) -> None:
+    """Write the shard index atomically (raises OSError)."""
+    index_path = os.path.join(content_dir, SHARD_INDEX_FILENAME)
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'format': SHARD_INDEX_FORMAT, 'files': files}, f, separators=(',', ':'))
+        f.write('\n')
+    os.replace(tmp_path, index_path)
+
+
+def index_entries(files: Dict[str, Dict], names: Iterable[str]) -> Dict[str, IndexEntry]:
+    """
+    Merge the entries of the named files, in override order (later files win).
+
+    Returns: IndexEntry keyed by skill ID
+    """
+    merged = {}
+    for name in names:
+        for skill_id, (offset, length, path, frontmatter) in files[name]['skills'].items():
+            merged[skill_id] = IndexEntry(skill_id, path, frontmatter, name, offset, length)
+    return merged
+
+
+def read_ranges(path: str, ranges: List[Tuple[int, int]]) -> List[bytes]:
+    """
+    Read (offset, length) byte ranges from one file with a seek per range.
+
+    Ranges are read in file order; results are returned in the order given.
+    """
+    chunks = [b''] * len(ranges)
+    with open(path, 'rb') as f:
+        for i in sorted(range(len(ranges)), key=lambda i: ranges[i][0]):
+            offset, length = ranges[i]
+            f.seek(offset)
+            chunks[i] = f.read(length)
+    return chunks
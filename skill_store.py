@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Skill Store
+Parsed content libraries of many projects, held compactly in one process.
+
+For long-running services that keep several projects loaded at once.
+Skills are StoredSkill records with interned IDs, paths and owners, and
+identical block text is stored once across all projects, keyed by its hash
+and reference counted so that remove_project() frees text no project still
+uses. Projects with identical registries share one SkillRegistry.
+
+SKILL.md text is not kept: render() builds it on access from the shared
+block text, with the render functions the store was created with (those of
+populate-skills.py, so output matches the files it writes):
+
+    populate = ...  # populate-skills.py, imported with importlib
+    store = SkillStore(populate.render_skill_parts, populate.format_skill_file)
+    skills_content, registry = populate.load_content_library("content/")
+    store.add_project("studyabroad-v1", skills_content, registry)
+    store.render("studyabroad-v1", "SEC-001")
+
+The project-independent parts (frontmatter fields and body) of recently
+rendered skills are kept in a bounded LRU cache shared between projects.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from skill_registry import SkillRegistry, registry_to_json
+
+# (skill_id, block text, registry) -> (frontmatter fields, body)
+RenderParts = Callable[[str, str, SkillRegistry], Tuple[Dict[str, str], str]]
+# (fields, body, project, overrides) -> SKILL.md text
+FormatFile = Callable[[Dict[str, str], str, str, Optional[Dict[str, str]]], str]
+
+DEFAULT_RENDER_CACHE_SIZE = 1024
+
+
+def _block_digest(content: str) -> bytes:
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+
+class StoredSkill:
+    """One skill of a project held in a SkillStore."""
+    __slots__ = ('skill_id', 'path', 'owner', 'content')
+
+    def __init__(self, skill_id: str, path: str, owner: str, content: str):
+        self.skill_id = skill_id
+        self.path = path
+        self.owner = owner
+        self.content = content
+
+
+class SkillStore:
+    """Deduplicated skill blocks of many projects, rendered to SKILL.md on access."""
+
+    def __init__(self, render_parts: RenderParts, format_file: FormatFile,
+                 render_cache_size: int = DEFAULT_RENDER_CACHE_SIZE):
+        self._render_parts = render_parts
+        self._format_file = format_file
+        self._lock = threading.Lock()
+        # block digest -> [block text, projects using it]
+        self._blocks: Dict[bytes, list] = {}
+        # registry digest -> [registry, projects using it]
+        self._registries: Dict[str, list] = {}
+        # project -> (skills, registry digest, overrides)
+        self._projects: Dict[str, Tuple[Dict[str, StoredSkill], str, Optional[Dict[str, str]]]] = {}
+        # (skill_id, block text, registry digest) -> parts, least recently used first
+        self._parts: 'OrderedDict[tuple, Tuple[Dict[str, str], str]]' = OrderedDict()
+        self._render_cache_size = render_cache_size
+
+    def add_project(self, project: str, skills_content: Dict[str, str], registry: SkillRegistry,
+                    overrides: Optional[Dict[str, str]] = None) -> None:
+        """Add (or replace) a project from load_content_library() output."""
+        registry_key = hashlib.sha256(registry_to_json(registry).encode('utf-8')).hexdigest()
+        with self._lock:
+            self._release(project)
+            shared = self._registries.setdefault(registry_key, [registry, 0])
+            shared[1] += 1
+            registry = shared[0]
+
+            skills = {}
+            for skill_id, content in skills_content.items():
+                block = self._blocks.setdefault(_block_digest(content), [content, 0])
+                block[1] += 1
+                record = registry.get(skill_id)
+                skill_id = sys.intern(skill_id)
+                skills[skill_id] = StoredSkill(skill_id, sys.intern(record.path if record else ''),
+                                               sys.intern(registry.owner_of(skill_id)), block[0])
+            self._projects[sys.intern(project)] = (skills, registry_key, overrides)
+
+    def _release(self, project: str) -> None:
+        entry = self._projects.pop(project, None)
+        if entry is None:
+            return
+        skills, registry_key, _ = entry
+        for skill in skills.values():
+            digest = _block_digest(skill.content)
+            block = self._blocks[digest]
+            block[1] -= 1
+            if not block[1]:
+                del self._blocks[digest]
+        shared = self._registries[registry_key]
+        shared[1] -= 1
+        if not shared[1]:
+            del self._registries[registry_key]
+            self._parts = OrderedDict((key, parts) for key, parts in self._parts.items()
+                                      if key[2] != registry_key)
+
+    def remove_project(self, project: str) -> None:
+        with self._lock:
+            self._release(project)
+
+    def projects(self) -> List[str]:
+        return list(self._projects)
+
+    def registry(self, project: str) -> SkillRegistry:
+        return self._registries[self._projects[project][1]][0]
+
+    def skills(self, project: str) -> List[StoredSkill]:
+        """A project's skills, in content-library order."""
+        return list(self._projects[project][0].values())
+
+    def skills_content(self, project: str) -> Dict[str, str]:
+        """A project's blocks keyed by SKILL_ID, as populate_batch() takes them."""
+        return {skill_id: skill.content for skill_id, skill in self._projects[project][0].items()}
+
+    def render(self, project: str, skill_id: str) -> str:
+        """The SKILL.md text of one skill, as generate_skill_file_content() renders it."""
+        with self._lock:
+            skills, registry_key, overrides = self._projects[project]
+            registry = self._registries[registry_key][0]
+            skill = skills[skill_id]
+            # The block text is shared, so its hash is computed once and cached by str
+            key = (skill.skill_id, skill.content, registry_key)
+            parts = self._parts.get(key)
+            if parts is not None:
+                self._parts.move_to_end(key)
+        if parts is None:
+            # Rendered outside the lock; a concurrent render of the same key
+            # produces the same parts
+            parts = self._render_parts(skill.skill_id, skill.content, registry)
+            with self._lock:
+                self._parts[key] = parts
+                while len(self._parts) > self._render_cache_size:
+                    self._parts.popitem(last=False)
+        return self._format_file(parts[0], parts[1], project, overrides)
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of projects, skill records, unique blocks and their characters."""
+        with self._lock:
+            return {
+                'projects': len(self._projects),
+                'skills': sum(len(skills) for skills, _, _ in self._projects.values()),
+                'unique_blocks': len(self._blocks),
+                'block_chars': sum(len(block[0]) for block in self._blocks.values()),
+                'registries': len(self._registries),
+            }
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Skill Library Watcher
+Change notification for content library files, used by populate-skills.py --watch.
+
+Watches a single directory for files matching a predicate. On Linux the
+kernel's inotify API is used through ctypes (no third-party dependency);
+elsewhere, or when inotify is unavailable, the directory is polled for
+mtime/size changes. Editors often save with several writes or a
+write-then-rename, so changes are debounced into batches:
+
+    from skill_watch import DirectoryWatcher
+    with DirectoryWatcher("content", lambda name: name.endswith(".md")) as watcher:
+        for names in watcher.changes():
+            print("changed:", sorted(names))
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+
+# Quiet period that ends a burst of saves, in seconds
+DEFAULT_DEBOUNCE = 0.2
+
+# Poll interval when inotify is unavailable, in seconds
+DEFAULT_POLL_INTERVAL = 0.5
+
+# inotify event bits (linux/inotify.h)
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (_IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+               | _IN_CREATE | _IN_DELETE)
+_EVENT = struct.Struct("iIII")
+
+
+def _inotify_fd(directory: str) -> Optional[int]:
+    """Open an inotify descriptor watching directory, or None if unsupported."""
+    if not hasattr(os, 'uname') or os.uname().sysname != 'Linux':
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class DirectoryWatcher:
+    """
+    Reports names of changed files in one directory.
+
+    `matches` filters file names (not paths). backend is 'inotify' or 'poll'.
+    """
+
+    def __init__(self, directory: str, matches: Callable[[str], bool],
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, use_inotify: bool = True):
+        self.directory = directory
+        self.matches = matches
+        self.poll_interval = poll_interval
+        self._fd = _inotify_fd(directory) if use_inotify else None
+        self.backend = 'inotify' if self._fd is not None else 'poll'
+        self._snapshot = self._scan() if self._fd is None else {}
+
+    def __enter__(self) -> 'DirectoryWatcher':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if self.matches(entry.name) and entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, timeout: float) -> Set[str]:
+        """Names changed within the next `timeout` seconds (empty if none)."""
+        if self._fd is None:
+            return self._poll_stat(timeout)
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        names = set()
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            _, _, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            if name and self.matches(name):
+                names.add(name)
+        return names
+
+    def _poll_stat(self, timeout: float) -> Set[str]:
+        deadline = time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {name for name in snapshot.keys() | self._snapshot.keys()
+                       if snapshot.get(name) != self._snapshot.get(name)}
+            self._snapshot = snapshot
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.poll_interval, remaining))
+
+    def changes(self, debounce: float = DEFAULT_DEBOUNCE) -> Iterator[Set[str]]:
+        """
+        Yield batches of changed names forever.
+
+        A batch is emitted once no further change has been seen for
+        `debounce` seconds.
+        """
+        while True:
+            names = self.poll(self.poll_interval if self._fd is None else 3600.0)
+            if not names:
+                continue
+            while True:
+                more = self.poll(debounce)
+                if not more:
+                    break
+                names |= more
+            yield names
@@ -0,0 +1,50 @@
+"""Tests for sdlc_gates.py: check inputs and the gate result cache."""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from sdlc_gates import SOURCE_INPUTS, GateEngine, match_inputs  # noqa: E402
+
+TEST_COMMAND = f'"{sys.executable}" -m pytest -q -p no:cacheprovider tests'
+
+
+def make_project(root: Path) -> None:
+    (root / '.sdlc').mkdir()
+    (root / 'mypkg').mkdir()
+    (root / 'tests').mkdir()
+    (root / 'pyproject.toml').write_text('[project]\nname = "mypkg"\nversion = "0.1.0"\n')
+    (root / 'mypkg' / '__init__.py').write_text('def answer():\n    return 42\n')
+    (root / 'tests' / 'test_a.py').write_text(
+        'import sys, pathlib\n'
+        'sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))\n'
+        'from mypkg import answer\n\n\n'
+        'def test_answer():\n    assert answer() == 42\n')
+
+
+def run_tests_check(root: Path):
+    engine = GateEngine(str(root), jobs=1, test_command=TEST_COMMAND)
+    result = engine.run_checks(['all_tests_pass'])['all_tests_pass']
+    engine.save_cache()
+    return result
+
+
+def test_package_outside_src_is_a_test_input(tmp_path):
+    make_project(tmp_path)
+    first = run_tests_check(tmp_path)
+    assert first.passed and not first.cached, first.detail
+    assert run_tests_check(tmp_path).cached
+
+    (tmp_path / 'mypkg' / '__init__.py').write_text('def answer():\n    return None\n')
+    broken = run_tests_check(tmp_path)
+    assert not broken.cached
+    assert not broken.passed, broken.detail
+
+
+def test_source_inputs_leave_out_framework_state_and_test_output():
+    paths = ['mypkg/__init__.py', 'pyproject.toml', 'tests/test_a.py', 'README.md', 'Dockerfile',
+             '.sdlc/workflow-state.json', 'coverage.xml', 'htmlcov/index.html', '.coverage']
+    assert match_inputs(paths, SOURCE_INPUTS) == paths[:5]
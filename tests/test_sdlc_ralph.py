@@ -0,0 +1,38 @@
+"""Tests for sdlc_ralph.py: loop commands."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from sdlc_ralph import MAX_SILENT_FAILURES, Loop, Scheduler, check_command, render_command  # noqa: E402
+
+
+def test_only_known_placeholders_are_substituted():
+    command = 'run {agent} --phase={phase} "${HOME}" | awk \'{print $1}\' {other}'
+    assert (render_command(command, {'agent': 'developer', 'phase': 'testing'})
+            == 'run developer --phase=testing "${HOME}" | awk \'{print $1}\' {other}')
+
+
+def test_check_command(tmp_path):
+    assert check_command(str(tmp_path), 'cat {prompt_file} | wc -l') == []
+    assert check_command(str(tmp_path), '  ') == ['the command is empty']
+    assert check_command(str(tmp_path), 'echo "unterminated')[0].startswith('not valid shell')
+    assert check_command(str(tmp_path), 'no-such-ralph-agent {prompt_file}') == [
+        'command not found: no-such-ralph-agent']
+
+
+def test_silent_failures_fail_the_loop(tmp_path):
+    loop = Loop('testing', 'test_manager', 'TESTS_COMPLETE', 50, 5, [])
+    scheduler = Scheduler(str(tmp_path), [loop], command='exit 3')
+    result = asyncio.run(scheduler.run())[0]
+    assert (result.status, result.iterations) == ('failed', MAX_SILENT_FAILURES)
+
+    # Failing iterations that print something are ordinary unfinished work
+    loop = loop._replace(max_iterations=MAX_SILENT_FAILURES + 1)
+    scheduler = Scheduler(str(tmp_path), [loop], command='echo working; exit 3')
+    result = asyncio.run(scheduler.run())[0]
+    assert (result.status, result.iterations) == ('exhausted', MAX_SILENT_FAILURES + 1)
@@ -0,0 +1,55 @@
+"""Tests for sdlc_trace.py: incremental updates from git."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from sdlc_trace import TraceIndex  # noqa: E402
+
+
+def git(root: Path, *args: str) -> None:
+    subprocess.run(['git', '-C', str(root), '-c', 'user.name=test', '-c', 'user.email=test@example.com',
+                    *args], check=True, capture_output=True)
+
+
+def write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_project_in_a_subdirectory_of_a_git_repository(tmp_path):
+    project = tmp_path / 'services' / 'api'
+    write(tmp_path / 'other' / 'main.py', '# REQ-009\n')
+    write(project / '.specify' / 'spec.md', 'REQ-001 Users can log in\n')
+    write(project / 'src' / 'auth.py', '# REQ-001\n')
+    write(project / 'tests' / 'test_auth.py', '# REQ-001\n')
+    git(tmp_path, 'init', '-q')
+    git(tmp_path, 'add', '-A')
+    git(tmp_path, 'commit', '-q', '-m', 'initial')
+
+    index = TraceIndex(str(project))
+    index.update()
+    assert index.artifacts('REQ-001')['test'] == ['tests/test_auth.py']
+
+    # A committed change and an uncommitted one, both seen incrementally
+    write(project / 'src' / 'session.py', '# REQ-002\n')
+    git(tmp_path, 'add', '-A')
+    git(tmp_path, 'commit', '-q', '-m', 'add sessions')
+    write(project / 'src' / 'auth.py', '# REQ-001 REQ-003\n')
+    write(tmp_path / 'other' / 'main.py', '# REQ-004\n')
+    index.update()
+    assert index.artifacts('REQ-002')['code'] == ['src/session.py']
+    assert index.artifacts('REQ-003')['code'] == ['src/auth.py']
+    assert set(index.files) == {'.specify/spec.md', 'src/auth.py', 'src/session.py', 'tests/test_auth.py'}
+
+    result = subprocess.run([sys.executable, str(REPO_ROOT / 'sdlc_trace.py'), '--project', str(project),
+                             '--json', 'impact', '--git', 'HEAD~1'],
+                            check=True, capture_output=True, text=True)
+    impact = json.loads(result.stdout)
+    assert impact['requirements'] == ['REQ-001', 'REQ-002', 'REQ-003']
+    assert impact['must_run'] == ['tests/test_auth.py']